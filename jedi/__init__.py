@@ -29,8 +29,8 @@ load
 
 __version__ = '0.17.2'
 
-from jedi.api import Script, Interpreter, set_debug_function, \
-    preload_module, names
+from jedi.api import Script, Interpreter, InterpreterSession, \
+    set_debug_function, preload_module, names
 from jedi import settings
 from jedi.api.environment import find_virtualenvs, find_system_environments, \
     get_default_environment, InvalidPythonEnvironment, create_environment, \
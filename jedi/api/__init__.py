@@ -15,7 +15,7 @@ import parso
 from parso.python import tree
 
 from jedi._compatibility import cast_path
-from jedi.parser_utils import get_executable_nodes
+from jedi.parser_utils import get_executable_nodes, get_code_outline, get_parent_scope
 from jedi import debug
 from jedi import settings
 from jedi import cache
@@ -33,7 +33,8 @@ from jedi.api import refactoring
 from jedi.api.refactoring.extract import extract_function, extract_variable
 from jedi.inference import InferenceState
 from jedi.inference import imports
-from jedi.inference.references import find_references
+from jedi.inference.references import find_references, find_references_of_names
+from jedi.inference.call_hierarchy import find_incoming_calls, find_outgoing_calls
 from jedi.inference.arguments import try_iter_content
 from jedi.inference.helpers import infer_call_of_leaf
 from jedi.inference.sys_path import transform_path_to_dotted
@@ -135,14 +136,13 @@ class Script:
                 DeprecationWarning,
                 stacklevel=2
             )
-        if code is None:
-            # TODO add a better warning than the traceback!
-            with open(path, 'rb') as f:
-                code = f.read()
-
         if project is None:
             # Load the Python grammar of the current interpreter.
             project = get_default_project(None if self.path is None else self.path.parent)
+        if code is None:
+            # Unsaved buffers of the project are preferred over the file.
+            # TODO add a better warning than the traceback!
+            code = project.overlay.get_file_io(path).read()
         # TODO deprecate and remove sys_path from the Script API.
         if sys_path is not None:
             project._sys_path = sys_path
@@ -153,25 +153,63 @@ class Script:
                 stacklevel=2
             )
 
-        self._inference_state = InferenceState(
-            project, environment=environment, script_path=self.path
-        )
+        self._inference_state = self._create_inference_state(project, environment)
         debug.speed('init')
-        self._module_node, code = self._inference_state.parse_and_get_code(
-            code=code,
+        # We cannot just use parso, because it doesn't use errors='replace'.
+        self._code = parso.python_bytes_to_unicode(code, encoding='utf-8', errors='replace')
+        self._code_lines = parso.split_lines(self._code, keepends=True)
+        self._scope_line = None
+        self._parsed_module_node = None
+        if len(self._code) <= settings._outline_file_size:
+            self._parse()
+        self._pos = line, column
+
+        cache.clear_time_caches()
+        debug.reset_time()
+
+    def _create_inference_state(self, project, environment):
+        return InferenceState(project, environment=environment, script_path=self.path)
+
+    @property
+    def _module_node(self):
+        if self._parsed_module_node is None:
+            # Very long code is parsed once the position is known, see
+            # _set_scope.
+            self._parse()
+        return self._parsed_module_node
+
+    def _parse(self):
+        self._parsed_module_node = self._inference_state.parse(
+            code=self._code,
             path=self.path,
-            use_latest_grammar=path and path.suffix == 'pyi',
+            use_latest_grammar=self.path and self.path.suffix == 'pyi',
             cache=False,  # No disk cache, because the current script often changes.
             diff_cache=settings.fast_parser,
             cache_path=settings.cache_directory,
+            scope_line=self._scope_line,
         )
         debug.speed('parsed')
-        self._code_lines = parso.split_lines(code, keepends=True)
-        self._code = code
-        self._pos = line, column
 
-        cache.clear_time_caches()
-        debug.reset_time()
+    def _set_scope(self, line):
+        """
+        Very long code is parsed as an outline (see
+        :class:`jedi.parser_utils.CodeOutline`). If the top-level statement of
+        a position is not complete in the outline, the code is parsed again
+        with that statement.
+        """
+        if len(self._code) <= settings._outline_file_size:
+            return
+        if self._parsed_module_node is None:
+            self._scope_line = line
+            return
+        outline = get_code_outline(self._code)
+        if outline.is_outlined(line, keep_line=self._scope_line):
+            self._scope_line = line
+            self._parse()
+            # The cached module belongs to the old syntax tree. The new one
+            # also replaces it in the module cache of the inference state.
+            cache.clear_memoize_method_cache(self)
+            self._get_module()
 
     # Cache the module, this is mostly useful for testing, since this shouldn't
     # be called multiple times.
@@ -484,6 +522,90 @@ class Script:
             return helpers.sorted_definitions(definitions)
         return _references(**kwargs)
 
+    def get_reference_counts(self, *, scope='project'):
+        """
+        Counts the references of all functions, classes and variables that are
+        defined on the module level or in classes of the module (e.g. for code
+        lenses). This is a lot faster than calling :meth:`.get_references` for
+        every definition, because files are only scanned once for all names and
+        every possible reference is only inferred once.
+
+        :param scope: Default ``'project'``. If ``'file'``, count references in
+            the current module only.
+        :rtype: list of :class:`.ReferenceCount`
+        """
+        if scope not in ('project', 'file'):
+            raise ValueError('Only the scopes "file" and "project" are allowed')
+        tree_names = [
+            name for name in helpers.get_module_names(self._module_node, all_scopes=True)
+            if _is_module_or_class_level(name)
+            and name.get_definition(import_name_always=True).type
+            not in ('import_name', 'import_from')
+        ]
+        tree_names.sort(key=lambda name: name.start_pos)
+        module_context = self._get_module_context()
+        references = find_references_of_names(module_context, tree_names, scope == 'file')
+        return [
+            classes.ReferenceCount(
+                self._inference_state,
+                classes.Name(self._inference_state, module_context.create_name(tree_name)),
+                names,
+            )
+            for tree_name, names in zip(tree_names, references)
+        ]
+
+    @validate_line_column
+    def get_incoming_calls(self, line=None, column=None):
+        """
+        Lists the functions, classes and modules that call the function (or
+        class) under the cursor. Only files that contain calls of its name are
+        parsed, see :mod:`jedi.inference.call_sites`.
+
+        :rtype: list of :class:`.CallHierarchyItem`
+        """
+        tree_name = self._module_node.get_name_of_position((line, column))
+        if tree_name is None:
+            return []
+        calls = find_incoming_calls(self._get_module_context(), tree_name)
+        return self._to_call_hierarchy_items(calls)
+
+    @validate_line_column
+    def get_outgoing_calls(self, line=None, column=None):
+        """
+        Lists the functions and classes that are called by the function (or in
+        the body of the class) under the cursor.
+
+        :rtype: list of :class:`.CallHierarchyItem`
+        """
+        tree_name = self._module_node.get_name_of_position((line, column))
+        if tree_name is None:
+            return []
+        names = self._get_module_context().create_name(tree_name).goto()
+        names = convert_names(helpers.filter_follow_imports(names))
+        calls = []
+        nodes = set()
+        for name in names:
+            if name.tree_name is None:
+                continue
+            node = name.tree_name.parent
+            if node.type in ('funcdef', 'classdef') and node.name == name.tree_name \
+                    and node not in nodes:
+                nodes.add(node)
+                calls += find_outgoing_calls(name.get_root_context(), node)
+        return self._to_call_hierarchy_items(calls)
+
+    def _to_call_hierarchy_items(self, calls):
+        items = [
+            classes.CallHierarchyItem(self._inference_state, name, call_names)
+            for name, call_names in calls
+        ]
+        return sorted(items, key=lambda item: (
+            str(item.name.module_path or ''),
+            item.name.line or 0,
+            item.name.column or 0,
+            item.name.name,
+        ))
+
     def call_signatures(self):
         warnings.warn(
             "Deprecated since version 0.16.0. Use Script(...).get_signatures instead.",
@@ -760,6 +882,15 @@ class Script:
         return refactoring.inline(self._inference_state, names)
 
 
+def _is_module_or_class_level(name):
+    scope = get_parent_scope(name)
+    while scope is not None and scope.type != 'file_input':
+        if scope.type != 'classdef':
+            return False
+        scope = get_parent_scope(scope)
+    return True
+
+
 class Interpreter(Script):
     """
     Jedi's API for Python REPLs.
@@ -782,26 +913,42 @@ class Interpreter(Script):
     :type namespaces: typing.List[dict]
     :param namespaces: A list of namespace dictionaries such as the one
         returned by :func:`globals` and :func:`locals`.
+    :param InterpreterSession session: Reuses the results of earlier
+        interpreters of the session. The environment of the session is used.
     """
     _allow_descriptor_getattr_default = True
 
-    def __init__(self, code, namespaces, **kwds):
+    def __init__(self, code, namespaces, session=None, **kwds):
         try:
             namespaces = [dict(n) for n in namespaces]
         except Exception:
             raise TypeError("namespaces must be a non-empty list of dicts.")
 
-        environment = kwds.get('environment', None)
-        if environment is None:
+        environment = kwds.pop('environment', None)
+        if session is not None:
+            if environment is not None:
+                raise TypeError("The environment of a session cannot be changed.")
+            environment = session._state.inference_state.environment
+        elif environment is None:
             environment = InterpreterEnvironment()
         else:
             if not isinstance(environment, InterpreterEnvironment):
                 raise TypeError("The environment needs to be an InterpreterEnvironment subclass.")
 
+        self._session = session
         super().__init__(code, environment=environment,
                          project=Project(Path.cwd()), **kwds)
         self.namespaces = namespaces
         self._inference_state.allow_descriptor_getattr = self._allow_descriptor_getattr_default
+        if session is None:
+            self._namespace_objects = None
+        else:
+            self._namespace_objects = session._state.update(namespaces, self._module_node)
+
+    def _create_inference_state(self, project, environment):
+        if self._session is None:
+            return super()._create_inference_state(project, environment)
+        return self._session._state.inference_state
 
     @cache.memoize_method
     def _get_module_context(self):
@@ -814,9 +961,41 @@ class Interpreter(Script):
         return interpreter.MixedModuleContext(
             tree_module_value,
             self.namespaces,
+            self._namespace_objects,
         )
 
 
+class InterpreterSession:
+    """
+    Keeps the state of :class:`.Interpreter` objects between calls. REPLs
+    usually create a new :class:`.Interpreter` for every completion. Without
+    a session, the modules of all the objects in the namespaces are inferred
+    again every time.
+
+    >>> from os.path import join
+    >>> session = InterpreterSession()
+    >>> script = Interpreter('join("").up', [locals()], session=session)
+    >>> print(script.complete()[0].name)
+    upper
+
+    Inferred results are kept as long as the objects in the namespaces stay
+    the same. Results of the entries that were replaced or removed are thrown
+    away. The interpreters of a session have to be used one after another:
+    Creating a new one invalidates the results of older ones.
+
+    :param Environment environment: An :class:`.InterpreterEnvironment`.
+    :param Project project: Defaults to a project in the current directory.
+    """
+    def __init__(self, environment=None, project=None):
+        if environment is None:
+            environment = InterpreterEnvironment()
+        elif not isinstance(environment, InterpreterEnvironment):
+            raise TypeError("The environment needs to be an InterpreterEnvironment subclass.")
+        if project is None:
+            project = Project(Path.cwd())
+        self._state = interpreter.SessionState(InferenceState(project, environment=environment))
+
+
 def names(source=None, path=None, all_scopes=False,
           definitions=True, references=False, environment=None):
     warnings.warn(
@@ -7,6 +7,8 @@ There are a couple of classes documented in here:
 - :class:`.BaseSignature` as a base class for signatures
 - :class:`.Signature` for :meth:`.Script.get_signatures` only
 - :class:`.ParamName` used for parameters of signatures
+- :class:`.ReferenceCount` for :meth:`.Script.get_reference_counts` only
+- :class:`.CallHierarchyItem` for call hierarchies
 - :class:`.Refactoring` for refactorings
 - :class:`.SyntaxError` for :meth:`.Script.get_syntax_errors` only
 
@@ -31,7 +33,7 @@ from jedi.inference.gradual.conversion import convert_names, convert_values
 from jedi.inference.base_value import ValueSet
 from jedi.api.keywords import KeywordName
 from jedi.api import completion_cache
-from jedi.api.helpers import filter_follow_imports
+from jedi.api.helpers import filter_follow_imports, sorted_definitions
 
 
 def _sort_names_by_start_pos(names):
@@ -58,6 +60,8 @@ class BaseName:
     """
     The base class for all definitions, completions and signatures.
     """
+    __slots__ = ('_inference_state', '_name', 'is_keyword', '_memoize_method_dct')
+
     _mapping = {
         'posixpath': 'os.path',
         'riscospath': 'os.path',
@@ -634,6 +638,9 @@ class Completion(BaseName):
     ``Completion`` objects are returned from :meth:`.Script.complete`. They
     provide additional information about a completion.
     """
+    __slots__ = ('_like_name_length', '_stack', '_is_fuzzy', '_cached_name',
+                 '_same_name_completions')
+
     def __init__(self, inference_state, name, stack, like_name_length,
                  is_fuzzy, cached_name=None):
         super().__init__(inference_state, name)
@@ -758,6 +765,8 @@ class Name(BaseName):
     *Name* objects are returned from many different APIs including
     :meth:`.Script.goto` or :meth:`.Script.infer`.
     """
+    __slots__ = ()
+
     def __init__(self, inference_state, definition):
         super().__init__(inference_state, definition)
 
@@ -811,6 +820,8 @@ class BaseSignature(Name):
     These signatures are returned by :meth:`BaseName.get_signatures`
     calls.
     """
+    __slots__ = ('_signature',)
+
     def __init__(self, inference_state, signature):
         super().__init__(inference_state, signature.name)
         self._signature = signature
@@ -841,6 +852,8 @@ class Signature(BaseSignature):
     A full signature object is the return value of
     :meth:`.Script.get_signatures`.
     """
+    __slots__ = ('_call_details',)
+
     def __init__(self, inference_state, signature, call_details):
         super().__init__(inference_state, signature)
         self._call_details = call_details
@@ -877,6 +890,8 @@ class Signature(BaseSignature):
 
 
 class ParamName(Name):
+    __slots__ = ()
+
     def infer_default(self):
         """
         Returns default values like the ``1`` of ``def foo(x=1):``.
@@ -910,3 +925,64 @@ class ParamName(Name):
         :rtype: :py:attr:`inspect.Parameter.kind`
         """
         return self._name.get_kind()
+
+
+class ReferenceCount:
+    """
+    The references of a definition, returned by
+    :meth:`.Script.get_reference_counts`.
+    """
+    def __init__(self, inference_state, definition, reference_names):
+        self._inference_state = inference_state
+        self._reference_names = reference_names
+        self.definition = definition
+        """The :class:`Name` of the definition."""
+
+    @property
+    def count(self):
+        """
+        The number of references, like ``len(script.get_references(...))``.
+        This includes the definition itself.
+
+        :rtype: int
+        """
+        return len(self._reference_names)
+
+    def get_references(self):
+        """
+        Returns the same names as :meth:`.Script.get_references` for the
+        definition.
+
+        :rtype: list of :class:`Name`
+        """
+        return sorted_definitions(
+            Name(self._inference_state, n) for n in self._reference_names
+        )
+
+    def __repr__(self):
+        return '<%s: %s (%s)>' % (type(self).__name__, self.definition.name, self.count)
+
+
+class CallHierarchyItem:
+    """
+    A caller or a callee of a function, returned by
+    :meth:`.Script.get_incoming_calls` and :meth:`.Script.get_outgoing_calls`.
+    """
+    def __init__(self, inference_state, name, call_names):
+        self.name = Name(inference_state, name)
+        """The :class:`Name` of the function, class or module."""
+        self._call_names = call_names
+
+    @property
+    def positions(self):
+        """
+        The positions ``(line, column)`` of the called names. For incoming
+        calls they are in the module of :attr:`name`, for outgoing calls in
+        the module of the function that was asked for.
+
+        :rtype: list of tuple
+        """
+        return sorted(n.start_pos for n in self._call_names)
+
+    def __repr__(self):
+        return '<%s: %s %s>' % (type(self).__name__, self.name.name, self.positions)
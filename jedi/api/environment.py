@@ -7,11 +7,14 @@ import sys
 import hashlib
 import filecmp
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from shutil import which
 
-from jedi.cache import memoize_method, time_cache
+from jedi.cache import memoize_method, time_cache, get_path_stats, \
+    load_persistent_cache, save_persistent_cache
 from jedi.inference.compiled.subprocess import CompiledSubprocess, \
     InferenceStateSameProcess, InferenceStateSubprocess
+from jedi.api.exceptions import InternalError
 
 import parso
 
@@ -21,6 +24,9 @@ _SUPPORTED_PYTHONS = ['3.9', '3.8', '3.7', '3.6']
 _SAFE_PATHS = ['/usr/bin', '/usr/local/bin']
 _CONDA_VAR = 'CONDA_PREFIX'
 _CURRENT_VERSION = '%s.%s' % (sys.version_info.major, sys.version_info.minor)
+_REGISTRY_NAMESPACE = 'environments'
+_SHA256_NAMESPACE = 'executable_sha256'
+_MAX_PROBING_THREADS = 8
 
 
 class InvalidPythonEnvironment(Exception):
@@ -41,9 +47,59 @@ class _BaseEnvironment:
         try:
             return self._hash
         except AttributeError:
-            self._hash = _calculate_sha256_for_file(self.executable)
+            self._hash = _get_sha256_for_file(self.executable)
             return self._hash
 
+    def _get_registry_key(self):
+        """
+        Information about an environment is stored in a registry in the cache
+        directory. It is only valid as long as the executable (the binary a
+        link points to and the ``pyvenv.cfg`` of a venv) doesn't change.
+        Returns None if the executable doesn't exist.
+        """
+        executable = self._start_executable
+        real_path = os.path.realpath(executable)
+        venv_config = os.path.join(os.path.dirname(os.path.dirname(executable)), 'pyvenv.cfg')
+        stats = tuple(get_path_stats([real_path, venv_config]))
+        if stats[0] is None:
+            return None
+        if self._env_vars is None:
+            # The environment variables of this process are inherited.
+            env_vars = tuple(os.environ.get(name) for name in ('PYTHONPATH', 'PYTHONHOME'))
+        else:
+            env_vars = tuple(sorted(self._env_vars.items()))
+        return executable, real_path, stats, env_vars
+
+    def _load_registry_entry(self):
+        """
+        Returns the registry entry of the environment. Entries are only used
+        if the executable still has the same hash and the executable and the
+        prefix it reported still exist.
+        """
+        key = self._get_registry_key()
+        if key is None:
+            return {}
+        entry = load_persistent_cache(_REGISTRY_NAMESPACE, key, default={})
+        info = entry.get('info')
+        if info is not None and (
+                entry.get('sha256') != _get_sha256_for_file(self._start_executable)
+                or not os.path.exists(info[0]) or not os.path.isdir(info[1])):
+            return {}
+        return entry
+
+    def _forget_registry_entry(self):
+        key = self._get_registry_key()
+        if key is not None:
+            save_persistent_cache(_REGISTRY_NAMESPACE, key, {})
+
+    def _update_registry_entry(self, **kwargs):
+        key = self._get_registry_key()
+        if key is None:
+            return
+        entry = load_persistent_cache(_REGISTRY_NAMESPACE, key, default={})
+        entry.update(kwargs)
+        save_persistent_cache(_REGISTRY_NAMESPACE, key, entry)
+
 
 def _get_info():
     return (
@@ -64,23 +120,49 @@ class Environment(_BaseEnvironment):
     def __init__(self, executable, env_vars=None):
         self._start_executable = executable
         self._env_vars = env_vars
-        # Initialize the environment
-        self._get_subprocess()
+        info = self._load_registry_entry().get('info')
+        if info is None:
+            # Initialize the environment
+            self._get_subprocess()
+        else:
+            # The environment was already checked by another process, the
+            # subprocess is only started once it's needed.
+            self._set_info(info)
 
     def _get_subprocess(self):
         if self._subprocess is not None and not self._subprocess.is_crashed:
             return self._subprocess
 
+        restarts = 0
+        if self._subprocess is not None:
+            delay = self._subprocess.get_restart_delay()
+            if delay > 0:
+                raise InternalError(
+                    "The subprocess %s crashed repeatedly, it is restarted in %.1fs."
+                    % (self._start_executable, delay))
+            restarts = self._subprocess.get_successor_restarts()
+
         try:
             self._subprocess = CompiledSubprocess(self._start_executable,
-                                                  env_vars=self._env_vars)
+                                                  env_vars=self._env_vars,
+                                                  restarts=restarts)
             info = self._subprocess._send(None, _get_info)
         except Exception as exc:
+            # The registered environment doesn't work (anymore).
+            self._forget_registry_entry()
             raise InvalidPythonEnvironment(
                 "Could not get version information for %r: %r" % (
                     self._start_executable,
                     exc))
 
+        self._set_info(info)
+        self._update_registry_entry(
+            info=info,
+            sha256=_get_sha256_for_file(self._start_executable),
+        )
+        return self._subprocess
+
+    def _set_info(self, info):
         # Since it could change and might not be the same(?) as the one given,
         # set it here.
         self.executable = info[0]
@@ -96,7 +178,6 @@ class Environment(_BaseEnvironment):
         Like :data:`sys.version_info`: a tuple to show the current
         Environment's Python version.
         """
-        return self._subprocess
 
     def __repr__(self):
         version = '.'.join(str(i) for i in self.version_info)
@@ -118,7 +199,17 @@ class Environment(_BaseEnvironment):
         # on how the Python version was compiled (ENV variables).
         # If you omit -S when starting Python (normal case), additionally
         # site.py gets executed.
-        return self._get_subprocess().get_sys_path()
+        # The sys path is therefore stored in the registry. It changes if
+        # packages (and their .pth files) are added to its directories.
+        registered = self._load_registry_entry().get('sys_path')
+        if registered is not None:
+            stats, sys_path = registered
+            if get_path_stats(sys_path) == stats:
+                return sys_path
+
+        sys_path = self._get_subprocess().get_sys_path()
+        self._update_registry_entry(sys_path=(get_path_stats(sys_path), sys_path))
+        return sys_path
 
 
 class _SameEnvironmentMixin:
@@ -170,6 +261,52 @@ def _calculate_sha256_for_file(path):
     return sha256.hexdigest()
 
 
+def _get_sha256_for_file(path):
+    """
+    Like :func:`_calculate_sha256_for_file`, but the hashes of Python binaries
+    are stored in the cache directory, because hashing them is slow.
+    """
+    real_path = os.path.realpath(path)
+    key = real_path, tuple(get_path_stats([real_path]))
+    sha256 = load_persistent_cache(_SHA256_NAMESPACE, key)
+    if sha256 is None:
+        sha256 = _calculate_sha256_for_file(real_path)
+        save_persistent_cache(_SHA256_NAMESPACE, key, sha256)
+    return sha256
+
+
+def _iter_in_parallel(function, arguments):
+    """
+    Environments are probed by executing Python, which is slow. This does it
+    in multiple threads and yields the results (or InvalidPythonEnvironment
+    exceptions) in the order of the arguments, each as soon as it and the
+    ones before it are available. Arguments are only consumed once a thread
+    is free.
+    """
+    def call(argument):
+        try:
+            return function(argument)
+        except InvalidPythonEnvironment as e:
+            return e
+
+    arguments = iter(arguments)
+    pending = []
+    with ThreadPoolExecutor(_MAX_PROBING_THREADS) as executor:
+        try:
+            while True:
+                for argument in arguments:
+                    pending.append(executor.submit(call, argument))
+                    if len(pending) >= _MAX_PROBING_THREADS:
+                        break
+                if not pending:
+                    return
+                yield pending.pop(0).result()
+        finally:
+            # Don't start probes whose results are not needed anymore.
+            for future in pending:
+                future.cancel()
+
+
 def get_default_environment():
     """
     Tries to return an active Virtualenv or conda environment.
@@ -292,23 +429,29 @@ def find_virtualenvs(paths=None, *, safe=True, use_environment_vars=True):
             yield conda_env
             _used_paths.add(conda_env.path)
 
-    for directory in paths:
-        if not os.path.isdir(directory):
-            continue
-
-        directory = os.path.abspath(directory)
-        for path in os.listdir(directory):
-            path = os.path.join(directory, path)
-            if path in _used_paths:
-                # A path shouldn't be inferred twice.
+    def iter_executables():
+        for directory in paths:
+            if not os.path.isdir(directory):
                 continue
-            _used_paths.add(path)
 
-            try:
-                executable = _get_executable_path(path, safe=safe)
-                yield Environment(executable)
-            except InvalidPythonEnvironment:
-                pass
+            directory = os.path.abspath(directory)
+            for path in os.listdir(directory):
+                path = os.path.join(directory, path)
+                if path in _used_paths:
+                    # A path shouldn't be inferred twice.
+                    continue
+                _used_paths.add(path)
+
+                try:
+                    yield _get_executable_path(path, safe=safe)
+                except InvalidPythonEnvironment:
+                    pass
+
+    # The environments are probed in parallel, but yielded in the order of
+    # the directory listing.
+    for environment in _iter_in_parallel(Environment, iter_executables()):
+        if not isinstance(environment, InvalidPythonEnvironment):
+            yield environment
 
 
 def find_system_environments(*, env_vars=None):
@@ -321,11 +464,13 @@ def find_system_environments(*, env_vars=None):
 
     :yields: :class:`.Environment`
     """
-    for version_string in _SUPPORTED_PYTHONS:
-        try:
-            yield get_system_environment(version_string, env_vars=env_vars)
-        except InvalidPythonEnvironment:
-            pass
+    environments = _iter_in_parallel(
+        lambda version_string: get_system_environment(version_string, env_vars=env_vars),
+        _SUPPORTED_PYTHONS,
+    )
+    for environment in environments:
+        if not isinstance(environment, InvalidPythonEnvironment):
+            yield environment
 
 
 # TODO: this function should probably return a list of environments since
@@ -436,7 +581,7 @@ def _is_safe(executable_path):
         # virtualenv's Python is not (which is probably never going to get
         # upgraded), it will not work with Jedi. IMO that's fine, because
         # people should just be using venv. ~ dave
-        if environment._sha256 == _calculate_sha256_for_file(real_path):
+        if environment._sha256 == _get_sha256_for_file(real_path):
             return True
     return False
 
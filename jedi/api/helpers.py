@@ -485,6 +485,7 @@ def validate_line_column(func):
             raise ValueError('`column` parameter (%d) is not in a valid range '
                              '(0-%d) for line %d (%r).' % (
                                  column, line_len, line, line_string))
+        self._set_scope(line)
         return func(self, line, column, *args, **kwargs)
     return wrapper
 
@@ -2,13 +2,23 @@
 TODO Some parts of this module are still not well documented.
 """
 
+import inspect
+import sys
+from itertools import islice
+from types import MappingProxyType
+
+from parso.tree import NodeOrLeaf
+
+from jedi.cache import clear_memoize_method_cache
+
 from jedi.inference import compiled
-from jedi.inference.base_value import ValueSet
+from jedi.inference.base_value import Value, ValueSet, ValueWrapper
 from jedi.inference.filters import ParserTreeFilter, MergedFilter
 from jedi.inference.names import TreeNameDefinition
 from jedi.inference.compiled import mixed
 from jedi.inference.compiled.access import create_access_path
-from jedi.inference.context import ModuleContext
+from jedi.inference.compiled.subprocess import AccessHandle
+from jedi.inference.context import AbstractContext, ModuleContext
 
 
 def _create(inference_state, obj):
@@ -46,12 +56,13 @@ class MixedParserTreeFilter(ParserTreeFilter):
 
 
 class MixedModuleContext(ModuleContext):
-    def __init__(self, tree_module_value, namespaces):
+    def __init__(self, tree_module_value, namespaces, namespace_objects=None):
         super().__init__(tree_module_value)
+        if namespace_objects is None:
+            namespace_objects = [NamespaceObject(n) for n in namespaces]
         self.mixed_values = [
-            self._get_mixed_object(
-                _create(self.inference_state, NamespaceObject(n))
-            ) for n in namespaces
+            self._get_mixed_object(_create(self.inference_state, o))
+            for o in namespace_objects
         ]
 
     def _get_mixed_object(self, compiled_value):
@@ -72,3 +83,196 @@ class MixedModuleContext(ModuleContext):
 
         for mixed_object in self.mixed_values:
             yield from mixed_object.get_filters(until_position, origin_scope)
+
+
+_MAX_FINGERPRINT_ITEMS = 50
+
+
+def _get_fingerprint(obj):
+    """
+    A cheap approximation of the state of an object: The identities of its
+    attributes and its first items. Returns None if the state is unknown, e.g.
+    for objects with ``__getattr__``.
+    """
+    cls = type(obj)
+    if getattr(cls, '__getattr__', None) is not None:
+        return None
+    try:
+        dct = object.__getattribute__(obj, '__dict__')
+    except Exception:
+        dct = None
+    attributes = None
+    if isinstance(dct, (dict, MappingProxyType)):
+        attributes = tuple(dct), tuple(map(id, dct.values()))
+
+    items = None
+    if cls in (list, tuple):
+        items = len(obj), tuple(map(id, obj[:_MAX_FINGERPRINT_ITEMS]))
+    elif cls is dict:
+        items = len(obj), tuple(
+            (id(k), id(v)) for k, v in islice(obj.items(), _MAX_FINGERPRINT_ITEMS)
+        )
+    elif cls in (set, frozenset):
+        items = len(obj)
+    try:
+        return hash((cls, attributes, items))
+    except TypeError:
+        return None
+
+
+def _is_stable(obj):
+    """
+    Modules and the classes of modules are usually not replaced, the objects
+    reached through them are kept as long as they don't change.
+    """
+    if inspect.ismodule(obj):
+        return True
+    if inspect.isclass(obj):
+        module_name = getattr(obj, '__module__', None)
+        return module_name != '__main__' and module_name in sys.modules
+    return False
+
+
+class SessionState:
+    """
+    The part of ``jedi.InterpreterSession`` that is kept between calls: The
+    inference state and the wrappers of the namespaces.
+
+    Access handles keep their objects alive. Every handle remembers the handle
+    of the object it was reached through (e.g. ``df`` for ``df.col``) and a
+    fingerprint of its object. Before a call, the handles of objects that
+    changed, were removed from the namespaces or can only be reached through
+    such objects are released, together with the handles they were reached
+    through. Modules and their classes are kept, their cached results are
+    thrown away if they change. The results that refer to released handles or
+    to the code of older calls (all code is the ``__main__`` module) are
+    removed every few calls.
+    """
+    _PURGE_INTERVAL = 20
+    _MAX_RELEASED_HANDLES = 200
+
+    def __init__(self, inference_state):
+        self.inference_state = inference_state
+        self._namespace_objects = []
+        self._old_module_nodes = set()
+        self._calls_since_purge = 0
+        # Dict[int, Tuple[AccessHandle, Optional[AccessHandle], Optional[int], bool]]
+        # in the order of creation, i.e. the handles that objects were reached
+        # through come first.
+        self._handle_infos = {}
+        self._released_handles = set()
+        inference_state.compiled_subprocess.handle_created_callback = self._add_handle
+
+    def _add_handle(self, handle, parent):
+        obj = handle.access._obj
+        self._handle_infos.pop(handle.id, None)
+        self._handle_infos[handle.id] = handle, parent, _get_fingerprint(obj), _is_stable(obj)
+
+    def update(self, namespaces, module_node):
+        """
+        Prepares the inference state for a new call and returns the namespace
+        objects for it.
+        """
+        inference_state = self.inference_state
+        inference_state.reset_recursion_limitations()
+        inference_state.inferred_element_counts = {}
+        inference_state.analysis = []
+        inference_state.class_tables.clear()
+
+        del self._namespace_objects[len(namespaces):]
+        for i, namespace in enumerate(namespaces):
+            if i < len(self._namespace_objects):
+                self._namespace_objects[i].__dict__ = namespace
+            else:
+                self._namespace_objects.append(NamespaceObject(namespace))
+
+        refreshed_handles = self._release_changed_handles(namespaces)
+
+        self._calls_since_purge += 1
+        if refreshed_handles or len(self._released_handles) >= self._MAX_RELEASED_HANDLES \
+                or self._calls_since_purge >= self._PURGE_INTERVAL:
+            self._purge(self._released_handles | refreshed_handles)
+        self._old_module_nodes.add(module_node)
+        return list(self._namespace_objects)
+
+    def _release_changed_handles(self, namespaces):
+        """
+        Returns the handles of stable objects whose results need to be thrown
+        away.
+        """
+        namespace_ids = set(id(value) for n in namespaces for value in n.values())
+        infos = self._handle_infos
+        changed = set()
+        refreshed = set()
+        for handle, parent, fingerprint, is_stable in list(infos.values()):
+            obj = handle.access._obj
+            if isinstance(obj, NamespaceObject):
+                # The namespaces are different for every call.
+                handle.__dict__.pop('_memoize_method_dct', None)
+                continue
+            if fingerprint is None or _get_fingerprint(obj) != fingerprint:
+                is_changed = True
+            elif is_stable:
+                continue
+            elif parent is None:
+                # E.g. simple objects that were created for a call.
+                is_changed = True
+            elif isinstance(parent.access._obj, NamespaceObject):
+                is_changed = id(obj) not in namespace_ids
+            else:
+                is_changed = False
+
+            # The objects that this object was reached through cache it.
+            while is_changed and handle is not None and handle not in changed:
+                info = infos.get(handle.id)
+                if info is None or info[0] is not handle \
+                        or isinstance(handle.access._obj, NamespaceObject):
+                    break
+                if info[3]:
+                    refreshed.add(handle)
+                    handle.__dict__.pop('_memoize_method_dct', None)
+                    self._add_handle(handle, info[1])
+                    break
+                changed.add(handle)
+                handle = info[1]
+
+        handles = self.inference_state.compiled_subprocess._handles
+        released = set()
+        for id_, (handle, parent, fingerprint, is_stable) in list(infos.items()):
+            if handle in changed or parent in released:
+                released.add(handle)
+                del infos[id_]
+                if handles.get(id_) is handle:
+                    del handles[id_]
+        self._released_handles |= released
+        return refreshed
+
+    def _purge(self, stale_handles):
+        def is_stale(obj):
+            # Only objects that can be checked without inferring anything.
+            if isinstance(obj, AccessHandle):
+                return obj in stale_handles
+            if isinstance(obj, NodeOrLeaf):
+                return obj.get_root_node() in self._old_module_nodes
+            if isinstance(obj, (Value, ValueWrapper, AbstractContext)):
+                if getattr(obj, 'access_handle', None) in stale_handles:
+                    clear_memoize_method_cache(obj)
+                    return True
+                root_context = obj.get_root_context()
+                return getattr(root_context, 'tree_node', None) in self._old_module_nodes
+            return False
+
+        for memo in self.inference_state.memoize_cache.values():
+            stale_keys = [
+                key for key in memo
+                if is_stale(key[0]) or any(is_stale(arg) for arg in key[1])
+                or any(is_stale(value) for name, value in key[2])
+            ]
+            for key in stale_keys:
+                del memo[key]
+        for compiled_value in list(self.inference_state.mixed_cache):
+            if compiled_value.access_handle in stale_handles:
+                del self.inference_state.mixed_cache[compiled_value]
+        self._released_handles.clear()
+        self._old_module_nodes.clear()
+        self._calls_since_purge = 0
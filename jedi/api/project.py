@@ -10,8 +10,11 @@ be used across repositories.
 import json
 from pathlib import Path
 from itertools import chain
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
 
 from jedi import debug
+from jedi.cache import get_path_stats, is_recently_modified
 from jedi.api.environment import get_cached_default_environment, create_environment
 from jedi.api.exceptions import WrongVersion
 from jedi.api.completion import search_in_module
@@ -21,7 +24,7 @@ from jedi.inference.imports import load_module_from_path, \
 from jedi.inference.sys_path import discover_buildout_paths
 from jedi.inference.cache import inference_state_as_method_param_cache
 from jedi.inference.references import recurse_find_python_folders_and_files, search_in_file_ios
-from jedi.file_io import FolderIO
+from jedi.file_io import FolderIO, FileOverlay
 
 _CONFIG_FOLDER = '.jedi'
 _CONTAINS_POTENTIAL_PROJECT = \
@@ -29,6 +32,21 @@ _CONTAINS_POTENTIAL_PROJECT = \
 
 _SERIALIZER_VERSION = 1
 
+_default_project_cache: Dict[
+    Path, Tuple[List[str], List[Optional[Tuple[int, int]]], Callable[[], 'Project']]
+] = {}
+"""
+Maps paths to the paths that were probed to find their default project, the
+stats of these paths and a function that creates the project.
+"""
+_parent_paths_cache: Dict[
+    Tuple[Path, Path, bool], Tuple[List[str], List[Optional[Tuple[int, int]]], Tuple[str, ...]]
+] = {}
+"""
+Maps the arguments of :func:`_get_parent_paths` to the checked directories,
+their stats and the result.
+"""
+
 
 def _try_to_skip_duplicates(func):
     def wrapper(*args, **kwargs):
@@ -83,8 +101,11 @@ class Project:
         if isinstance(path, str):
             path = Path(path)
         with open(cls._get_json_path(path)) as f:
-            version, data = json.load(f)
+            return cls._from_json_data(json.load(f))
 
+    @classmethod
+    def _from_json_data(cls, json_data):
+        version, data = json_data
         if version == 1:
             return cls(**data)
         else:
@@ -99,6 +120,7 @@ class Project:
         data = dict(self.__dict__)
         data.pop('_environment', None)
         data.pop('_django', None)  # TODO make django setting public?
+        data.pop('_overlay', None)
         data = {k.lstrip('_'): v for k, v in data.items()}
         data['path'] = str(data['path'])
 
@@ -139,6 +161,7 @@ class Project:
             self._smart_sys_path = smart_sys_path
             self._load_unsafe_extensions = load_unsafe_extensions
             self._django = False
+            self._overlay = FileOverlay()
             # Remap potential pathlib.Path entries
             self.added_sys_path = list(map(str, added_sys_path))
             """The sys path that is going to be added at the end of the """
@@ -152,6 +175,14 @@ class Project:
         """
         return self._path
 
+    @property
+    def overlay(self):
+        """
+        The :class:`jedi.file_io.FileOverlay` with the contents of unsaved
+        files of this project. Jedi uses them instead of the files on disk.
+        """
+        return self._overlay
+
     @property
     def sys_path(self):
         """
@@ -209,23 +240,12 @@ class Project:
                 ))
 
                 if add_parent_paths:
-                    # Collect directories in upward search by:
-                    #   1. Skipping directories with __init__.py
-                    #   2. Stopping immediately when above self._path
-                    traversed = []
-                    for parent_path in inference_state.script_path.parents:
-                        if parent_path == self._path \
-                                or self._path not in parent_path.parents:
-                            break
-                        if not add_init_paths \
-                                and parent_path.joinpath("__init__.py").is_file():
-                            continue
-                        traversed.append(str(parent_path))
-
                     # AFAIK some libraries have imports like `foo.foo.bar`, which
                     # leads to the conclusion to by default prefer longer paths
                     # rather than shorter ones by default.
-                    suffixed += reversed(traversed)
+                    suffixed += reversed(_get_parent_paths(
+                        self._path, inference_state.script_path, add_init_paths
+                    ))
 
         if self._django:
             prefixed.append(str(self._path))
@@ -289,7 +309,7 @@ class Project:
         name = wanted_names[0]
         stub_folder_name = name + '-stubs'
 
-        ios = recurse_find_python_folders_and_files(FolderIO(str(self._path)))
+        ios = recurse_find_python_folders_and_files(FolderIO(str(self._path), self._overlay))
         file_ios = []
 
         # 1. Search for modules in the current project
@@ -364,6 +384,41 @@ class Project:
         return '<%s: %s>' % (self.__class__.__name__, self._path)
 
 
+def _get_parent_paths(project_path, script_path, add_init_paths):
+    """
+    Collect directories in upward search by:
+      1. Skipping directories with __init__.py
+      2. Stopping immediately when above the project path
+
+    The result is cached as long as the directories don't change.
+    """
+    key = project_path, script_path, add_init_paths
+    try:
+        checked_paths, stats, traversed = _parent_paths_cache[key]
+    except KeyError:
+        pass
+    else:
+        if get_path_stats(checked_paths) == stats:
+            return list(traversed)
+
+    checked_paths = []
+    traversed = []
+    for parent_path in script_path.parents:
+        if parent_path == project_path \
+                or project_path not in parent_path.parents:
+            break
+        checked_paths.append(str(parent_path))
+        if not add_init_paths \
+                and parent_path.joinpath("__init__.py").is_file():
+            continue
+        traversed.append(str(parent_path))
+
+    stats = get_path_stats(checked_paths)
+    if not is_recently_modified(stats):
+        _parent_paths_cache[key] = checked_paths, stats, tuple(traversed)
+    return traversed
+
+
 def _is_potential_project(path):
     for name in _CONTAINS_POTENTIAL_PROJECT:
         if path.joinpath(name).exists():
@@ -396,11 +451,37 @@ def get_default_project(path=None):
         path = Path(path)
 
     check = path.absolute()
+    try:
+        probed_paths, stats, create_project = _default_project_cache[check]
+    except KeyError:
+        pass
+    else:
+        if get_path_stats(probed_paths) == stats:
+            return create_project()
+
+    probed_paths = []
+    create_project = _find_default_project(path, check, probed_paths)
+    stats = get_path_stats(probed_paths)
+    if not is_recently_modified(stats):
+        _default_project_cache[check] = probed_paths, stats, create_project
+    return create_project()
+
+
+def _find_default_project(path, check, probed_paths):
+    """
+    Returns a function that creates the default project. All paths whose
+    changes could lead to a different project are added to ``probed_paths``.
+    """
     probable_path = None
     first_no_init_file = None
     for dir in chain([check], check.parents):
+        json_path = Project._get_json_path(dir)
+        manage_path = dir.joinpath('manage.py')
+        probed_paths += [str(dir), str(json_path), str(manage_path)]
         try:
-            return Project.load(dir)
+            with open(json_path) as f:
+                data = json.load(f)
+            return partial(Project._from_json_data, data)
         except (FileNotFoundError, IsADirectoryError, PermissionError):
             pass
         except NotADirectoryError:
@@ -415,22 +496,26 @@ def get_default_project(path=None):
                 first_no_init_file = dir
 
         if _is_django_path(dir):
-            project = Project(dir)
-            project._django = True
-            return project
+            return partial(_create_django_project, dir)
 
         if probable_path is None and _is_potential_project(dir):
             probable_path = dir
 
     if probable_path is not None:
         # TODO search for setup.py etc
-        return Project(probable_path)
+        return partial(Project, probable_path)
 
     if first_no_init_file is not None:
-        return Project(first_no_init_file)
+        return partial(Project, first_no_init_file)
 
     curdir = path if path.is_dir() else path.parent
-    return Project(curdir)
+    return partial(Project, curdir)
+
+
+def _create_django_project(path):
+    project = Project(path)
+    project._django = True
+    return project
 
 
 def _remove_imports(names):
@@ -6,20 +6,65 @@ available:
 - ``time_cache`` can be used to cache something for just a limited time span,
   which can be useful if there's user interaction and the user cannot react
   faster than a certain time.
+- ``load_persistent_cache`` and ``save_persistent_cache`` store pickled
+  values in :data:`jedi.settings.cache_directory`, so that expensive results
+  (indexes, introspection data) survive between processes.
+- The syntax trees in parso's ``parser_cache`` are limited to
+  :data:`jedi.settings.parser_cache_size`, see :func:`limit_parser_cache`.
 
 This module is one of the reasons why |jedi| is not thread-safe. As you can see
 there are global variables, which are holding the cache information. Some of
 these variables are being cleaned after every API usage.
 """
+import os
+import gc
+import sys
 import time
+import pickle
+import hashlib
+import tempfile
+import platform
+import weakref
 from functools import wraps
-from typing import Any, Dict, Tuple
+from pathlib import Path
+from typing import Any, Dict, MutableMapping, Tuple
 
 from jedi import settings
+from jedi import debug
 from parso.cache import parser_cache
 
+_PERSISTENT_CACHE_VERSION = 1
+"""
+Increment this number when the layout of any persisted value changes.
+"""
+
+_RACY_MODIFICATION_TIME_NS = 2 * 10 ** 9
+
+_PERSISTENT_VERSION_TAG = '%s-%s%s-%s' % (
+    platform.python_implementation(),
+    sys.version_info[0],
+    sys.version_info[1],
+    _PERSISTENT_CACHE_VERSION
+)
+
 _time_caches: Dict[str, Dict[Any, Tuple[float, Any]]] = {}
 
+# item -> size of the code
+_parser_cache_item_sizes: MutableMapping[Any, int] = weakref.WeakKeyDictionary()
+# owner -> pinned (hashed grammar, path) keys, the last used one at the end
+_parser_cache_pins: MutableMapping[Any, Dict[Tuple[str, Path], None]] = \
+    weakref.WeakKeyDictionary()
+_MAX_PINNED_MODULES = 20
+"""
+Only the modules that an owner used last are pinned. A script needs its own
+module and a few imported ones at once, the others are used in passing.
+"""
+_parser_cache_statistics = {'hits': 0, 'misses': 0, 'evictions': 0}
+# An upper bound, parso also removes modules from its cache on its own.
+_parser_cache_size = 0
+# If pinned modules exceed the limit, evict again only after some growth.
+_parser_cache_overflow_size = 0
+
 
 def clear_time_caches(delete_all: bool = False) -> None:
     """ Jedi caches many things, that should be completed after each completion
@@ -99,11 +144,35 @@ def time_cache(seconds):
     return decorator
 
 
+def _get_memoize_method_dict(obj):
+    # Use object.__getattribute__, because a lot of classes forward unknown
+    # attributes to wrapped objects with __getattr__.
+    try:
+        return object.__getattribute__(obj, '__dict__').setdefault('_memoize_method_dct', {})
+    except AttributeError:
+        pass
+    # Classes using __slots__ need to have a `_memoize_method_dct` slot.
+    try:
+        return object.__getattribute__(obj, '_memoize_method_dct')
+    except AttributeError:
+        dct = {}
+        object.__setattr__(obj, '_memoize_method_dct', dct)
+        return dct
+
+
+def clear_memoize_method_cache(obj):
+    """
+    Removes the results of all methods of an object that are decorated with
+    :func:`memoize_method`.
+    """
+    _get_memoize_method_dict(obj).clear()
+
+
 def memoize_method(method):
     """A normal memoize function."""
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        cache_dict = self.__dict__.setdefault('_memoize_method_dct', {})
+        cache_dict = _get_memoize_method_dict(self)
         dct = cache_dict.setdefault(method, {})
         key = (args, frozenset(kwargs.items()))
         try:
@@ -113,3 +182,210 @@ def memoize_method(method):
             dct[key] = result
             return result
     return wrapper
+
+
+def get_persistent_cache_path(namespace, key, extension='.pkl'):
+    """
+    Returns the path of a file in the cache directory for a key.
+    """
+    key_hash = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+    return os.path.join(
+        settings.cache_directory,
+        _PERSISTENT_VERSION_TAG,
+        namespace,
+        key_hash + extension,
+    )
+
+
+def load_persistent_cache(namespace, key, default=None):
+    """
+    Loads a value that was previously stored with :func:`save_persistent_cache`.
+
+    The key is stored next to the value and compared on load, so it should be
+    a tuple of simple builtin types. Returns ``default`` if nothing (valid) is
+    cached.
+    """
+    path = get_persistent_cache_path(namespace, key)
+    try:
+        with open(path, 'rb') as f:
+            gc.disable()
+            try:
+                stored_key, value = pickle.load(f)
+            finally:
+                gc.enable()
+    except FileNotFoundError:
+        return default
+    except Exception as e:
+        # Broken or incompatible cache files are not a reason to fail. They
+        # are simply overwritten later.
+        debug.warning('Could not load cache file %s: %s', path, e)
+        return default
+    if stored_key != key:
+        return default
+    return value
+
+
+def save_persistent_cache(namespace, key, value):
+    path = get_persistent_cache_path(namespace, key)
+    write_persistent_file(path, pickle.dumps((key, value), pickle.HIGHEST_PROTOCOL))
+
+
+def get_path_stats(paths):
+    """
+    Returns the modification times and sizes of files or directories (None if
+    a path doesn't exist). They can be used to validate cached results: The
+    modification time of a directory changes if entries are added or removed.
+    """
+    stats = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stats.append(None)
+        else:
+            stats.append((stat.st_mtime_ns, stat.st_size))
+    return stats
+
+
+def is_recently_modified(stats):
+    """
+    Modification times are not precise. A file created right after a cached
+    lookup might not change the time of a directory that was just modified,
+    so such stats should not be used to validate caches.
+    """
+    racy_time = time.time_ns() - _RACY_MODIFICATION_TIME_NS
+    return any(stat is not None and stat[0] >= racy_time for stat in stats)
+
+
+def write_persistent_file(path, data):
+    """
+    Writes bytes to a file in the cache directory. Returns False if that's
+    not possible.
+    """
+    directory, file_name = os.path.split(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # A unique temporary file, other threads and processes might write
+        # the same file at the same time.
+        fd, tmp_path = tempfile.mkstemp(prefix=file_name + '.', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            # Replacing is atomic, nobody ever sees half written files.
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    except OSError as e:
+        # It's not really a big issue if the cache cannot be saved to the
+        # file system, it will just be calculated again next time.
+        debug.warning('Could not save cache file %s: %s', path, e)
+        return False
+    return True
+
+
+def get_parser_cache_item(hashed_grammar, path):
+    """
+    Returns the item of a module in parso's parser cache or None.
+    """
+    return parser_cache.get(hashed_grammar, {}).get(path)
+
+
+def remove_parser_cache_item(hashed_grammar, path):
+    parser_cache.get(hashed_grammar, {}).pop(path, None)
+
+
+def record_parser_cache_access(owner, hashed_grammar, path, previous_item):
+    """
+    Is called after a module was parsed with parso's parser cache.
+    ``previous_item`` is the cache item from before parsing. The module is
+    pinned in the cache as long as ``owner`` is alive and it's one of the
+    ``_MAX_PINNED_MODULES`` modules ``owner`` used last.
+    """
+    item = get_parser_cache_item(hashed_grammar, path)
+    if item is None:
+        return
+    try:
+        pins = _parser_cache_pins[owner]
+    except KeyError:
+        pins = _parser_cache_pins[owner] = {}
+    key = hashed_grammar, path
+    pins.pop(key, None)
+    pins[key] = None
+    if len(pins) > _MAX_PINNED_MODULES:
+        del pins[next(iter(pins))]
+
+    item.last_used = time.time()
+    if item is previous_item:
+        _parser_cache_statistics['hits'] += 1
+        return
+
+    global _parser_cache_size
+    _parser_cache_statistics['misses'] += 1
+    _parser_cache_size += _get_parser_cache_item_size(item)
+    if previous_item is not None:
+        _parser_cache_size -= _get_parser_cache_item_size(previous_item)
+    if _parser_cache_size > max(settings.parser_cache_size, _parser_cache_overflow_size):
+        limit_parser_cache()
+
+
+def _get_parser_cache_item_size(item):
+    try:
+        return _parser_cache_item_sizes[item]
+    except KeyError:
+        size = _parser_cache_item_sizes[item] = sum(map(len, item.lines))
+        return size
+
+
+def limit_parser_cache(max_size=None):
+    """
+    Removes the least recently used modules from parso's parser cache until
+    the source code of all cached modules is smaller than ``max_size``
+    (:data:`jedi.settings.parser_cache_size` by default). Modules that are
+    pinned by a live inference state (see :func:`record_parser_cache_access`)
+    are never removed.
+    """
+    global _parser_cache_size, _parser_cache_overflow_size
+    if max_size is None:
+        max_size = settings.parser_cache_size
+    items = [
+        (item.last_used, _get_parser_cache_item_size(item), hashed_grammar, path)
+        for hashed_grammar, dct in parser_cache.items()
+        for path, item in dct.items()
+    ]
+    size = _parser_cache_size = sum(item_size for _, item_size, _, _ in items)
+    if size <= max_size:
+        _parser_cache_overflow_size = 0
+        return
+
+    pinned = set()
+    for keys in list(_parser_cache_pins.values()):
+        pinned.update(keys)
+    items.sort(key=lambda t: t[0])
+    for _, item_size, hashed_grammar, path in items:
+        if size <= max_size:
+            break
+        if (hashed_grammar, path) not in pinned:
+            del parser_cache[hashed_grammar][path]
+            _parser_cache_statistics['evictions'] += 1
+            size -= item_size
+    _parser_cache_size = size
+    _parser_cache_overflow_size = size + size // 2 if size > max_size else 0
+
+
+def get_parser_cache_statistics():
+    """
+    Returns a dict with the ``hits``, ``misses`` and ``evictions`` of parso's
+    parser cache since the start of the process. ``modules`` and ``bytes``
+    are the number and the source code size of the modules in the cache
+    right now.
+    """
+    items = [item for dct in parser_cache.values() for item in dct.values()]
+    return dict(
+        _parser_cache_statistics,
+        modules=len(items),
+        bytes=sum(_get_parser_cache_item_size(item) for item in items),
+    )
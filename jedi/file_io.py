@@ -1,11 +1,59 @@
 import os
+import weakref
+from typing import Dict, List, Optional, Tuple
 
 from parso import file_io
 
+from jedi.cache import get_path_stats, is_recently_modified
+
+_directory_cache: Dict[
+    str, Tuple[List[Optional[Tuple[int, int]]], List[Tuple[str, bool, bool]]]
+] = {}
+"""
+Maps directories to their stats and entries, see :func:`list_directory`. Only
+the ``_MAX_DIRECTORY_LISTINGS`` directories that were listed last are kept.
+"""
+_MAX_DIRECTORY_LISTINGS = 10000
+
+
+def list_directory(path):
+    """
+    Returns the entries of a directory as tuples of the name and whether the
+    entry is a directory and a symlink. Listings are cached as long as the
+    modification time of the directory doesn't change.
+
+    Raises OSError if the directory cannot be listed.
+    """
+    stats = get_path_stats([path])
+    try:
+        cached_stats, entries = _directory_cache.pop(path)
+    except KeyError:
+        pass
+    else:
+        if cached_stats == stats:
+            # Move the listing to the end, it was used last.
+            _directory_cache[path] = cached_stats, entries
+            return entries
+
+    entries = []
+    with os.scandir(path) as iterator:
+        for entry in iterator:
+            try:
+                is_directory = entry.is_dir()
+            except OSError:
+                is_directory = False
+            entries.append((entry.name, is_directory, entry.is_symlink()))
+    if not is_recently_modified(stats):
+        _directory_cache[path] = stats, entries
+        if len(_directory_cache) > _MAX_DIRECTORY_LISTINGS:
+            del _directory_cache[next(iter(_directory_cache))]
+    return entries
+
 
 class AbstractFolderIO:
-    def __init__(self, path):
+    def __init__(self, path, overlay=None):
         self.path = path
+        self._overlay = overlay
 
     def get_base_name(self):
         raise NotImplementedError
@@ -28,33 +76,59 @@ class FolderIO(AbstractFolderIO):
         return os.path.basename(self.path)
 
     def list(self):
-        return os.listdir(self.path)
+        names = [name for name, is_directory, is_symlink in list_directory(self.path)]
+        if self._overlay is not None:
+            names += self._overlay.list_new_files(self.path, names)
+        return names
 
     def get_file_io(self, name):
-        return FileIO(os.path.join(self.path, name))
+        return self._create_file_io(os.path.join(self.path, name))
 
     def get_parent_folder(self):
-        return FolderIO(os.path.dirname(self.path))
+        return FolderIO(os.path.dirname(self.path), self._overlay)
+
+    def _create_file_io(self, path):
+        if self._overlay is None:
+            return FileIO(path)
+        return self._overlay.get_file_io(path)
+
+    def walk(self, file_suffixes=None):
+        """
+        Like ``os.walk``: Yields the folder, its sub folders and its files for
+        this folder and all folders below it. Sub folders that are removed
+        from the yielded list are not walked. If ``file_suffixes`` is given,
+        only files with names ending in one of them are yielded.
+        """
+        try:
+            entries = list_directory(self.path)
+        except OSError:
+            return
+
+        file_names = [name for name, is_directory, _ in entries if not is_directory]
+        if self._overlay is not None:
+            file_names += self._overlay.list_new_files(
+                self.path, [name for name, _, _ in entries])
+        if file_suffixes is not None:
+            file_names = [name for name in file_names if name.endswith(file_suffixes)]
+        # Like os.walk, symlinks to directories are listed, but not walked.
+        folder_ios = []
+        walked_folder_ios = set()
+        for name, is_directory, is_symlink in entries:
+            if is_directory:
+                folder_io = FolderIO(os.path.join(self.path, name), self._overlay)
+                folder_ios.append(folder_io)
+                if not is_symlink:
+                    walked_folder_ios.add(folder_io)
 
-    def walk(self):
-        for root, dirs, files in os.walk(self.path):
-            root_folder_io = FolderIO(root)
-            original_folder_ios = [FolderIO(os.path.join(root, d)) for d in dirs]
-            modified_folder_ios = list(original_folder_ios)
-            yield (
-                root_folder_io,
-                modified_folder_ios,
-                [FileIO(os.path.join(root, f)) for f in files],
-            )
-            modified_iterator = iter(reversed(modified_folder_ios))
-            current = next(modified_iterator, None)
-            i = len(original_folder_ios)
-            for folder_io in reversed(original_folder_ios):
-                i -= 1   # Basically enumerate but reversed
-                if current is folder_io:
-                    current = next(modified_iterator, None)
-                else:
-                    del dirs[i]
+        modified_folder_ios = list(folder_ios)
+        yield (
+            self,
+            modified_folder_ios,
+            [self._create_file_io(os.path.join(self.path, name)) for name in file_names],
+        )
+        for folder_io in modified_folder_ios:
+            if folder_io in walked_folder_ios:
+                yield from folder_io.walk(file_suffixes)
 
 
 class FileIOFolderMixin:
@@ -81,3 +155,118 @@ class FileIO(file_io.FileIO, FileIOFolderMixin):
 
 class KnownContentFileIO(file_io.KnownContentFileIO, FileIOFolderMixin):
     pass
+
+
+class OverlayFileIO(KnownContentFileIO):
+    """
+    A file whose content comes from a :class:`FileOverlay`.
+    """
+    def __init__(self, path, code, version, overlay):
+        super().__init__(path, code)
+        self.version = version
+        self._overlay = overlay
+
+    def get_parent_folder(self):
+        return FolderIO(os.path.dirname(self.path), self._overlay)
+
+    def _get_parsed_version(self, cache_item):
+        if cache_item is None:
+            return None
+        return self._overlay._parsed_versions.get(cache_item)
+
+    def is_parsed_by(self, cache_item):
+        """
+        Returns True if a parser cache item contains the syntax tree of this
+        version of the buffer.
+        """
+        return self._get_parsed_version(cache_item) == (self.path, self.version)
+
+    def is_buffer_of(self, cache_item):
+        """
+        Returns True if a parser cache item contains the syntax tree of any
+        version of this buffer.
+        """
+        parsed = self._get_parsed_version(cache_item)
+        return parsed is not None and parsed[0] == self.path
+
+    def set_parsed_by(self, cache_item):
+        self._overlay._parsed_versions[cache_item] = self.path, self.version
+        # The syntax tree of the file on disk is different, so the tree of a
+        # buffer must never look up to date for it.
+        cache_item.change_time = float('-inf')
+
+
+class FileOverlay:
+    """
+    Contents of files that differ from the file system, usually the unsaved
+    buffers of an editor. The overlay of a project
+    (:attr:`jedi.Project.overlay`) is used instead of the file system
+    whenever Jedi reads Python files for that project, e.g. for imports,
+    references and searches.
+
+    Every content has a version (e.g. the document version of the language
+    server protocol) that must change whenever the content changes. Cached
+    syntax trees and indexes of a buffer are only created again if its
+    version changes.
+    """
+    def __init__(self):
+        self._files = {}  # Dict[str, Tuple[Any, str]]
+        self._parsed_versions = weakref.WeakKeyDictionary()
+
+    def set(self, path, code, version):
+        """
+        Sets the content of the file at ``path`` (a ``str`` or a
+        :class:`pathlib.Path`). The file doesn't need to exist.
+        """
+        self._files[os.path.abspath(path)] = version, code
+
+    def remove(self, path):
+        """
+        Removes the content of the file at ``path``, the file system is used
+        again.
+        """
+        self._files.pop(os.path.abspath(path), None)
+
+    def get_version(self, path):
+        """
+        Returns the version of the file at ``path`` or None if the file is not
+        part of the overlay.
+        """
+        try:
+            return self._files[os.path.abspath(path)][0]
+        except KeyError:
+            return None
+
+    def get_file_io(self, path):
+        try:
+            version, code = self._files[os.path.abspath(path)]
+        except KeyError:
+            return FileIO(path)
+        return OverlayFileIO(path, code, version, self)
+
+    def replace_file_io(self, file_io):
+        """
+        Returns a file io with the content of the overlay if there is one for
+        the path of ``file_io``. Otherwise returns ``file_io``.
+        """
+        try:
+            version, code = self._files[os.path.abspath(file_io.path)]
+        except KeyError:
+            return file_io
+        return OverlayFileIO(file_io.path, code, version, self)
+
+    def list_new_files(self, folder_path, existing_names):
+        """
+        Returns the names of the files of a folder that only exist in the
+        overlay.
+        """
+        folder_path = os.path.abspath(folder_path)
+        return [
+            os.path.basename(path)
+            for path in self._files
+            if os.path.dirname(path) == folder_path
+            and os.path.basename(path) not in existing_names
+        ]
+
+    def __repr__(self):
+        return '<%s: %s files>' % (self.__class__.__name__, len(self._files))
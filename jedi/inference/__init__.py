@@ -62,11 +62,16 @@ I need to mention now that lazy type inference is really good because it
 only *inferes* what needs to be *inferred*. All the statements and modules
 that are not used are just being ignored.
 """
+from pathlib import Path
+
 import parso
-from jedi.file_io import FileIO
+from jedi.file_io import OverlayFileIO
+from jedi.parser_utils import get_code_outline
 
 from jedi import debug
 from jedi import settings
+from jedi.cache import get_parser_cache_item, record_parser_cache_access, \
+    remove_parser_cache_item
 from jedi.inference import imports
 from jedi.inference import recursion
 from jedi.inference.cache import inference_state_function_cache
@@ -96,12 +101,13 @@ class InferenceState:
         self.stub_module_cache = {}  # Dict[Tuple[str, ...], Optional[ModuleValue]]
         self.compiled_cache = {}  # see `inference.compiled.create()`
         self.inferred_element_counts = {}
-        self.mixed_cache = {}  # see `inference.compiled.mixed._create()`
+        self.mixed_cache = {}  # see `inference.compiled.mixed._get_syntax_node_info()`
         self.analysis = []
         self.dynamic_params_depth = 0
         self.is_analysis = False
         self.project = project
         self.access_cache = {}
+        self.class_tables = {}  # see `inference.compiled.getattr_static`
         self.allow_descriptor_getattr = False
         self.flow_analysis_enabled = True
 
@@ -179,22 +185,53 @@ class InferenceState:
 
         return helpers.infer_call_of_leaf(context, name)
 
-    def parse_and_get_code(self, code=None, path=None,
-                           use_latest_grammar=False, file_io=None, **kwargs):
+    def parse_and_get_code(self, code=None, path=None, use_latest_grammar=False,
+                           file_io=None, scope_line=None, **kwargs):
+        """
+        Code that is longer than ``settings._outline_file_size`` is parsed as
+        an outline, see :class:`jedi.parser_utils.CodeOutline`. Only the
+        top-level statement of ``scope_line`` is parsed completely. The
+        returned code is the complete code.
+        """
         if path is not None:
             path = str(path)
         if code is None:
             if file_io is None:
-                file_io = FileIO(path)
+                file_io = self.project.overlay.get_file_io(path)
             code = file_io.read()
         # We cannot just use parso, because it doesn't use errors='replace'.
         code = parso.python_bytes_to_unicode(code, encoding='utf-8', errors='replace')
 
-        if len(code) > settings._cropped_file_size:
-            code = code[:settings._cropped_file_size]
+        parsed_code = code
+        if len(code) > settings._outline_file_size:
+            parsed_code = get_code_outline(code).get_code(keep_line=scope_line)
 
         grammar = self.latest_grammar if use_latest_grammar else self.grammar
-        return grammar.parse(code=code, path=path, file_io=file_io, **kwargs), code
+        module_path = None
+        if kwargs.get('cache') or kwargs.get('diff_cache'):
+            # This is the key of the module in parso's parser cache.
+            module_path = file_io.path if file_io is not None else path and Path(path)
+        if module_path is None:
+            return grammar.parse(code=parsed_code, path=path, file_io=file_io, **kwargs), code
+
+        previous_item = get_parser_cache_item(grammar._hashed, module_path)
+        is_buffer = isinstance(file_io, OverlayFileIO)
+        if is_buffer:
+            if scope_line is None and file_io.is_parsed_by(previous_item):
+                record_parser_cache_access(self, grammar._hashed, module_path, previous_item)
+                return previous_item.node, code
+            if not file_io.is_buffer_of(previous_item):
+                # The diff parser would change the syntax tree of the file on
+                # disk, which might still be used.
+                remove_parser_cache_item(grammar._hashed, module_path)
+            # Buffers are never pickled.
+            kwargs.update(cache=False, diff_cache=True)
+
+        module = grammar.parse(code=parsed_code, path=path, file_io=file_io, **kwargs)
+        record_parser_cache_access(self, grammar._hashed, module_path, previous_item)
+        if is_buffer:
+            file_io.set_parsed_by(get_parser_cache_item(grammar._hashed, module_path))
+        return module, code
 
     def parse(self, *args, **kwargs):
         return self.parse_and_get_code(*args, **kwargs)[0]
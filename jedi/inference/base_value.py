@@ -9,6 +9,8 @@ just one.
 from functools import reduce
 from operator import add
 from itertools import zip_longest
+from typing import Dict
+from weakref import KeyedRef
 
 from parso.python.tree import Name
 
@@ -23,6 +25,8 @@ sentinel = object()
 
 
 class HelperValueMixin:
+    __slots__ = ()
+
     def get_root_context(self):
         value = self
         if value.parent_context is None:
@@ -140,6 +144,8 @@ class Value(HelperValueMixin):
     """
     To be implemented by subclasses.
     """
+    __slots__ = ('inference_state', 'parent_context', '_memoize_method_dct')
+
     tree_node = None
     # Possible values: None, tuple, list, dict and set. Here to deal with these
     # very important containers.
@@ -312,6 +318,8 @@ def iterate_values(values, contextualized_node=None, is_async=False):
 
 
 class _ValueWrapperBase(HelperValueMixin):
+    __slots__ = ()
+
     @safe_property
     def name(self):
         from jedi.inference.names import ValueName
@@ -333,6 +341,8 @@ class _ValueWrapperBase(HelperValueMixin):
 
 
 class LazyValueWrapper(_ValueWrapperBase):
+    __slots__ = ('_memoize_method_dct',)
+
     @safe_property
     @memoize_method
     def _wrapped_value(self):
@@ -347,6 +357,8 @@ class LazyValueWrapper(_ValueWrapperBase):
 
 
 class ValueWrapper(_ValueWrapperBase):
+    __slots__ = ('_wrapped_value', '_memoize_method_dct')
+
     def __init__(self, wrapped_value):
         self._wrapped_value = wrapped_value
 
@@ -355,6 +367,8 @@ class ValueWrapper(_ValueWrapperBase):
 
 
 class TreeValue(Value):
+    __slots__ = ('tree_node',)
+
     def __init__(self, inference_state, parent_context, tree_node):
         super().__init__(inference_state, parent_context)
         self.tree_node = tree_node
@@ -364,6 +378,8 @@ class TreeValue(Value):
 
 
 class ContextualizedNode:
+    __slots__ = ('context', 'node')
+
     def __init__(self, context, node):
         self.context = context
         self.node = node
@@ -406,14 +422,51 @@ def _getitem(value, index_values, contextualized_node):
 
 
 class ValueSet:
-    def __init__(self, iterable):
-        self._set = frozenset(iterable)
-        for value in iterable:
-            assert not isinstance(value, ValueSet)
+    """
+    An immutable set of values.
+
+    Most value sets during inference are empty or contain a single value.
+    Operations therefore try hard to return existing instances instead of
+    creating new ones: All empty sets are represented by ``NO_VALUES``, a set
+    with a single value is shared as long as it is alive and unions where one
+    side doesn't add anything return the other side.
+    """
+    __slots__ = ('_set', '__weakref__')
+
+    def __new__(cls, iterable):
+        if type(iterable) is list and len(iterable) == 1:
+            assert not isinstance(iterable[0], ValueSet)
+            return cls._from_value(iterable[0])
+        frozenset_ = frozenset(iterable)
+        assert not any(isinstance(value, ValueSet) for value in frozenset_)
+        return cls._from_frozen_set(frozenset_)
 
     @classmethod
     def _from_frozen_set(cls, frozenset_):
-        self = cls.__new__(cls)
+        if len(frozenset_) == 1:
+            for value in frozenset_:
+                return cls._from_value(value, frozenset_)
+        if not frozenset_:
+            return NO_VALUES
+        return cls._create(frozenset_)
+
+    @classmethod
+    def _from_value(cls, value, frozenset_=None):
+        # Values are keyed by identity, the value set keeps its value alive,
+        # so the id cannot be reused while the entry is valid.
+        key = id(value)
+        ref = _single_value_sets.get(key)
+        if ref is not None:
+            self = ref()
+            if self is not None:
+                return self
+        self = cls._create(frozenset((value,)) if frozenset_ is None else frozenset_)
+        _single_value_sets[key] = KeyedRef(self, _remove_single_value_set, key)
+        return self
+
+    @classmethod
+    def _create(cls, frozenset_):
+        self = object.__new__(cls)
         self._set = frozenset_
         return self
 
@@ -422,18 +475,42 @@ class ValueSet:
         """
         Used to work with an iterable of set.
         """
-        aggregated = set()
+        first = None
+        aggregated = None
         for set_ in sets:
             if isinstance(set_, ValueSet):
-                aggregated |= set_._set
+                value_set = set_
             else:
-                aggregated |= frozenset(set_)
-        return cls._from_frozen_set(frozenset(aggregated))
+                value_set = cls._from_frozen_set(frozenset(set_))
+            if not value_set._set:
+                continue
+
+            if first is None:
+                first = value_set
+            elif aggregated is None:
+                if value_set._set <= first._set:
+                    continue
+                aggregated = set(first._set)
+                aggregated |= value_set._set
+            else:
+                aggregated |= value_set._set
+
+        if aggregated is not None:
+            return cls._from_frozen_set(frozenset(aggregated))
+        if first is None:
+            return NO_VALUES
+        return first
 
     def __or__(self, other):
+        if not other._set or other._set <= self._set:
+            return self
+        if not self._set:
+            return other
         return self._from_frozen_set(self._set | other._set)
 
     def __and__(self, other):
+        if self._set <= other._set:
+            return self
         return self._from_frozen_set(self._set & other._set)
 
     def __iter__(self):
@@ -449,7 +526,7 @@ class ValueSet:
         return 'S{%s}' % (', '.join(str(s) for s in self._set))
 
     def filter(self, filter_func):
-        return self.__class__(filter(filter_func, self._set))
+        return self._from_frozen_set(frozenset(filter(filter_func, self._set)))
 
     def __getattr__(self, name):
         def mapper(*args, **kwargs):
@@ -495,7 +572,7 @@ class ValueSet:
         return ValueSet.from_sets(_getitem(c, *args, **kwargs) for c in self._set)
 
     def try_merge(self, function_name):
-        value_set = self.__class__([])
+        value_set = NO_VALUES
         for c in self._set:
             try:
                 method = getattr(c, function_name)
@@ -544,7 +621,14 @@ class ValueSet:
         return type_var_dict
 
 
-NO_VALUES = ValueSet([])
+NO_VALUES = ValueSet._create(frozenset())
+# id(value) -> KeyedRef of the ValueSet that contains only that value.
+_single_value_sets: Dict[int, 'KeyedRef[int, ValueSet]'] = {}
+
+
+def _remove_single_value_set(ref):
+    if _single_value_sets.get(ref.key) is ref:
+        del _single_value_sets[ref.key]
 
 
 def iterator_to_value_set(func):
@@ -0,0 +1,126 @@
+"""
+Call hierarchies, i.e. the callers of a function (incoming calls) and the
+functions that a function calls (outgoing calls).
+
+Building incoming calls on top of references would mean inferring every name
+with the same string in every file of a project. Instead the call site index
+(see :mod:`jedi.inference.call_sites`) is used to find the files that
+(probably) call a function. Only these files are parsed and only the names
+that are followed by a call trailer (``foo(...)``) are inferred. Files that
+don't change are not read again, because the index is persisted.
+"""
+from jedi.parser_utils import get_parent_scope
+from jedi.inference.gradual.conversion import convert_names
+from jedi.inference.call_sites import get_call_site_names
+from jedi.inference.references import get_module_contexts_calling_names, \
+    get_search_targets, find_names_of_leaf
+
+_CALLER_SCOPE_TYPES = ('funcdef', 'classdef', 'file_input')
+
+
+def is_call_name(leaf):
+    """
+    Returns True if a name is directly followed by a call trailer, like
+    ``foo`` and ``bar`` in ``foo()`` and ``x.bar()``.
+    """
+    node = leaf
+    if leaf.parent.type == 'trailer':
+        node = leaf.parent
+    elif leaf.parent.type not in ('power', 'atom_expr'):
+        return False
+    trailer = node.get_next_sibling()
+    return trailer is not None and trailer.type == 'trailer' \
+        and trailer.children[0] == '('
+
+
+def iter_call_names(node):
+    """
+    Yields the names that are called in a function or class. Calls in nested
+    functions and classes are not included, they have their own calls.
+    """
+    for child in node.children:
+        type_ = child.type
+        if type_ == 'name':
+            if is_call_name(child):
+                yield child
+        elif type_ in ('funcdef', 'classdef'):
+            # The decorators and default values are executed in this scope.
+            yield from _iter_call_names_outside_of_body(child)
+        elif hasattr(child, 'children'):
+            yield from iter_call_names(child)
+
+
+def _iter_call_names_outside_of_body(node):
+    for child in node.children[:-1]:
+        if hasattr(child, 'children'):
+            yield from iter_call_names(child)
+
+
+def _get_caller_scope(leaf):
+    scope = get_parent_scope(leaf)
+    while scope.type not in _CALLER_SCOPE_TYPES:
+        scope = get_parent_scope(scope)
+    return scope
+
+
+def _create_scope_name(module_context, scope):
+    if scope.type == 'file_input':
+        return module_context.get_value().name
+    return module_context.create_name(scope.name)
+
+
+def find_incoming_calls(module_context, tree_name):
+    """
+    Returns the callers of the function (or class) of a name as a list of
+    ``(name, call_names)`` tuples. The name of a caller is the name of a
+    function, a class or a module, the call names are the tree names of the
+    calls in it.
+    """
+    (found_names_dct,), module_contexts, (search_names,) = \
+        get_search_targets(module_context, [tree_name])
+
+    calls = {}
+    for m, positions_dct in get_module_contexts_calling_names(
+            module_context.inference_state, module_contexts, search_names):
+        for search_name, positions in positions_dct.items():
+            for name_leaf in get_call_site_names(m.tree_node, search_name, positions):
+                if name_leaf.is_definition() or not is_call_name(name_leaf):
+                    continue
+                if any(n in found_names_dct for n in find_names_of_leaf(m, name_leaf)):
+                    scope = _get_caller_scope(name_leaf)
+                    call_names = calls.setdefault(scope, (m, []))[1]
+                    if name_leaf not in call_names:
+                        call_names.append(name_leaf)
+    return [
+        (_create_scope_name(m, scope), call_names)
+        for scope, (m, call_names) in calls.items()
+    ]
+
+
+def _follow_imports(names):
+    for name in names:
+        if name.is_import():
+            yield from _follow_imports(name.goto())
+        else:
+            yield name
+
+
+def find_outgoing_calls(module_context, node):
+    """
+    Returns the functions (and classes) that a function or class node calls
+    as a list of ``(name, call_names)`` tuples. The call names are the tree
+    names of the calls in ``node``.
+    """
+    calls = {}
+    for name_leaf in iter_call_names(node.children[-1]):
+        names = _follow_imports(module_context.create_name(name_leaf).goto())
+        for name in convert_names(names, prefer_stub_to_compiled=False):
+            if name.tree_name is None:
+                # Compiled names are created for every lookup.
+                key = name.parent_context, name.string_name
+            else:
+                key = name.tree_name
+            call_names = calls.setdefault(key, (name, []))[1]
+            if name_leaf not in call_names:
+                call_names.append(name_leaf)
+    return list(calls.values())
@@ -0,0 +1,167 @@
+"""
+Finding the callers of a function is needed for dynamic param inference and
+is pretty expensive: In the worst case every Python file of a project has to
+be read. This module therefore keeps an index of the call sites of a file,
+i.e. a mapping of names to the positions where they are followed by ``(``::
+
+    {'foo': [(3, 4), (10, 0)], 'append': [(5, 8)]}
+
+The index is built with a simple regular expression on the source, which is
+a lot cheaper than parsing. It can therefore contain false positives (e.g.
+calls in strings or comments). Once a module is loaded,
+:func:`get_call_site_names` looks up the leaves at the positions of a name,
+which filters these out.
+
+The indexes of all files in a directory are persisted together in one file
+in :data:`jedi.settings.cache_directory` (see
+:func:`save_call_site_indexes`). An index is only recalculated if the
+modification time or the size of its file changes. Indexes of unsaved
+buffers (see :class:`jedi.file_io.FileOverlay`) are only kept in memory and
+recalculated if the version of a buffer changes.
+"""
+import os
+import re
+from typing import Dict, List, Set, Tuple, Any
+
+from parso import python_bytes_to_unicode, split_lines
+
+from jedi.cache import load_persistent_cache, save_persistent_cache
+from jedi.file_io import OverlayFileIO
+
+_CACHE_NAMESPACE = 'call_sites'
+
+_CALL_REGEX = re.compile(r'(\b(?:def|class)\s+)?\b([^\W\d]\w*)[ \t]*\(')
+
+_call_site_cache: Dict[str, Dict[str, Tuple[Any, Dict[str, List[Tuple[int, int]]]]]] = {}
+"""
+The indexes by directory and file name together with the stat keys of the
+files. Only the ``_MAX_CALL_SITE_DIRECTORIES`` directories that were used last
+are kept, unsaved indexes are persisted before a directory is dropped.
+"""
+_MAX_CALL_SITE_DIRECTORIES = 500
+_unsaved_directories: Set[str] = set()
+
+
+def _create_call_site_index(code):
+    index = {}
+    for line_nr, line in enumerate(split_lines(code), 1):
+        if '(' not in line:
+            continue
+        for match in _CALL_REGEX.finditer(line):
+            if match.group(1) is not None:
+                # Definitions look like calls, but are not.
+                continue
+            index.setdefault(match.group(2), []).append((line_nr, match.start(2)))
+    return index
+
+
+def _get_stat_key(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime, stat.st_size
+
+
+def _get_directory_indexes(directory):
+    try:
+        indexes = _call_site_cache.pop(directory)
+    except KeyError:
+        indexes = load_persistent_cache(_CACHE_NAMESPACE, (directory,), default={})
+    _call_site_cache[directory] = indexes
+    if len(_call_site_cache) > _MAX_CALL_SITE_DIRECTORIES:
+        oldest = next(iter(_call_site_cache))
+        if oldest in _unsaved_directories:
+            _unsaved_directories.remove(oldest)
+            _save_directory_indexes(oldest, _call_site_cache[oldest])
+        del _call_site_cache[oldest]
+    return indexes
+
+
+def get_call_site_index(file_io, code=None):
+    """
+    Returns the call site index of a file. If ``code`` is given, it is used
+    instead of reading the file.
+
+    Returns None if the file cannot be read.
+    """
+    path = file_io.path
+    stat_key = None
+    is_buffer = isinstance(file_io, OverlayFileIO)
+    if path is not None and code is None:
+        path = str(path)
+        # Buffers are identified by their versions, they might not even exist
+        # on disk.
+        stat_key = ('buffer', file_io.version) if is_buffer else _get_stat_key(path)
+
+    if stat_key is not None:
+        directory, file_name = os.path.split(path)
+        indexes = _get_directory_indexes(directory)
+        cached = indexes.get(file_name)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+    if code is None:
+        try:
+            code = file_io.read()
+        except (FileNotFoundError, IsADirectoryError, PermissionError):
+            return None
+    if isinstance(code, bytes):
+        code = python_bytes_to_unicode(code, errors='replace')
+
+    index = _create_call_site_index(code)
+    if stat_key is not None:
+        indexes[file_name] = stat_key, index
+        if not is_buffer:
+            _unsaved_directories.add(directory)
+    return index
+
+
+def save_call_site_indexes():
+    """
+    Persists the indexes of the directories that have new indexes, one cache
+    file per directory. Files that don't exist anymore are removed from it.
+    """
+    while _unsaved_directories:
+        directory = _unsaved_directories.pop()
+        _save_directory_indexes(directory, _call_site_cache[directory])
+
+
+def _save_directory_indexes(directory, indexes):
+    try:
+        file_names = set(os.listdir(directory))
+    except OSError:
+        file_names = set()
+    for file_name in list(indexes):
+        if file_name not in file_names:
+            del indexes[file_name]
+    save_persistent_cache(_CACHE_NAMESPACE, (directory,), {
+        file_name: (stat_key, index)
+        for file_name, (stat_key, index) in indexes.items()
+        if stat_key[0] != 'buffer'
+    })
+
+
+def get_call_site_names(module_node, name, positions=None):
+    """
+    Returns the name leaves with the value ``name`` at the positions of a call
+    site index, i.e. the false positives of an index are filtered out. If
+    ``positions`` is None, all names ``name`` of a module are returned.
+    """
+    if positions is None:
+        return module_node.get_used_names().get(name, [])
+
+    leaves = []
+    for position in positions:
+        try:
+            leaf = module_node.get_leaf_for_position(position)
+        except ValueError:
+            # The file changed after the index was created.
+            continue
+        if leaf is not None and leaf.end_pos == position:
+            # Leaves are also found at their end.
+            leaf = leaf.get_next_leaf()
+        if leaf is not None and leaf.start_pos == position \
+                and leaf.type == 'name' and leaf.value == name:
+            leaves.append(leaf)
+    return leaves
@@ -67,4 +67,11 @@ def load_module(inference_state, dotted_name, **kwargs):
     access_path = inference_state.compiled_subprocess.load_module(dotted_name=dotted_name, **kwargs)
     if access_path is None:
         return None
-    return create_from_access_path(inference_state, access_path)
+    module = create_from_access_path(inference_state, access_path)
+    handle = module.access_handle
+    if handle.introspection_key is None:
+        table = inference_state.compiled_subprocess.get_introspection_table(
+            dotted_name, module.py__file__())
+        if table is not None:
+            handle.introspection_key = table, ()
+    return module
@@ -61,6 +61,16 @@ _OPERATORS = {
 }
 _OPERATORS.update(COMPARISON_OPERATORS)
 
+_BULK_METHODS = (
+    'get_api_type', 'is_class', 'is_function', 'is_module', 'is_instance',
+    'ismethoddescriptor', 'py__name__', 'get_qualified_names', 'get_safe_value',
+)
+_SHORT_DOC_LENGTH = 500
+"""
+Longer docstrings are not part of attribute tables, because they are
+usually only needed for a few attributes.
+"""
+
 ALLOWED_DESCRIPTOR_ACCESS = (
     types.FunctionType,
     types.GetSetDescriptorType,
@@ -324,7 +334,8 @@ class DirectObjectAccess:
                     # gets executed, so just avoid all exceptions here.
                     return False, False
         try:
-            attr, is_get_descriptor = getattr_static(self._obj, name)
+            attr, is_get_descriptor = getattr_static(
+                self._obj, name, class_tables=self._inference_state.class_tables)
         except AttributeError:
             return False, False
         else:
@@ -522,6 +533,57 @@ class DirectObjectAccess:
         )
         return self.needs_type_completions(), tuples
 
+    def get_attribute_table(self):
+        """
+        Like ``get_dir_infos``, but also returns the most important
+        introspection results of all attributes that can be accessed without
+        executing code. This way all attributes of a module or class can be
+        inspected with one call instead of a few calls per attribute. No access
+        handles are created for the attributes, that only happens once an
+        attribute is really inferred.
+
+        Returns Tuple[bool, Dict[str, Tuple[Tuple[bool, bool], Optional[
+        Dict[Tuple[str, tuple], Any]]]]]
+        """
+        needs_type_completions, dir_infos = self.get_dir_infos()
+        table = {}
+        for name, dir_info in dir_infos.items():
+            has_attribute, is_descriptor = dir_info
+            results = None
+            if has_attribute and not is_descriptor:
+                results = self._get_attribute_bulk_results(name)
+            table[name] = dir_info, results
+        return needs_type_completions, table
+
+    def _get_attribute_bulk_results(self, name):
+        try:
+            with warnings.catch_warnings(record=True):
+                warnings.simplefilter("always")
+                obj = getattr(self._obj, name)
+        except Exception:
+            return None
+        return DirectObjectAccess(self._inference_state, obj)._get_bulk_results()
+
+    def _get_bulk_results(self):
+        # Signatures are not part of the table, because creating them is
+        # slow and they are usually only needed for a single function.
+        results = {}
+        for method_name in _BULK_METHODS:
+            try:
+                results[method_name, ()] = getattr(self, method_name)()
+            except Exception:
+                # The error is raised again, once the method is really called.
+                pass
+
+        try:
+            doc = self.py__doc__()
+        except Exception:
+            pass
+        else:
+            if len(doc) <= _SHORT_DOC_LENGTH:
+                results['py__doc__', ()] = doc
+        return results
+
 
 def _is_class_instance(obj):
     """Like inspect.* methods."""
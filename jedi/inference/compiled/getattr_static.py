@@ -20,7 +20,10 @@ def _check_instance(obj, attr):
     return dict.get(instance_dict, attr, _sentinel)
 
 
-def _check_class(klass, attr):
+def _check_class(klass, attr, class_tables=None):
+    if class_tables is not None:
+        return _get_class_table(klass, class_tables)[1].get(attr, _sentinel)
+
     for entry in _static_getmro(klass):
         if _shadowed_dict(type(entry)) is _sentinel:
             try:
@@ -30,6 +33,35 @@ def _check_class(klass, attr):
     return _sentinel
 
 
+def _get_class_table(klass, class_tables):
+    """
+    Returns the class, the static attributes of the class and all its bases
+    in one dict (the first definition in the MRO wins) and the result of
+    :func:`_shadowed_dict`. Building it once is a lot cheaper than walking
+    the MRO for every attribute of a class with a lot of bases.
+
+    The tables are keyed by the id of the class, because hashing a class might
+    execute the ``__hash__`` of a metaclass. The class is part of the table,
+    so the id stays valid.
+
+    CPython doesn't expose the version of a type's ``__dict__``, therefore the
+    tables are not validated: The owner of ``class_tables`` has to throw them
+    away if classes might have been changed, e.g. before every completion in
+    an interpreter.
+    """
+    try:
+        return class_tables[id(klass)]
+    except KeyError:
+        pass
+
+    attributes = {}
+    for entry in reversed(_static_getmro(klass)):
+        if _shadowed_dict(type(entry)) is _sentinel:
+            attributes.update(entry.__dict__)
+    table = class_tables[id(klass)] = klass, attributes, _shadowed_dict(klass)
+    return table
+
+
 def _is_type(obj):
     try:
         _static_getmro(obj)
@@ -64,15 +96,16 @@ def _static_getmro(klass):
     return mro
 
 
-def _safe_hasattr(obj, name):
-    return _check_class(type(obj), name) is not _sentinel
+def _safe_hasattr(obj, name, class_tables=None):
+    return _check_class(type(obj), name, class_tables) is not _sentinel
 
 
-def _safe_is_data_descriptor(obj):
-    return _safe_hasattr(obj, '__set__') or _safe_hasattr(obj, '__delete__')
+def _safe_is_data_descriptor(obj, class_tables=None):
+    return _safe_hasattr(obj, '__set__', class_tables) \
+        or _safe_hasattr(obj, '__delete__', class_tables)
 
 
-def getattr_static(obj, attr, default=_sentinel):
+def getattr_static(obj, attr, default=_sentinel, class_tables=None):
     """Retrieve attributes without triggering dynamic lookup via the
        descriptor protocol,  __getattr__ or __getattribute__.
 
@@ -85,37 +118,40 @@ def getattr_static(obj, attr, default=_sentinel):
 
        Returns a tuple `(attr, is_get_descriptor)`. is_get_descripter means that
        the attribute is a descriptor that has a `__get__` attribute.
+
+       ``class_tables`` is a dict that caches the attributes of classes, see
+       :func:`_get_class_table`.
     """
     instance_result = _sentinel
     if not _is_type(obj):
         klass = type(obj)
-        dict_attr = _shadowed_dict(klass)
+        if class_tables is None:
+            dict_attr = _shadowed_dict(klass)
+        else:
+            dict_attr = _get_class_table(klass, class_tables)[2]
         if (dict_attr is _sentinel or type(dict_attr) is types.MemberDescriptorType):
             instance_result = _check_instance(obj, attr)
     else:
         klass = obj
 
-    klass_result = _check_class(klass, attr)
+    klass_result = _check_class(klass, attr, class_tables)
 
     if instance_result is not _sentinel and klass_result is not _sentinel:
-        if _safe_hasattr(klass_result, '__get__') \
-                and _safe_is_data_descriptor(klass_result):
+        if _safe_hasattr(klass_result, '__get__', class_tables) \
+                and _safe_is_data_descriptor(klass_result, class_tables):
             # A get/set descriptor has priority over everything.
             return klass_result, True
 
     if instance_result is not _sentinel:
         return instance_result, False
     if klass_result is not _sentinel:
-        return klass_result, _safe_hasattr(klass_result, '__get__')
+        return klass_result, _safe_hasattr(klass_result, '__get__', class_tables)
 
     if obj is klass:
         # for types we check the metaclass too
-        for entry in _static_getmro(type(klass)):
-            if _shadowed_dict(type(entry)) is _sentinel:
-                try:
-                    return entry.__dict__[attr], False
-                except KeyError:
-                    pass
+        metaclass_result = _check_class(type(klass), attr, class_tables)
+        if metaclass_result is not _sentinel:
+            return metaclass_result, False
     if default is not _sentinel:
         return default, False
     raise AttributeError(attr)
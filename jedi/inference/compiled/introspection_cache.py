@@ -0,0 +1,114 @@
+"""
+Compiled modules (C extensions, builtins) are introspected in a subprocess and
+every question about an object is a round trip. Most of these questions
+(``dir()``, docstrings, reprs, api types) always have the same answer for a
+given module file and Python executable. This module persists these answers in
+:data:`jedi.settings.cache_directory`, so that new processes don't have to ask
+the subprocess again.
+
+Results are grouped in one table per module. A table is keyed by the hash of
+the environment's executable, the module name and the path, modification time
+and size of the module file. Within a table, objects are identified by the
+attribute names that lead to them from the module, e.g. ``('str', 'join')``
+in the table of ``builtins``. Attribute tables (see
+``DirectObjectAccess.get_attribute_table``) are persisted like any other
+result, so completing the attributes of a known module needs no call for them.
+
+Only results that consist of simple builtin types are persisted. Everything
+that contains access handles (e.g. signature params with their defaults) still
+needs the subprocess.
+"""
+import os
+from typing import Dict, Optional, Tuple, Any
+
+from jedi.cache import load_persistent_cache, save_persistent_cache
+
+_CACHE_NAMESPACE = 'compiled_introspection'
+
+PERSISTED_METHODS = frozenset([
+    'py__bool__', 'py__doc__', 'py__file__', 'py__name__', 'get_repr',
+    'is_class', 'is_function', 'is_module', 'is_instance', 'ismethoddescriptor',
+    'get_qualified_names', 'dir', 'has_iter', 'is_allowed_getattr',
+    'get_safe_value', 'get_api_type', 'get_array_type', 'needs_type_completions',
+    'get_dir_infos', 'get_attribute_table',
+])
+"""
+Methods of ``DirectObjectAccess`` that don't have side effects and whose
+results only depend on the object.
+"""
+
+_SIMPLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+_tables: Dict[Tuple[str, str, Optional[str], Any], 'IntrospectionTable'] = {}
+
+
+def _is_persistable(obj):
+    if type(obj) in _SIMPLE_TYPES:
+        return True
+    if type(obj) in (tuple, list):
+        return all(_is_persistable(o) for o in obj)
+    if type(obj) is dict:
+        return all(_is_persistable(k) and _is_persistable(v) for k, v in obj.items())
+    return False
+
+
+class IntrospectionTable:
+    """
+    The introspection results of all objects of one module.
+    """
+    def __init__(self, key):
+        self._key = key
+        self._results = load_persistent_cache(_CACHE_NAMESPACE, key, default={})
+        self._changed = False
+
+    def get(self, attribute_names, method_name, args):
+        """
+        Raises KeyError if the result is not known.
+        """
+        return self._results[attribute_names, method_name, args]
+
+    def set(self, attribute_names, method_name, args, result):
+        if _is_persistable(result):
+            self._results[attribute_names, method_name, args] = result
+            self._changed = True
+
+    def save(self):
+        if self._changed:
+            save_persistent_cache(_CACHE_NAMESPACE, self._key, self._results)
+            self._changed = False
+
+
+def get_module_version_key(environment_hash, dotted_name, module_path):
+    """
+    Returns a key that changes if a module changes. ``module_path`` is None for
+    modules that are compiled into the interpreter. Returns None if the module
+    file cannot be accessed.
+    """
+    stat_key = None
+    if module_path is not None:
+        module_path = str(module_path)
+        try:
+            stat = os.stat(module_path)
+        except OSError:
+            return None
+        stat_key = stat.st_mtime, stat.st_size
+    return environment_hash, dotted_name, module_path, stat_key
+
+
+def get_introspection_table(environment_hash, dotted_name, module_path):
+    """
+    Returns the table of a module or None, see :func:`get_module_version_key`.
+    """
+    key = get_module_version_key(environment_hash, dotted_name, module_path)
+    if key is None:
+        return None
+    try:
+        return _tables[key]
+    except KeyError:
+        table = _tables[key] = IntrospectionTable(key)
+        return table
+
+
+def save_introspection_tables():
+    for table in list(_tables.values()):
+        table.save()
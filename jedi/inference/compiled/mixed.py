@@ -3,12 +3,14 @@ Used only for REPL Completion.
 """
 
 import inspect
+import weakref
 from pathlib import Path
+from typing import Any, MutableMapping, Optional, Tuple
 
 from jedi.parser_utils import get_cached_code_lines
 
 from jedi import settings
-from jedi.cache import memoize_method
+from jedi.cache import memoize_method, get_path_stats
 from jedi.inference import compiled
 from jedi.file_io import FileIO
 from jedi.inference.names import NameWrapper
@@ -23,6 +25,18 @@ from jedi.inference.context import CompiledContext, CompiledModuleContext, \
 
 _sentinel = object()
 
+_syntax_node_cache: MutableMapping[
+    Any,
+    Tuple[str, Optional[str], Any, Path, Optional[Tuple[int, int]]]
+] = weakref.WeakKeyDictionary()
+"""
+Maps modules, classes and code objects to the files and positions of their
+definitions. REPLs ask for the same objects again and again, also with new
+inference states. Entries are only valid as long as the name of the object
+and the file don't change. They don't keep syntax trees alive, the module
+is loaded again (usually from parso's cache) by every inference state.
+"""
+
 
 class MixedObject(ValueWrapper):
     """
@@ -149,14 +163,28 @@ class MixedObjectFilter(compiled.CompiledValueFilter):
         )
 
 
-@inference_state_function_cache()
 def _load_module(inference_state, path):
-    return inference_state.parse(
+    """
+    Returns the module node and the code lines of a file. The code lines are
+    kept with the module node, because parso might remove the module from
+    its cache while the inference state still uses it.
+    """
+    # The stats are part of the key, because an inference state might be used
+    # for a long time (see ``jedi.InterpreterSession``) and modules might be
+    # changed and reloaded in the meantime.
+    stats, = get_path_stats([path])
+    return _load_module_with_stats(inference_state, path, stats)
+
+
+@inference_state_function_cache()
+def _load_module_with_stats(inference_state, path, stats):
+    module_node = inference_state.parse(
         path=path,
         cache=True,
         diff_cache=settings.fast_parser,
         cache_path=settings.cache_directory
     ).get_root_node()
+    return module_node, get_cached_code_lines(inference_state.grammar, path)
 
 
 def _get_object_to_check(python_object):
@@ -186,6 +214,71 @@ def _find_syntax_node_name(inference_state, python_object):
     original_object = python_object
     try:
         python_object = _get_object_to_check(python_object)
+    except TypeError:
+        # The type might not be known (e.g. class_with_dict.__weakref__)
+        return None
+
+    result = _get_cached_syntax_node(inference_state, python_object)
+    if result is _sentinel:
+        result = _search_syntax_node(inference_state, python_object)
+    if result is None:
+        return None
+
+    path, module_node, code_lines, tree_node = result
+    if tree_node.type == 'funcdef' and get_api_type(original_object) == 'instance':
+        # If an instance is given and we're landing on a function (e.g.
+        # partial in 3.5), something is completely wrong and we should not
+        # return that.
+        return None
+    return module_node, tree_node, FileIO(path), code_lines
+
+
+def _get_cache_key(python_object):
+    # Functions are created again and again (e.g. closures and bound
+    # methods), but their code objects stay the same.
+    if inspect.isfunction(python_object) or inspect.ismethod(python_object):
+        return python_object.__code__
+    return python_object
+
+
+def _get_cached_syntax_node(inference_state, python_object):
+    try:
+        entry = _syntax_node_cache[_get_cache_key(python_object)]
+    except (KeyError, TypeError):
+        # TypeError: Not all objects can be weakly referenced.
+        return _sentinel
+
+    hashed_grammar, name, stats, path, position = entry
+    if hashed_grammar != inference_state.grammar._hashed \
+            or name != getattr(python_object, '__name__', None) \
+            or get_path_stats([path]) != [stats]:
+        return _sentinel
+    module_node, code_lines = _load_module_with_stats(inference_state, path, stats)
+    if position is None:
+        return path, module_node, code_lines, module_node
+    leaf = module_node.get_leaf_for_position(position)
+    if leaf is None or leaf.type != 'name' or leaf.parent.type not in ('funcdef', 'classdef'):
+        return _sentinel
+    return path, module_node, code_lines, leaf.parent
+
+
+def _search_syntax_node(inference_state, python_object):
+    result = _search_syntax_node_in_file(inference_state, python_object)
+    if result is not None:
+        path, module_node, code_lines, tree_node = result
+        position = None if tree_node is module_node else tree_node.name.start_pos
+        stats, = get_path_stats([path])
+        entry = (inference_state.grammar._hashed, getattr(python_object, '__name__', None),
+                 stats, path, position)
+        try:
+            _syntax_node_cache[_get_cache_key(python_object)] = entry
+        except TypeError:
+            pass
+    return result
+
+
+def _search_syntax_node_in_file(inference_state, python_object):
+    try:
         path = inspect.getsourcefile(python_object)
     except TypeError:
         # The type might not be known (e.g. class_with_dict.__weakref__)
@@ -202,15 +295,13 @@ def _find_syntax_node_name(inference_state, python_object):
         #     syntax is incorrect: '<string>'
         return None
 
-    file_io = FileIO(path)
-    module_node = _load_module(inference_state, path)
+    module_node, code_lines = _load_module(inference_state, path)
 
     if inspect.ismodule(python_object):
         # We don't need to check names for modules, because there's not really
         # a way to write a module in a module in Python (and also __name__ can
         # be something like ``email.utils``).
-        code_lines = get_cached_code_lines(inference_state.grammar, path)
-        return module_node, module_node, file_io, code_lines
+        return path, module_node, code_lines, module_node
 
     try:
         name_str = python_object.__name__
@@ -249,27 +340,69 @@ def _find_syntax_node_name(inference_state, python_object):
         if line_names:
             names = line_names
 
-    code_lines = get_cached_code_lines(inference_state.grammar, path)
     # It's really hard to actually get the right definition, here as a last
     # resort we just return the last one. This chance might lead to odd
     # completions at some points but will lead to mostly correct type
     # inference, because people tend to define a public name in a module only
     # once.
-    tree_node = names[-1].parent
-    if tree_node.type == 'funcdef' and get_api_type(original_object) == 'instance':
-        # If an instance is given and we're landing on a function (e.g.
-        # partial in 3.5), something is completely wrong and we should not
-        # return that.
-        return None
-    return module_node, tree_node, file_io, code_lines
+    return path, module_node, code_lines, names[-1].parent
 
 
-@inference_state_function_cache()
-def _create(inference_state, compiled_value, module_context):
+def _get_syntax_node_info(inference_state, compiled_value):
+    """
+    Caches :func:`_find_syntax_node_name` for the object of a compiled value.
+    The results are valid as long as the file of the object doesn't change.
+    """
+    try:
+        result, stats = inference_state.mixed_cache[compiled_value]
+    except KeyError:
+        pass
+    else:
+        if result is None or get_path_stats([result[2].path]) == stats:
+            return result
+
     # TODO accessing this is bad, but it probably doesn't matter that much,
     # because we're working with interpreteters only here.
     python_object = compiled_value.access_handle.access._obj
     result = _find_syntax_node_name(inference_state, python_object)
+    stats = None if result is None else get_path_stats([result[2].path])
+    inference_state.mixed_cache[compiled_value] = result, stats
+    return result
+
+
+def _get_module_value(inference_state, root_compiled_value, module_node, path, code_lines):
+    """
+    All objects of a module share a module value, so that the module is only
+    inferred once.
+    """
+    # The code lines are not part of the key, they belong to the module node.
+    cache = inference_state.memoize_cache.setdefault(_get_module_value, {})
+    key = root_compiled_value, module_node, path
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    # TODO this __name__ might be wrong.
+    name = root_compiled_value.py__name__()
+    string_names = tuple(name.split('.'))
+    module_value = ModuleValue(
+        inference_state, module_node,
+        file_io=FileIO(path),
+        string_names=string_names,
+        code_lines=code_lines,
+        is_package=root_compiled_value.is_package(),
+    )
+    if name is not None:
+        inference_state.module_cache.add(string_names, ValueSet([module_value]))
+    cache[key] = module_value
+    return module_value
+
+
+@inference_state_function_cache()
+def _create(inference_state, compiled_value, module_context):
+    python_object = compiled_value.access_handle.access._obj
+    result = _get_syntax_node_info(inference_state, compiled_value)
     if result is None:
         # TODO Care about generics from stuff like `[1]` and don't return like this.
         if type(python_object) in (dict, list, tuple):
@@ -282,19 +415,13 @@ def _create(inference_state, compiled_value, module_context):
         module_node, tree_node, file_io, code_lines = result
 
         if module_context is None or module_context.tree_node != module_node:
-            root_compiled_value = compiled_value.get_root_context().get_value()
-            # TODO this __name__ might be wrong.
-            name = root_compiled_value.py__name__()
-            string_names = tuple(name.split('.'))
-            module_value = ModuleValue(
-                inference_state, module_node,
-                file_io=file_io,
-                string_names=string_names,
-                code_lines=code_lines,
-                is_package=root_compiled_value.is_package(),
+            module_value = _get_module_value(
+                inference_state,
+                compiled_value.get_root_context().get_value(),
+                module_node,
+                file_io.path,
+                code_lines,
             )
-            if name is not None:
-                inference_state.module_cache.add(string_names, ValueSet([module_value]))
             module_context = module_value.as_context()
 
         tree_values = ValueSet({module_context.create_value(tree_node)})
@@ -0,0 +1,183 @@
+"""
+Generates stubs (the contents of ``.pyi`` files) for compiled modules that
+don't have stubs in typeshed. This runs in the subprocess of an environment.
+
+The generated stubs are only as good as the introspection of the module:
+Signatures come from ``inspect.signature`` (i.e. ``__text_signature__`` for
+most C functions) and the types of constants from their values. Everything
+that cannot be expressed is simply left out or annotated with ``Any``.
+"""
+import builtins
+import inspect
+import keyword
+import types
+
+_INDENTATION = '    '
+_IGNORED_CLASS_ATTRIBUTES = ('__doc__', '__module__', '__dict__', '__weakref__',
+                             '__slots__', '__qualname__', '__annotations__')
+_CLASS_METHOD_TYPES = (classmethod, type(dict.__dict__['fromkeys']))
+
+
+def generate_stub(module):
+    """
+    Returns the code of a stub for a module object.
+    """
+    return _StubGenerator(module).generate()
+
+
+def _is_identifier(string):
+    return isinstance(string, str) and string.isidentifier() \
+        and not keyword.iskeyword(string)
+
+
+def _is_dotted_name(string):
+    return isinstance(string, str) and all(_is_identifier(n) for n in string.split('.'))
+
+
+def _is_dunder(name):
+    return name.startswith('__') and name.endswith('__')
+
+
+def _safe_getattr(obj, name):
+    try:
+        return getattr(obj, name)
+    except Exception:
+        return None
+
+
+class _StubGenerator:
+    def __init__(self, module):
+        self._module = module
+        self._module_name = module.__name__
+        self._imports = set()
+
+    def generate(self):
+        body = []
+        for name in dir(self._module):
+            if not _is_identifier(name) or _is_dunder(name):
+                continue
+            try:
+                obj = getattr(self._module, name)
+            except Exception:
+                continue
+            body += self._get_module_attribute_lines(name, obj)
+
+        header = sorted(self._imports)
+        if header:
+            header.append('')
+        return '\n'.join(header + body).strip('\n') + '\n'
+
+    def _get_module_attribute_lines(self, name, obj):
+        if inspect.ismodule(obj):
+            module_name = _safe_getattr(obj, '__name__')
+            if _is_dotted_name(module_name):
+                return ['import %s as %s' % (module_name, name)]
+            return []
+
+        if inspect.isclass(obj):
+            if obj.__module__ == self._module_name and obj.__name__ == name:
+                return self._get_class_lines(name, obj)
+            module_name = _safe_getattr(obj, '__module__')
+            qualname = _safe_getattr(obj, '__qualname__')
+            if _is_dotted_name(module_name) and _is_identifier(qualname):
+                if module_name == self._module_name:
+                    return ['%s = %s' % (name, qualname)]
+                return ['from %s import %s as %s' % (module_name, qualname, name)]
+            return []
+
+        if callable(obj):
+            return self._get_function_lines(name, obj)
+        return ['%s: %s' % (name, self._get_type_string(type(obj)))]
+
+    def _get_class_lines(self, name, cls):
+        bases = [self._get_type_string(base, default=None) for base in cls.__bases__]
+        bases = [b for b in bases if b not in (None, 'object')]
+        lines = ['', 'class %s%s:' % (name, '(%s)' % ', '.join(bases) if bases else '')]
+
+        body = []
+        for attribute_name, raw in list(cls.__dict__.items()):
+            if not _is_identifier(attribute_name) \
+                    or attribute_name in _IGNORED_CLASS_ATTRIBUTES:
+                continue
+            if isinstance(raw, staticmethod):
+                body += ['@staticmethod']
+                body += self._get_function_lines(attribute_name, raw.__func__)
+            elif isinstance(raw, _CLASS_METHOD_TYPES):
+                body += ['@classmethod']
+                body += self._get_function_lines(
+                    attribute_name, _safe_getattr(cls, attribute_name), first_param='cls')
+            elif isinstance(raw, (property, types.GetSetDescriptorType,
+                                  types.MemberDescriptorType)):
+                body.append('%s: Any' % attribute_name)
+                self._imports.add('from typing import Any')
+            elif callable(raw):
+                body += self._get_function_lines(attribute_name, raw)
+            elif not _is_dunder(attribute_name):
+                body.append('%s: %s' % (attribute_name, self._get_type_string(type(raw))))
+
+        lines += [_INDENTATION + line for line in body or ['...']]
+        return lines + ['']
+
+    def _get_function_lines(self, name, func, first_param=None):
+        try:
+            signature = inspect.signature(func)
+        except Exception:
+            params = '*args, **kwargs'
+            if first_param is not None:
+                params = first_param + ', ' + params
+            return ['def %s(%s): ...' % (name, params)]
+
+        params = []
+        if first_param is not None:
+            params.append(first_param)
+        previous_kind = None
+        for param in signature.parameters.values():
+            # Stubs are parsed with a grammar that doesn't know about
+            # positional only parameters (``/``), so they are left out.
+            kind = param.kind
+            if kind == param.KEYWORD_ONLY \
+                    and previous_kind not in (param.VAR_POSITIONAL, param.KEYWORD_ONLY):
+                params.append('*')
+            params.append(self._get_param_string(param))
+            previous_kind = kind
+
+        string = 'def %s(%s)' % (name, ', '.join(params))
+        if inspect.isclass(signature.return_annotation) \
+                and signature.return_annotation is not signature.empty:
+            return_string = self._get_type_string(signature.return_annotation, default=None)
+            if return_string is not None:
+                string += ' -> ' + return_string
+        return [string + ': ...']
+
+    def _get_param_string(self, param):
+        string = param.name
+        if param.kind == param.VAR_POSITIONAL:
+            string = '*' + string
+        elif param.kind == param.VAR_KEYWORD:
+            string = '**' + string
+
+        annotation = None
+        if inspect.isclass(param.annotation) and param.annotation is not param.empty:
+            annotation = self._get_type_string(param.annotation, default=None)
+        if annotation is not None:
+            string += ': ' + annotation
+        if param.default is not param.empty:
+            string += ' = ...' if annotation is not None else '=...'
+        return string
+
+    def _get_type_string(self, cls, default='Any'):
+        module_name = _safe_getattr(cls, '__module__')
+        qualname = _safe_getattr(cls, '__qualname__')
+        if _is_dotted_name(module_name) and _is_identifier(qualname):
+            if module_name == self._module_name:
+                return qualname
+            if module_name != 'builtins':
+                self._imports.add('import ' + module_name)
+                return module_name + '.' + qualname
+            # Some types like PyCapsule are not accessible in builtins.
+            if getattr(builtins, qualname, None) is cls:
+                return qualname
+
+        if default == 'Any':
+            self._imports.add('from typing import Any')
+        return default
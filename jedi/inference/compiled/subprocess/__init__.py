@@ -10,7 +10,9 @@ goals:
 import os
 import sys
 import queue
+import itertools
 import subprocess
+import time
 import traceback
 import weakref
 from functools import partial
@@ -22,11 +24,17 @@ from jedi.cache import memoize_method
 from jedi.inference.compiled.subprocess import functions
 from jedi.inference.compiled.access import DirectObjectAccess, AccessPath, \
     SignatureParam
+from jedi.inference.compiled.introspection_cache import PERSISTED_METHODS, \
+    get_introspection_table, save_introspection_tables
 from jedi.api.exceptions import InternalError
 
 
 _MAIN_PATH = os.path.join(os.path.dirname(__file__), '__main__.py')
 PICKLE_PROTOCOL = 4
+_FREE_RESTARTS = 3
+_RESTART_DELAY = 0.5
+_MAX_RESTART_DELAY = 30
+_HEALTHY_RUNTIME = 60
 
 
 def _GeneralizedPopen(*args, **kwargs):
@@ -82,6 +90,12 @@ def _cleanup_process(process, thread):
 
 
 class _InferenceStateProcess:
+    fetch_attributes_in_bulk = False
+    """
+    Whether the attributes of modules and classes should be requested all at
+    once, see ``DirectObjectAccess.get_attribute_table``.
+    """
+
     def __init__(self, inference_state):
         self._inference_state_weakref = weakref.ref(inference_state)
         self._inference_state_id = id(inference_state)
@@ -103,6 +117,12 @@ class _InferenceStateProcess:
     def set_access_handle(self, handle):
         self._handles[handle.id] = handle
 
+    def get_introspection_table(self, dotted_name, module_path):
+        """
+        Objects of the same process might change, so nothing is persisted.
+        """
+        return None
+
 
 class InferenceStateSameProcess(_InferenceStateProcess):
     """
@@ -110,15 +130,61 @@ class InferenceStateSameProcess(_InferenceStateProcess):
     as InferenceStateSubprocess and does the same thing without using a subprocess.
     This is necessary for the Interpreter process.
     """
+    def __init__(self, inference_state):
+        super().__init__(inference_state)
+        self._current_parent = None
+        self.handle_created_callback = None
+        """
+        Called with every new handle and the handle of the object whose method
+        created it (None if it wasn't created by a method), see
+        ``jedi.api.interpreter.SessionState``.
+        """
+
     def __getattr__(self, name):
-        return partial(_get_function(name), self._inference_state_weakref())
+        func = partial(_get_function(name), self._inference_state_weakref())
+        if name == 'get_compiled_method_return':
+            return partial(self._get_compiled_method_return, func)
+        return func
+
+    def _get_compiled_method_return(self, func, handle, *args, **kwargs):
+        outer_parent, self._current_parent = self._current_parent, handle
+        try:
+            return func(handle, *args, **kwargs)
+        finally:
+            self._current_parent = outer_parent
+
+    def set_access_handle(self, handle):
+        super().set_access_handle(handle)
+        if self.handle_created_callback is not None:
+            self.handle_created_callback(handle, self._current_parent)
 
 
 class InferenceStateSubprocess(_InferenceStateProcess):
+    """
+    If the subprocess crashes, the call that was running raises an
+    ``InternalError``. The next call starts a new subprocess (see
+    ``Environment._get_subprocess``) and recreates the objects of the access
+    handles that are still alive by repeating the calls that created them.
+    Handles are identified by the ids of their objects in the subprocess, so
+    the handles keep working with new ids.
+    """
+    # Every call is a round trip.
+    fetch_attributes_in_bulk = True
+
     def __init__(self, inference_state, compiled_subprocess):
         super().__init__(inference_state)
         self._used = False
         self._compiled_subprocess = compiled_subprocess
+        # Handles that are not used anymore are released.
+        self._handles = weakref.WeakValueDictionary()
+        # The calls (function, args, kwargs) that created handles that are
+        # still alive with the locations of the handles in their results (and
+        # weak references to them). Ordered by key, because the arguments of
+        # calls might be handles of previous calls.
+        self._handle_origins = {}
+        self._live_handle_counts = {}
+        self._origin_keys = itertools.count()
+        weakref.finalize(self, save_introspection_tables)
 
     def __getattr__(self, name):
         func = _get_function(name)
@@ -126,26 +192,82 @@ class InferenceStateSubprocess(_InferenceStateProcess):
         def wrapper(*args, **kwargs):
             self._used = True
 
-            result = self._compiled_subprocess.run(
-                self._inference_state_weakref(),
-                func,
-                args=args,
-                kwargs=kwargs,
-            )
+            result = self._run(func, args, kwargs)
             # IMO it should be possible to create a hook in pickle.load to
             # mess with the loaded objects. However it's extremely complicated
             # to work around this so just do it with this call. ~ dave
-            return self._convert_access_handles(result)
+            new_handles = []
+            result = self._convert_access_handles(result, new_handles)
+            if new_handles:
+                self._add_handle_origin(func, args, kwargs, new_handles)
+            return result
 
         return wrapper
 
-    def _convert_access_handles(self, obj):
+    def _add_handle_origin(self, func, args, kwargs, new_handles):
+        key = next(self._origin_keys)
+        # The callback doesn't reference self, the handles would otherwise
+        # keep this object alive.
+        callback = partial(_release_handle_origin, weakref.ref(self), key)
+        handle_refs = [(location, weakref.ref(handle, callback))
+                       for location, handle in new_handles]
+        self._handle_origins[key] = func, args, kwargs, handle_refs
+        self._live_handle_counts[key] = len(handle_refs)
+
+    def release_handle_origin(self, key):
+        self._live_handle_counts[key] -= 1
+        if not self._live_handle_counts[key]:
+            del self._live_handle_counts[key]
+            del self._handle_origins[key]
+
+    def _run(self, func, args, kwargs):
+        if self._compiled_subprocess.is_crashed:
+            self._restart()
+        return self._compiled_subprocess.run(
+            self._inference_state_weakref(),
+            func,
+            args=args,
+            kwargs=kwargs,
+        )
+
+    def _restart(self):
+        inference_state = self._inference_state_weakref()
+        compiled_subprocess = inference_state.environment._get_subprocess()
+        debug.warning('Restarted the crashed subprocess, restoring %s access handles',
+                      len(self._handles))
+        handles = weakref.WeakValueDictionary()
+        for func, args, kwargs, handle_refs in list(self._handle_origins.values()):
+            try:
+                result = compiled_subprocess.run(inference_state, func, args, kwargs)
+            except Exception as e:
+                if compiled_subprocess.is_crashed:
+                    # The new subprocess died as well. The crashed one is
+                    # kept, so the next call tries again.
+                    raise
+                # The subprocess doesn't behave like before. Nothing can be
+                # done about it, this inference state is lost.
+                raise InternalError("Could not restore the access handles after a "
+                                    "restart of the subprocess: %r" % e)
+            for location, handle_ref in handle_refs:
+                handle = handle_ref()
+                if handle is not None:
+                    handle.id = _get_at_location(result, location).id
+                    handles[handle.id] = handle
+        self._compiled_subprocess = compiled_subprocess
+        self._handles = handles
+
+    def _convert_access_handles(self, obj, new_handles, location=()):
         if isinstance(obj, SignatureParam):
-            return SignatureParam(*self._convert_access_handles(tuple(obj)))
+            return SignatureParam(*self._convert_access_handles(tuple(obj), new_handles, location))
         elif isinstance(obj, tuple):
-            return tuple(self._convert_access_handles(o) for o in obj)
+            return tuple(self._convert_access_handles(o, new_handles, location + (i,))
+                         for i, o in enumerate(obj))
         elif isinstance(obj, list):
-            return [self._convert_access_handles(o) for o in obj]
+            return [self._convert_access_handles(o, new_handles, location + (i,))
+                    for i, o in enumerate(obj)]
+        elif isinstance(obj, dict):
+            return dict((k, self._convert_access_handles(v, new_handles, location + (k,)))
+                        for k, v in obj.items())
         elif isinstance(obj, AccessHandle):
             try:
                 # Rewrite the access handle to one we're already having.
@@ -153,23 +275,71 @@ class InferenceStateSubprocess(_InferenceStateProcess):
             except KeyError:
                 obj.add_subprocess(self)
                 self.set_access_handle(obj)
+                new_handles.append((location, obj))
         elif isinstance(obj, AccessPath):
-            return AccessPath(self._convert_access_handles(obj.accesses))
+            return AccessPath(self._convert_access_handles(obj.accesses, new_handles, location))
         return obj
 
+    def get_introspection_table(self, dotted_name, module_path):
+        environment = self._inference_state_weakref().environment
+        return get_introspection_table(environment._sha256, dotted_name, module_path)
+
     def __del__(self):
         if self._used and not self._compiled_subprocess.is_crashed:
             self._compiled_subprocess.delete_inference_state(self._inference_state_id)
 
 
+def _release_handle_origin(subprocess_ref, key, handle_ref):
+    subprocess = subprocess_ref()
+    if subprocess is not None:
+        subprocess.release_handle_origin(key)
+
+
+def _get_at_location(obj, location):
+    """
+    The reverse of the locations in ``_convert_access_handles``.
+    """
+    for key in location:
+        if isinstance(obj, AccessPath):
+            obj = obj.accesses
+        elif isinstance(obj, SignatureParam):
+            obj = tuple(obj)
+        obj = obj[key]
+    if not isinstance(obj, AccessHandle):
+        raise TypeError("Expected an access handle, got %r" % obj)
+    return obj
+
+
 class CompiledSubprocess:
     is_crashed = False
+    crash_time = None
 
-    def __init__(self, executable, env_vars=None):
+    def __init__(self, executable, env_vars=None, restarts=0):
         self._executable = executable
         self._env_vars = env_vars
         self._inference_state_deletion_queue = queue.deque()
         self._cleanup_callable = lambda: None
+        self._start_time = time.time()
+        self.restarts = restarts
+        """
+        The number of predecessors that crashed shortly after they started.
+        """
+
+    def get_restart_delay(self):
+        """
+        Returns the number of seconds to wait until a crashed subprocess may
+        be replaced. Subprocesses that crash again and again (e.g. because an
+        import segfaults) are restarted with an exponential backoff.
+        """
+        if self.restarts < _FREE_RESTARTS:
+            return 0
+        delay = min(_MAX_RESTART_DELAY, _RESTART_DELAY * 2 ** (self.restarts - _FREE_RESTARTS))
+        return self.crash_time + delay - time.time()
+
+    def get_successor_restarts(self):
+        if self.crash_time - self._start_time < _HEALTHY_RUNTIME:
+            return self.restarts + 1
+        return 0
 
     def __repr__(self):
         pid = os.getpid()
@@ -230,6 +400,7 @@ class CompiledSubprocess:
 
     def _kill(self):
         self.is_crashed = True
+        self.crash_time = time.time()
         self._cleanup_callable()
 
     def _send(self, inference_state_id, function, args=(), kwargs={}):
@@ -347,10 +518,18 @@ class Listener:
 
 
 class AccessHandle:
+    introspection_key = None
+    """
+    A tuple of an introspection table and the attribute names that lead from
+    the table's module to this object. Set if the results of the object can be
+    persisted.
+    """
+
     def __init__(self, subprocess, access, id_):
         self.access = access
         self._subprocess = subprocess
         self.id = id_
+        self._known_results = {}
 
     def add_subprocess(self, subprocess):
         self._subprocess = subprocess
@@ -367,6 +546,16 @@ class AccessHandle:
 
     def __setstate__(self, state):
         self.id = state
+        self._known_results = {}
+
+    def add_known_results(self, results):
+        """
+        Adds results that were sent in bulk (see
+        ``DirectObjectAccess.get_attribute_table``), so that they don't need
+        to be requested one by one. ``results`` maps tuples of method names and
+        arguments to results.
+        """
+        self._known_results.update(results)
 
     def __getattr__(self, name):
         if name in ('id', 'access') or name.startswith('_'):
@@ -382,9 +571,26 @@ class AccessHandle:
         around.
         """
         if args and isinstance(args[0], slice):
-            return self._subprocess.get_compiled_method_return(self.id, name, *args, **kwargs)
+            return self._subprocess.get_compiled_method_return(self, name, *args, **kwargs)
         return self._cached_results(name, *args, **kwargs)
 
     @memoize_method
     def _cached_results(self, name, *args, **kwargs):
-        return self._subprocess.get_compiled_method_return(self.id, name, *args, **kwargs)
+        if kwargs:
+            return self._subprocess.get_compiled_method_return(self, name, *args, **kwargs)
+
+        table = None
+        if self.introspection_key is not None and name in PERSISTED_METHODS:
+            table, attribute_names = self.introspection_key
+            try:
+                return table.get(attribute_names, name, args)
+            except KeyError:
+                pass
+
+        try:
+            result = self._known_results.pop((name, args))
+        except KeyError:
+            result = self._subprocess.get_compiled_method_return(self, name, *args)
+        if table is not None:
+            table.set(attribute_names, name, args, result)
+        return result
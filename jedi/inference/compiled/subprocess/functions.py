@@ -9,6 +9,7 @@ from importlib.machinery import all_suffixes
 
 from jedi._compatibility import cast_path
 from jedi.inference.compiled import access
+from jedi.inference.compiled.stubgen import generate_stub as _generate_stub
 from jedi import debug
 from jedi import parser_utils
 from jedi.file_io import KnownContentFileIO, ZipFileIO
@@ -22,8 +23,7 @@ def load_module(inference_state, **kwargs):
     return access.load_module(inference_state, **kwargs)
 
 
-def get_compiled_method_return(inference_state, id, attribute, *args, **kwargs):
-    handle = inference_state.compiled_subprocess.get_access_handle(id)
+def get_compiled_method_return(inference_state, handle, attribute, *args, **kwargs):
     return getattr(handle.access, attribute)(*args, **kwargs)
 
 
@@ -31,6 +31,17 @@ def create_simple_object(inference_state, obj):
     return access.create_access_path(inference_state, obj)
 
 
+def generate_stub(inference_state, dotted_name):
+    """
+    Returns the code of a stub for an already imported module or None.
+    """
+    try:
+        module = sys.modules[dotted_name]
+    except KeyError:
+        return None
+    return _generate_stub(module)
+
+
 def get_module_info(inference_state, sys_path=None, full_name=None, **kwargs):
     """
     Returns Tuple[Union[NamespaceInfo, FileIO, None], Optional[bool]]
@@ -46,6 +57,23 @@ def get_module_info(inference_state, sys_path=None, full_name=None, **kwargs):
             sys.path = temp
 
 
+def get_module_infos(inference_state, sys_path, names):
+    """
+    Does a global search for multiple modules at once and returns a list of
+    the results of :func:`get_module_info`.
+    """
+    return [
+        get_module_info(
+            inference_state,
+            sys_path=sys_path,
+            string=name,
+            full_name=name,
+            is_global_search=True,
+        )
+        for name in names
+    ]
+
+
 def get_builtin_module_names(inference_state):
     return sys.builtin_module_names
 
@@ -89,6 +117,14 @@ def iter_module_names(*args, **kwargs):
     return list(_iter_module_names(*args, **kwargs))
 
 
+def get_module_names_per_directory(inference_state, paths):
+    """
+    Like :func:`iter_module_names`, but returns a list of names for every
+    path.
+    """
+    return [list(_iter_module_names(inference_state, [path])) for path in paths]
+
+
 def _iter_module_names(inference_state, paths):
     # Python modules/packages
     for path in paths:
@@ -2,6 +2,7 @@
 Imitate the parser representation.
 """
 import re
+import sys
 from functools import partial
 from inspect import Parameter
 from pathlib import Path
@@ -317,11 +318,18 @@ class CompiledModule(CompiledValue):
 
 
 class CompiledName(AbstractNameDefinition):
-    def __init__(self, inference_state, parent_value, name):
+    __slots__ = ('_inference_state', 'parent_context', '_parent_value', 'string_name',
+                 '_known_results', '_memoize_method_dct')
+
+    def __init__(self, inference_state, parent_value, name, known_results=None):
         self._inference_state = inference_state
         self.parent_context = parent_value.as_context()
         self._parent_value = parent_value
-        self.string_name = name
+        # Names are coming from the subprocess and would otherwise be
+        # separate string objects for every single lookup.
+        self.string_name = sys.intern(str(name))
+        # Results of an attribute table, see ``CompiledValueFilter``.
+        self._known_results = known_results
 
     def py__doc__(self):
         value, = self.infer()
@@ -349,6 +357,9 @@ class CompiledName(AbstractNameDefinition):
 
     @property
     def api_type(self):
+        if self._known_results is not None and ('get_api_type', ()) in self._known_results:
+            # Avoids creating an access handle, e.g. for completions.
+            return self._known_results['get_api_type', ()]
         api = self.infer()
         # If we can't find the type, assume it is an instance variable
         if not api:
@@ -360,10 +371,15 @@ class CompiledName(AbstractNameDefinition):
         return ValueSet([self.infer_compiled_value()])
 
     def infer_compiled_value(self):
-        return create_from_name(self._inference_state, self._parent_value, self.string_name)
+        value = create_from_name(self._inference_state, self._parent_value, self.string_name)
+        if self._known_results is not None:
+            value.access_handle.add_known_results(dict(self._known_results))
+        return value
 
 
 class SignatureParamName(ParamNameInterface, AbstractNameDefinition):
+    __slots__ = ('parent_context', '_signature_param')
+
     def __init__(self, compiled_value, signature_param):
         self.parent_context = compiled_value.parent_context
         self._signature_param = signature_param
@@ -396,6 +412,8 @@ class SignatureParamName(ParamNameInterface, AbstractNameDefinition):
 
 
 class UnresolvableParamName(ParamNameInterface, AbstractNameDefinition):
+    __slots__ = ('parent_context', 'string_name', '_default')
+
     def __init__(self, compiled_value, name, default):
         self.parent_context = compiled_value.parent_context
         self.string_name = name
@@ -415,6 +433,8 @@ class UnresolvableParamName(ParamNameInterface, AbstractNameDefinition):
 
 
 class CompiledValueName(ValueNameMixin, AbstractNameDefinition):
+    __slots__ = ('string_name', '_value', 'parent_context')
+
     def __init__(self, value, name):
         self.string_name = name
         self._value = value
@@ -436,12 +456,28 @@ class EmptyCompiledName(AbstractNameDefinition):
 
 
 class CompiledValueFilter(AbstractFilter):
+    _BULK_LOOKUP_THRESHOLD = 3
+
     def __init__(self, inference_state, compiled_value, is_instance=False):
         self._inference_state = inference_state
         self.compiled_value = compiled_value
         self.is_instance = is_instance
+        self._looked_up_names = set()
+        self._attribute_results = None
 
     def get(self, name):
+        if self._use_attribute_table(name):
+            # Modules and classes are usually looked up a lot, so all their
+            # attributes are fetched at once.
+            dir_infos = self._get_attribute_table()[1]
+            if name in dir_infos:
+                return self._get(
+                    name,
+                    lambda name, unsafe: dir_infos[name],
+                    lambda name: name in dir_infos,
+                    check_has_attribute=True
+                )
+
         access_handle = self.compiled_value.access_handle
         return self._get(
             name,
@@ -479,10 +515,19 @@ class CompiledValueFilter(AbstractFilter):
         else:
             return self._create_name(name)
 
+    def _get_known_results(self, name):
+        if self._attribute_results is None:
+            return None
+        return self._attribute_results.get(name)
+
     def values(self):
         from jedi.inference.compiled import builtin_from_name
         names = []
-        needs_type_completions, dir_infos = self.compiled_value.access_handle.get_dir_infos()
+        if self._fetch_attributes_in_bulk():
+            needs_type_completions, dir_infos = self._get_attribute_table()
+        else:
+            needs_type_completions, dir_infos = \
+                self.compiled_value.access_handle.get_dir_infos()
         # We could use `unsafe` here as well, especially as a parameter to
         # get_dir_infos. But this would lead to a lot of property executions
         # that are probably not wanted. The drawback for this is that we
@@ -501,11 +546,49 @@ class CompiledValueFilter(AbstractFilter):
                 names += filter.values()
         return names
 
+    def _use_attribute_table(self, name):
+        """
+        Fetching all attributes is only worth it if a value is looked up a few
+        times. A single ``True`` from ``builtins`` shouldn't fetch the infos of
+        all builtins.
+        """
+        if not self._fetch_attributes_in_bulk():
+            return False
+        if self._looked_up_names is None:
+            # The table was already fetched.
+            return True
+        self._looked_up_names.add(name)
+        return len(self._looked_up_names) > self._BULK_LOOKUP_THRESHOLD
+
+    def _fetch_attributes_in_bulk(self):
+        return not self.is_instance \
+            and not self._inference_state.allow_descriptor_getattr \
+            and self._inference_state.compiled_subprocess.fetch_attributes_in_bulk
+
+    @memoize_method
+    def _get_attribute_table(self):
+        """
+        Fetches the infos of all attributes with one call. The results are
+        passed to the names, which avoids a few calls per attribute when the
+        names are inferred.
+        """
+        self._looked_up_names = None
+        access_handle = self.compiled_value.access_handle
+        needs_type_completions, table = access_handle.get_attribute_table()
+        dir_infos = {}
+        self._attribute_results = {}
+        for name, (dir_info, results) in table.items():
+            dir_infos[name] = dir_info
+            if results is not None:
+                self._attribute_results[name] = results
+        return needs_type_completions, dir_infos
+
     def _create_name(self, name):
         return CompiledName(
             self._inference_state,
             self.compiled_value,
-            name
+            name,
+            known_results=self._get_known_results(name),
         )
 
     def __repr__(self):
@@ -582,7 +665,14 @@ def _parse_function_doc(doc):
 
 
 def create_from_name(inference_state, compiled_value, name):
-    access_paths = compiled_value.access_handle.getattr_paths(name, default=None)
+    # The default is passed positionally to match the results of attribute
+    # tables.
+    access_paths = compiled_value.access_handle.getattr_paths(name, None)
+    # Tests sometimes use DirectObjectAccess objects as handles.
+    introspection_key = getattr(compiled_value.access_handle, 'introspection_key', None)
+    if introspection_key is not None and access_paths[-1].introspection_key is None:
+        table, attribute_names = introspection_key
+        access_paths[-1].introspection_key = table, attribute_names + (name,)
 
     value = None
     for access_path in access_paths:
@@ -27,7 +27,8 @@ from jedi.inference.helpers import is_stdlib_path
 from jedi.inference.utils import to_list
 from jedi.inference.value import instance
 from jedi.inference.base_value import ValueSet, NO_VALUES
-from jedi.inference.references import get_module_contexts_containing_name
+from jedi.inference.references import get_module_contexts_calling_name
+from jedi.inference.call_sites import get_call_site_names
 from jedi.inference import recursion
 
 
@@ -117,16 +118,16 @@ def _search_function_arguments(module_context, funcdef, string_name):
     inference_state = module_context.inference_state
 
     if settings.dynamic_params_for_other_modules:
-        module_contexts = get_module_contexts_containing_name(
+        module_contexts = get_module_contexts_calling_name(
             inference_state, [module_context], string_name,
             # Limit the amounts of files to be opened massively.
             limit_reduction=5,
         )
     else:
-        module_contexts = [module_context]
+        module_contexts = [(module_context, None)]
 
-    for for_mod_context in module_contexts:
-        for name, trailer in _get_potential_nodes(for_mod_context, string_name):
+    for for_mod_context, positions in module_contexts:
+        for name, trailer in _get_potential_nodes(for_mod_context, string_name, positions):
             i += 1
 
             # This is a simple way to stop Jedi's dynamic param recursion
@@ -159,12 +160,8 @@ def _get_lambda_name(node):
     return None
 
 
-def _get_potential_nodes(module_value, func_string_name):
-    try:
-        names = module_value.tree_node.get_used_names()[func_string_name]
-    except KeyError:
-        return
-
+def _get_potential_nodes(module_value, func_string_name, positions=None):
+    names = get_call_site_names(module_value.tree_node, func_string_name, positions)
     for name in names:
         bracket = name.get_next_leaf()
         trailer = bracket.parent
@@ -1,4 +1,7 @@
-from typing import Dict, Optional
+import weakref
+from typing import Any, Dict, MutableMapping, Optional, Tuple
+
+from parso.python.tree import UsedNamesMapping
 
 from jedi.parser_utils import get_flow_branch_keyword, is_scope, get_parent_scope
 from jedi.inference.recursion import execution_allowed
@@ -35,6 +38,32 @@ REACHABLE = Status(True, 'reachable')
 UNREACHABLE = Status(False, 'unreachable')
 UNSURE = Status(None, 'unsure')
 
+_stub_reachability_cache: MutableMapping[
+    UsedNamesMapping,
+    Dict[Tuple[Any, ...], Status]
+]
+_stub_reachability_cache = weakref.WeakKeyDictionary()
+"""
+The reachability of nodes in stubs (e.g. in ``if sys.version_info >= (3, 8):``)
+and of the conditions it's made of only depends on the environment. The
+results are therefore shared between all inference states, which avoids
+checking the same flows of ``builtins``, ``typing`` and other stubs again for
+every request. Results are only stored if no recursion was stopped while
+inferring them.
+"""
+
+
+def _get_stub_reachability_cache(context):
+    """
+    Returns the shared cache of a stub module and the key of the environment.
+    """
+    module_context = context.get_root_context()
+    if not module_context.is_stub():
+        return None, None
+    environment = context.inference_state.environment
+    cache = _stub_reachability_cache.setdefault(module_context.tree_node.get_used_names(), {})
+    return cache, (environment.executable, tuple(environment.version_info))
+
 
 def _get_flow_scopes(node):
     while True:
@@ -82,44 +111,85 @@ def reachability_check(context, value_scope, node, origin_scope=None):
                 return REACHABLE
             origin_scope = origin_scope.parent
 
-    return _break_check(context, value_scope, first_flow_scope, node)
+    cache, environment_key = _get_stub_reachability_cache(context)
+    if cache is None:
+        return _break_check(context, value_scope, first_flow_scope, node)[0]
+
+    key = environment_key, value_scope, node
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    detector = context.inference_state.recursion_detector
+    refused_count = detector.refused_count
+    reachable, is_final = _break_check(context, value_scope, first_flow_scope, node)
+    if is_final and detector.refused_count == refused_count:
+        cache[key] = reachable
+    return reachable
 
 
 def _break_check(context, value_scope, flow_scope, node):
-    reachable = REACHABLE
+    """
+    Returns the status of a node and whether it is final, see
+    :func:`_infer_condition`.
+    """
+    reachable, is_final = REACHABLE, True
     if flow_scope.type == 'if_stmt':
         if flow_scope.is_node_after_else(node):
             for check_node in flow_scope.get_test_nodes():
-                reachable = _check_if(context, check_node)
+                reachable, is_final = _check_if(context, check_node)
                 if reachable in (REACHABLE, UNSURE):
                     break
             reachable = reachable.invert()
         else:
             flow_node = flow_scope.get_corresponding_test_node(node)
             if flow_node is not None:
-                reachable = _check_if(context, flow_node)
+                reachable, is_final = _check_if(context, flow_node)
     elif flow_scope.type in ('try_stmt', 'while_stmt'):
-        return UNSURE
+        return UNSURE, True
 
     # Only reachable branches need to be examined further.
     if reachable in (UNREACHABLE, UNSURE):
-        return reachable
+        return reachable, is_final
 
     if value_scope != flow_scope and value_scope != flow_scope.parent:
         flow_scope = get_parent_scope(flow_scope, include_flows=True)
-        return reachable & _break_check(context, value_scope, flow_scope, node)
+        parent_reachable, parent_is_final = _break_check(context, value_scope, flow_scope, node)
+        return reachable & parent_reachable, is_final and parent_is_final
     else:
-        return reachable
+        return reachable, is_final
 
 
 def _check_if(context, node):
+    cache, environment_key = _get_stub_reachability_cache(context)
+    if cache is None:
+        return _infer_condition(context, node)
+
+    key = environment_key, node
+    try:
+        return cache[key], True
+    except KeyError:
+        pass
+    detector = context.inference_state.recursion_detector
+    refused_count = detector.refused_count
+    reachable, is_final = _infer_condition(context, node)
+    if is_final and detector.refused_count == refused_count:
+        cache[key] = reachable
+    return reachable, is_final
+
+
+def _infer_condition(context, node):
+    """
+    Returns the status of a condition and whether it is final, i.e. not
+    caused by recursion limits or values that could not be inferred.
+    """
     with execution_allowed(context.inference_state, node) as allowed:
         if not allowed:
-            return UNSURE
+            return UNSURE, False
 
         types = context.infer_node(node)
         values = set(x.py__bool__() for x in types)
         if len(values) == 1:
-            return Status.lookup_table[values.pop()]
+            return Status.lookup_table[values.pop()], True
         else:
-            return UNSURE
+            return UNSURE, bool(values)
@@ -0,0 +1,173 @@
+"""
+Matching of paths against ``.gitignore`` files, used when walking projects
+(see :func:`jedi.inference.references.recurse_find_python_folders_and_files`).
+
+The patterns of a ``.gitignore`` file are compiled to regular expressions
+once and cached as long as the file doesn't change. The semantics follow git:
+
+- Blank lines and lines starting with ``#`` are ignored.
+- ``!`` negates a pattern, the last matching pattern wins.
+- A trailing ``/`` only matches directories.
+- Patterns containing a ``/`` (other than a trailing one) are relative to the
+  directory of the ``.gitignore`` file, all others match names in any
+  directory below it.
+- ``*``, ``?`` and ``[...]`` don't match ``/``. ``**`` matches any number of
+  directories.
+- Files in nested directories override the files of their parents.
+"""
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from jedi.cache import get_path_stats, is_recently_modified
+
+_compiled_files_cache: Dict[
+    str, Tuple[List[Optional[Tuple[int, int]]], List['_Pattern']]
+] = {}
+
+
+class _Pattern:
+    def __init__(self, regex, negated, only_directories):
+        self.regex = regex
+        self.negated = negated
+        self.only_directories = only_directories
+
+
+def _translate_glob(glob):
+    parts = []
+    i = 0
+    length = len(glob)
+    while i < length:
+        c = glob[i]
+        if c == '*':
+            if glob.startswith('**/', i):
+                parts.append('(?:.*/)?')
+                i += 3
+                continue
+            if glob.startswith('**', i) and i + 2 == length:
+                parts.append('.*')
+                i += 2
+                continue
+            parts.append('[^/]*')
+        elif c == '?':
+            parts.append('[^/]')
+        elif c == '[':
+            end = glob.find(']', i + 2 if glob.startswith('[!', i) else i + 1)
+            if end == -1:
+                parts.append(re.escape(c))
+            else:
+                content = glob[i + 1:end].replace('\\', '\\\\')
+                if content.startswith('!'):
+                    content = '^' + content[1:]
+                parts.append('[%s]' % content)
+                i = end
+        elif c == '\\' and i + 1 < length:
+            i += 1
+            parts.append(re.escape(glob[i]))
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return ''.join(parts)
+
+
+def _compile_line(line):
+    if line.startswith('#'):
+        return None
+    # Trailing spaces are ignored unless they are escaped.
+    stripped = line.rstrip(' ')
+    if stripped.endswith('\\') and len(stripped) < len(line):
+        stripped += ' '
+    line = stripped
+    if not line:
+        return None
+
+    negated = line.startswith('!')
+    if negated:
+        line = line[1:]
+    elif line.startswith('\\!') or line.startswith('\\#'):
+        line = line[1:]
+
+    only_directories = line.endswith('/')
+    line = line.rstrip('/')
+    if not line:
+        return None
+
+    if '/' in line:
+        regex = _translate_glob(line.lstrip('/'))
+    else:
+        regex = '(?:.*/)?' + _translate_glob(line)
+    return _Pattern(re.compile(regex + r'\Z', re.DOTALL), negated, only_directories)
+
+
+def compile_gitignore(code):
+    """
+    Returns the compiled patterns of the content of a ``.gitignore`` file.
+    """
+    patterns = []
+    for line in code.splitlines():
+        pattern = _compile_line(line)
+        if pattern is not None:
+            patterns.append(pattern)
+    return patterns
+
+
+def _load_gitignore(path):
+    stats = get_path_stats([path])
+    try:
+        cached_stats, patterns = _compiled_files_cache[path]
+    except KeyError:
+        pass
+    else:
+        if cached_stats == stats:
+            return patterns
+
+    try:
+        with open(path, 'rb') as f:
+            code = f.read().decode('utf-8', 'replace')
+    except OSError:
+        patterns = []
+    else:
+        patterns = compile_gitignore(code)
+    if not is_recently_modified(stats):
+        _compiled_files_cache[path] = stats, patterns
+    return patterns
+
+
+class GitIgnore:
+    """
+    The ``.gitignore`` patterns that apply to a directory, i.e. the patterns of
+    its own ``.gitignore`` file and the ones of its parents.
+    """
+    def __init__(self, folder_path, patterns, parent=None):
+        self._folder_path = folder_path
+        self._patterns = patterns
+        self._parent = parent
+
+    @classmethod
+    def from_folder(cls, folder_path, parent=None):
+        """
+        Adds the ``.gitignore`` file of a directory to the patterns of its
+        parent. Returns ``parent`` if there's no such file.
+        """
+        patterns = _load_gitignore(os.path.join(folder_path, '.gitignore'))
+        if not patterns:
+            return parent
+        return cls(folder_path, patterns, parent)
+
+    def is_ignored(self, path, is_directory):
+        """
+        Returns True if a path (in the directory of this object or below it)
+        is ignored.
+        """
+        gitignore = self
+        while gitignore is not None:
+            relative_path = os.path.relpath(path, gitignore._folder_path)
+            if os.path.sep != '/':
+                relative_path = relative_path.replace(os.path.sep, '/')
+            for pattern in reversed(gitignore._patterns):
+                if pattern.only_directories and not is_directory:
+                    continue
+                if pattern.regex.match(relative_path):
+                    return not pattern.negated
+            gitignore = gitignore._parent
+        return False
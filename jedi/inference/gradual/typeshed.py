@@ -6,12 +6,15 @@ from typing import Dict, Mapping, Tuple
 from pathlib import Path
 
 from jedi import settings
+from jedi.cache import get_persistent_cache_path, write_persistent_file, \
+    load_persistent_cache, save_persistent_cache
 from jedi.file_io import FileIO
 from jedi._compatibility import cast_path
 from jedi.parser_utils import get_cached_code_lines
 from jedi.inference.base_value import ValueSet, NO_VALUES
 from jedi.inference.gradual.stub_value import TypingModuleWrapper, StubModuleValue
 from jedi.inference.value import ModuleValue
+from jedi.inference.compiled.introspection_cache import get_module_version_key
 
 _jedi_path = Path(__file__).parent.parent.parent
 TYPESHED_PATH = _jedi_path.joinpath('third_party', 'typeshed')
@@ -23,6 +26,10 @@ _IMPORT_MAP = dict(
     _socket='socket',
 )
 
+_GENERATED_STUBS_NAMESPACE = 'generated_stubs'
+_STUB_MAP_NAMESPACE = 'typeshed_stub_map'
+_TYPESHED_BASES = ('stdlib', 'third_party')
+
 PathInfo = namedtuple('PathInfo', 'path is_third_party')
 
 
@@ -61,7 +68,7 @@ def _create_stub_map(directory_path_info):
 
 def _get_typeshed_directories(version_info):
     check_version_list = ['2and3', '3']
-    for base in ['stdlib', 'third_party']:
+    for base in _TYPESHED_BASES:
         base_path = TYPESHED_PATH.joinpath(base)
         base_list = os.listdir(base_path)
         for base_list_entry in base_list:
@@ -90,11 +97,42 @@ def _cache_stub_file_map(version_info):
     except KeyError:
         pass
 
-    _version_cache[version] = file_set = \
-        _merge_create_stub_map(_get_typeshed_directories(version_info))
+    _version_cache[version] = file_set = _load_stub_file_map(version_info)
     return file_set
 
 
+def _get_directory_stats(paths):
+    stats = []
+    for path in paths:
+        try:
+            stats.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stats.append(None)
+    return stats
+
+
+def _load_stub_file_map(version_info):
+    """
+    Listing all typeshed directories is slow on a cold file system cache. The
+    map is therefore stored in the cache directory and only recreated if one
+    of the typeshed directories changes.
+    """
+    key = str(TYPESHED_PATH), tuple(version_info[:2])
+    base_paths = [str(TYPESHED_PATH.joinpath(base)) for base in _TYPESHED_BASES]
+    cached = load_persistent_cache(_STUB_MAP_NAMESPACE, key)
+    if cached is not None:
+        directories, stats, map_ = cached
+        if _get_directory_stats(base_paths + directories) == stats:
+            return map_
+
+    path_infos = list(_get_typeshed_directories(version_info))
+    directories = [path_info.path for path_info in path_infos]
+    stats = _get_directory_stats(base_paths + directories)
+    map_ = _merge_create_stub_map(path_infos)
+    save_persistent_cache(_STUB_MAP_NAMESPACE, key, (directories, stats, map_))
+    return map_
+
+
 def import_module_decorator(func):
     @wraps(func)
     def wrapper(inference_state, import_names, parent_module_value, sys_path, prefer_stubs):
@@ -237,6 +275,11 @@ def _try_to_load_stub(inference_state, import_names, python_value_set,
             if m is not None:
                 return m
 
+    # 5. Try to generate a stub for compiled modules.
+    m = _load_generated_stub(inference_state, python_value_set, import_names)
+    if m is not None:
+        return m
+
     # If no stub is found, that's fine, the calling function has to deal with
     # it.
     return None
@@ -271,6 +314,38 @@ def _load_from_typeshed(inference_state, python_value_set, parent_module_value,
             )
 
 
+def _load_generated_stub(inference_state, python_value_set, import_names):
+    """
+    Compiled modules without stubs get a stub that is generated in the
+    subprocess once per environment and module version.
+    """
+    if not settings.generate_compiled_stubs or len(python_value_set) != 1:
+        return None
+    module_value, = python_value_set
+    if not module_value.is_compiled() or not module_value.is_module():
+        return None
+
+    dotted_name = '.'.join(import_names)
+    key = get_module_version_key(
+        inference_state.environment._sha256,
+        dotted_name,
+        module_value.py__file__(),
+    )
+    if key is None:
+        return None
+    path = get_persistent_cache_path(_GENERATED_STUBS_NAMESPACE, key, extension='.pyi')
+    if not os.path.isfile(path):
+        code = inference_state.compiled_subprocess.generate_stub(dotted_name=dotted_name)
+        if code is None or not write_persistent_file(path, code.encode('utf-8')):
+            return None
+    return _try_to_load_stub_from_file(
+        inference_state,
+        python_value_set,
+        file_io=FileIO(path),
+        import_names=import_names,
+    )
+
+
 def _try_to_load_stub_from_file(inference_state, python_value_set, file_io, import_names):
     try:
         stub_module_node = parse_stub_module(inference_state, file_io)
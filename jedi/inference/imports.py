@@ -9,6 +9,7 @@ This module also supports import autocompletion, which means to complete
 statements like ``from datetim`` (cursor at the end would return ``datetime``).
 """
 import os
+from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
 from parso.python import tree
@@ -16,6 +17,8 @@ from parso.tree import search_ancestor
 
 from jedi import debug
 from jedi import settings
+from jedi.cache import load_persistent_cache, save_persistent_cache, get_path_stats, \
+    is_recently_modified
 from jedi.file_io import FolderIO
 from jedi.parser_utils import get_cached_code_lines
 from jedi.inference import sys_path
@@ -31,6 +34,20 @@ from jedi.inference.gradual.typeshed import import_module_decorator, \
 from jedi.inference.compiled.subprocess.functions import ImplicitNSInfo
 from jedi.plugins import plugin_manager
 
+_module_info_cache: Dict[Tuple[Any, ...], Tuple[List[Any], Tuple[Any, Optional[bool]]]] = {}
+"""
+Maps module lookups to the stats of the files and directories that influence
+them and the results of the lookups, see :func:`_get_module_info`. Only the
+``_MAX_MODULE_INFOS`` lookups that were used last are kept.
+"""
+_MAX_MODULE_INFOS = 5000
+_MODULE_NAMES_NAMESPACE = 'module_names'
+_module_names_cache: Dict[Tuple[str, str], Tuple[List[Any], List[str]]] = {}
+"""
+Maps directories to their stats and the module names in them, see
+:func:`list_module_names`.
+"""
+
 
 class ModuleCache:
     def __init__(self):
@@ -257,6 +274,8 @@ class Importer:
             return from_cache
 
         sys_path = self._sys_path_with_modifications(is_completion=False)
+        if not self.level:
+            _prefetch_module_infos(self._module_context, tuple(sys_path))
 
         return import_module_by_names(
             self._inference_state, self.import_path, sys_path, self._module_context
@@ -373,7 +392,8 @@ def import_module(inference_state, import_names, parent_module_value, sys_path):
     if parent_module_value is None:
         # Override the sys.path. It works only good that way.
         # Injecting the path directly into `find_module` did not work.
-        file_io_or_ns, is_pkg = inference_state.compiled_subprocess.get_module_info(
+        file_io_or_ns, is_pkg = _get_module_info(
+            inference_state,
             string=import_names[-1],
             full_name=module_name,
             sys_path=sys_path,
@@ -392,7 +412,8 @@ def import_module(inference_state, import_names, parent_module_value, sys_path):
             # not important to be correct.
             if not isinstance(path, list):
                 path = [path]
-            file_io_or_ns, is_pkg = inference_state.compiled_subprocess.get_module_info(
+            file_io_or_ns, is_pkg = _get_module_info(
+                inference_state,
                 string=import_names[-1],
                 path=path,
                 full_name=module_name,
@@ -428,8 +449,113 @@ def import_module(inference_state, import_names, parent_module_value, sys_path):
     return ValueSet([module])
 
 
+def _get_module_info_key(inference_state, string, full_name, is_global_search,
+                         sys_path=None, path=None):
+    environment = inference_state.environment
+    return (
+        (environment.__class__, environment.executable),
+        None if sys_path is None else tuple(sys_path),
+        None if path is None else tuple(path),
+        string,
+        full_name,
+        is_global_search,
+    )
+
+
+def _get_validation_paths(key, result):
+    """
+    A lookup doesn't change as long as the searched directories and the
+    found files don't change. Adding or removing modules changes the
+    modification time of their directory.
+    """
+    _, sys_path, path, _, _, is_global_search = key
+    paths = list((sys_path if is_global_search else path) or ())
+    file_io_or_ns, is_pkg = result
+    if isinstance(file_io_or_ns, ImplicitNSInfo):
+        paths += file_io_or_ns.paths
+    elif file_io_or_ns is not None:
+        paths.append(file_io_or_ns.path)
+    return paths
+
+
+def _get_cached_module_info(key):
+    try:
+        stats, result = _module_info_cache.pop(key)
+    except KeyError:
+        return None
+    if get_path_stats(_get_validation_paths(key, result)) != stats:
+        return None
+    # Move the lookup to the end, it was used last.
+    _module_info_cache[key] = stats, result
+    return result
+
+
+def _cache_module_info(key, result):
+    result = tuple(result)
+    stats = get_path_stats(_get_validation_paths(key, result))
+    if not is_recently_modified(stats):
+        _module_info_cache.pop(key, None)
+        _module_info_cache[key] = stats, result
+        if len(_module_info_cache) > _MAX_MODULE_INFOS:
+            del _module_info_cache[next(iter(_module_info_cache))]
+
+
+def _get_module_info(inference_state, **kwargs):
+    """
+    Like ``get_module_info`` of the subprocess, but lookups (including
+    failing ones, which are very common in incomplete code) are cached for
+    all inference states.
+    """
+    key = _get_module_info_key(inference_state, **kwargs)
+    result = _get_cached_module_info(key)
+    if result is None:
+        result = inference_state.compiled_subprocess.get_module_info(**kwargs)
+        _cache_module_info(key, result)
+    return result
+
+
+@inference_state_method_cache()
+def _prefetch_module_infos(module_context, sys_path):
+    """
+    Looks up the top level modules of all absolute imports in a module with
+    one call to the subprocess.
+    """
+    if module_context.tree_node is None:
+        # Compiled modules don't have imports.
+        return
+    inference_state = module_context.inference_state
+    names = set()
+    for import_ in module_context.tree_node.iter_imports():
+        if import_.level == 0:
+            for dotted_name in import_.get_paths():
+                names.add(dotted_name[0].value)
+
+    keys = {}
+    for name in sorted(names):
+        key = _get_module_info_key(
+            inference_state,
+            string=name,
+            full_name=name,
+            is_global_search=True,
+            sys_path=sys_path,
+        )
+        if _get_cached_module_info(key) is None:
+            keys[name] = key
+    if len(keys) < 2:
+        return
+
+    results = inference_state.compiled_subprocess.get_module_infos(
+        sys_path=list(sys_path),
+        names=list(keys),
+    )
+    for key, result in zip(keys.values(), results):
+        _cache_module_info(key, result)
+
+
 def _load_python_module(inference_state, file_io,
                         import_names=None, is_package=False):
+    # Unsaved buffers are preferred over the files on disk.
+    file_io = inference_state.project.overlay.replace_file_io(file_io)
     module_node = inference_state.parse(
         file_io=file_io,
         cache=True,
@@ -560,5 +686,46 @@ def iter_module_names(inference_state, module_context, search_path,
         for name in inference_state.compiled_subprocess.get_builtin_module_names():
             yield module_cls(module_context, name)
 
-    for name in inference_state.compiled_subprocess.iter_module_names(search_path):
+    for name in list_module_names(inference_state, search_path):
         yield module_cls(module_context, name)
+
+
+def list_module_names(inference_state, paths):
+    """
+    Returns the names of the modules in directories. The listings are cached
+    (and persisted) as long as the modification times of the directories
+    don't change.
+    """
+    environment_key = inference_state.environment.executable
+    listings = {}
+    missing = []
+    for path in paths:
+        path = str(path)
+        stats = get_path_stats([path])
+        key = environment_key, path
+        try:
+            cached_stats, names = _module_names_cache[key]
+        except KeyError:
+            cached_stats, names = load_persistent_cache(
+                _MODULE_NAMES_NAMESPACE, key, default=(None, None))
+        if cached_stats is not None and cached_stats == stats:
+            _module_names_cache[key] = stats, names
+            listings[path] = names
+        else:
+            missing.append((path, stats))
+
+    if missing:
+        results = inference_state.compiled_subprocess.get_module_names_per_directory(
+            [path for path, stats in missing]
+        )
+        for (path, stats), names in zip(missing, results):
+            listings[path] = names
+            if not is_recently_modified(stats):
+                key = environment_key, path
+                _module_names_cache[key] = stats, names
+                save_persistent_cache(_MODULE_NAMES_NAMESPACE, key, (stats, names))
+
+    names = []
+    for path in paths:
+        names += listings[str(path)]
+    return names
@@ -53,6 +53,11 @@ A function may not be executed more than this number of times recursively.
 class RecursionDetector:
     def __init__(self):
         self.pushed_nodes = []
+        self.refused_count = 0
+        """
+        How often a recursion was stopped. If it doesn't change while
+        something is inferred, the result is complete.
+        """
 
 
 @contextmanager
@@ -66,6 +71,7 @@ def execution_allowed(inference_state, node):
     if node in pushed_nodes:
         debug.warning('catched stmt recursion: %s @%s', node,
                       getattr(node, 'start_pos', None))
+        inference_state.recursion_detector.refused_count += 1
         yield False
     else:
         try:
@@ -82,6 +88,7 @@ def execution_recursion_decorator(default=NO_VALUES):
             limit_reached = detector.push_execution(self)
             try:
                 if limit_reached:
+                    self.inference_state.recursion_detector.refused_count += 1
                     result = default
                 else:
                     result = func(self, **kwargs)
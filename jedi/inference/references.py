@@ -1,16 +1,21 @@
+import mmap
 import os
 import re
 
 from parso import python_bytes_to_unicode
 
 from jedi.debug import dbg
-from jedi.file_io import KnownContentFileIO
+from jedi.file_io import FileIO, KnownContentFileIO, FolderIO
 from jedi.inference.names import SubModuleName
 from jedi.inference.imports import load_module_from_path
 from jedi.inference.filters import ParserTreeFilter
 from jedi.inference.gradual.conversion import convert_names
+from jedi.inference.call_sites import get_call_site_index, save_call_site_indexes
+from jedi.inference.gitignore import GitIgnore
 
 _IGNORE_FOLDERS = ('.tox', '.venv', 'venv', '__pycache__')
+# Creating file ios for all other files would be a waste of time.
+_WALKED_FILE_SUFFIXES = ('.py', '.pyi', '.gitignore')
 
 _OPENED_FILE_LIMIT = 2000
 """
@@ -24,6 +29,12 @@ _PARSED_FILE_LIMIT = 30
 For now we keep the amount of parsed files really low, since parsing might take
 easily 100ms for bigger files.
 """
+_TOTAL_PARSED_FILE_LIMIT = 100
+"""
+Searches for multiple names apply ``_PARSED_FILE_LIMIT`` to every name on its
+own, so that their results match searches for single names. Without a total
+limit, searching the references of a large module could parse a lot more files.
+"""
 
 
 def _resolve_names(definition_names, avoid_names=()):
@@ -112,114 +123,209 @@ def _find_global_variables(names, search_name):
 
 
 def find_references(module_context, tree_name, only_in_module=False):
+    return find_references_of_names(module_context, [tree_name], only_in_module)[0]
+
+
+def find_references_of_names(module_context, tree_names, only_in_module=False):
+    """
+    Like :func:`find_references`, but for multiple names of a module at once.
+    Files are only scanned once for all of them and every possible reference
+    is only inferred once. Returns a list of references per name.
+    """
+    inf = module_context.inference_state
+    found_names_dcts, module_contexts, search_names_list = get_search_targets(
+        module_context, tree_names, only_in_module)
+    all_search_names = set().union(*search_names_list)
+
+    # For param no search for other modules is necessary.
+    if only_in_module or all(any(n.api_type == 'param' for n in found_names_dct.values())
+                             for found_names_dct in found_names_dcts):
+        potential_modules = ((m, all_search_names) for m in module_contexts)
+    else:
+        potential_modules = get_module_contexts_containing_names(
+            inf,
+            module_contexts,
+            all_search_names,
+        )
+
+    non_matching_reference_maps_list = [{} for _ in tree_names]
+    for potential_module_context, names in potential_modules:
+        used_names = potential_module_context.tree_node.get_used_names()
+        for name in names:
+            for name_leaf in used_names.get(name, []):
+                new = find_names_of_leaf(potential_module_context, name_leaf)
+                for search_names, found_names_dct, non_matching_reference_maps in zip(
+                        search_names_list, found_names_dcts, non_matching_reference_maps_list):
+                    if name in search_names:
+                        _add_references(found_names_dct, non_matching_reference_maps, new)
+
+    results = [list(found_names_dct.values()) for found_names_dct in found_names_dcts]
+    if only_in_module:
+        return [[n for n in result if n.get_root_context() == module_context]
+                for result in results]
+    return results
+
+
+def get_search_targets(module_context, tree_names, only_in_module=False):
+    """
+    Finds the definitions of names of a module and what needs to be searched
+    to find their references. Returns a tuple of
+
+    - the definitions per name, dicts like the ones of
+      :func:`find_names_of_leaf`,
+    - the module contexts that contain definitions (the given one first) and
+    - the strings that references might have per name (definitions might have
+      a different name, e.g. because of imports).
+    """
     inf = module_context.inference_state
-    search_name = tree_name.value
 
     # We disable flow analysis, because if we have ifs that are only true in
     # certain cases, we want both sides.
     try:
         inf.flow_analysis_enabled = False
-        found_names = _find_defining_names(module_context, tree_name)
+        found_names_list = [
+            _find_defining_names(module_context, tree_name)
+            for tree_name in tree_names
+        ]
     finally:
         inf.flow_analysis_enabled = True
 
-    found_names_dct = _dictionarize(found_names)
-
     module_contexts = [module_context]
     if not only_in_module:
         module_contexts.extend(
-            m for m in set(d.get_root_context() for d in found_names)
+            m for m in set(
+                d.get_root_context()
+                for found_names in found_names_list
+                for d in found_names
+            )
             if m != module_context and m.tree_node is not None
         )
-    # For param no search for other modules is necessary.
-    if only_in_module or any(n.api_type == 'param' for n in found_names):
-        potential_modules = module_contexts
-    else:
-        potential_modules = get_module_contexts_containing_name(
-            inf,
-            module_contexts,
-            search_name,
+
+    search_names_list = []
+    for tree_name, found_names in zip(tree_names, found_names_list):
+        search_names = {tree_name.value}
+        search_names.update(
+            n.string_name for n in found_names
+            if n.tree_name is not None and n.api_type != 'module'
         )
+        search_names_list.append(search_names)
+    found_names_dcts = [_dictionarize(found_names) for found_names in found_names_list]
+    return found_names_dcts, module_contexts, search_names_list
 
-    non_matching_reference_maps = {}
-    for module_context in potential_modules:
-        for name_leaf in module_context.tree_node.get_used_names().get(search_name, []):
-            new = _dictionarize(_find_names(module_context, name_leaf))
-            if any(tree_name in found_names_dct for tree_name in new):
-                found_names_dct.update(new)
-                for tree_name in new:
-                    for dct in non_matching_reference_maps.get(tree_name, []):
-                        # A reference that was previously searched for matches
-                        # with a now found name. Merge.
-                        found_names_dct.update(dct)
-                    try:
-                        del non_matching_reference_maps[tree_name]
-                    except KeyError:
-                        pass
-            else:
-                for name in new:
-                    non_matching_reference_maps.setdefault(name, []).append(new)
-    result = found_names_dct.values()
-    if only_in_module:
-        return [n for n in result if n.get_root_context() == module_context]
-    return result
 
+def find_names_of_leaf(module_context, name_leaf):
+    """
+    Returns the names that a name leaf of a module refers to (including
+    itself) as a dict. The keys are their tree names (or the names if they
+    don't have one).
+    """
+    return _dictionarize(_find_names(module_context, name_leaf))
+
+
+def _add_references(found_names_dct, non_matching_reference_maps, new):
+    if any(tree_name in found_names_dct for tree_name in new):
+        found_names_dct.update(new)
+        for tree_name in new:
+            for dct in non_matching_reference_maps.get(tree_name, []):
+                # A reference that was previously searched for matches
+                # with a now found name. Merge.
+                found_names_dct.update(dct)
+            try:
+                del non_matching_reference_maps[tree_name]
+            except KeyError:
+                pass
+    else:
+        for name in new:
+            non_matching_reference_maps.setdefault(name, []).append(new)
 
-def _check_fs(inference_state, file_io, regex):
-    try:
-        code = file_io.read()
-    except FileNotFoundError:
-        return None
-    code = python_bytes_to_unicode(code, errors='replace')
-    if not regex.search(code):
-        return None
-    new_file_io = KnownContentFileIO(file_io.path, code)
-    m = load_module_from_path(inference_state, new_file_io)
-    if m.is_compiled():
-        return None
-    return m.as_context()
-
-
-def gitignored_lines(folder_io, file_io):
-    ignored_paths = set()
-    ignored_names = set()
-    for l in file_io.read().splitlines():
-        if not l or l.startswith(b'#'):
-            continue
 
-        p = l.decode('utf-8', 'ignore')
-        if p.startswith('/'):
-            name = p[1:]
-            if name.endswith(os.path.sep):
-                name = name[:-1]
-            ignored_paths.add(os.path.join(folder_io.path, name))
-        else:
-            ignored_names.add(p)
-    return ignored_paths, ignored_names
+class NameScanner:
+    """
+    Finds out which of a set of names (as words) files contain. All names are
+    searched with one regular expression and every file is read only once.
+
+    Files on disk are mapped into memory and searched as bytes if all names
+    are ASCII, so files that contain none of the names are never decoded.
+    """
+    def __init__(self, names):
+        self._names = frozenset(names)
+        pattern = r'\b(?:%s)\b' % '|'.join(map(re.escape, sorted(self._names)))
+        self._regex = re.compile(pattern)
+        self._bytes_regex = None
+        if all(name.isascii() for name in self._names):
+            self._bytes_regex = re.compile(pattern.encode('ascii'))
+
+    def _find_names(self, regex, data):
+        found = set()
+        for match in regex.finditer(data):
+            found.add(match.group())
+            if len(found) == len(self._names):
+                break
+        return found
+
+    def scan(self, file_io):
+        """
+        Returns the code of a file and the names it contains. Returns None if
+        the file contains none of the names or cannot be read.
+        """
+        if self._bytes_regex is not None and type(file_io) is FileIO:
+            try:
+                return self._scan_mapped_file(file_io.path)
+            except (FileNotFoundError, IsADirectoryError, PermissionError):
+                return None
+            except (OSError, ValueError):
+                # Some files cannot be mapped (e.g. on special file systems).
+                pass
+
+        try:
+            code = file_io.read()
+        except (FileNotFoundError, IsADirectoryError, PermissionError):
+            return None
+        code = python_bytes_to_unicode(code, errors='replace')
+        found = self._find_names(self._regex, code)
+        if not found:
+            return None
+        return code, found
+
+    def _scan_mapped_file(self, path):
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                found = self._find_names(self._bytes_regex, data)
+                if not found:
+                    return None
+                code = data[:]
+        return (
+            python_bytes_to_unicode(code, errors='replace'),
+            {name.decode('ascii') for name in found},
+        )
 
 
 def recurse_find_python_folders_and_files(folder_io, except_paths=()):
     except_paths = set(except_paths)
-    for root_folder_io, folder_ios, file_ios in folder_io.walk():
-        # Delete folders that we don't want to iterate over.
+    # The .gitignore patterns that apply to the folders that are walked next.
+    gitignores = {}
+    for root_folder_io, folder_ios, file_ios in folder_io.walk(_WALKED_FILE_SUFFIXES):
+        gitignore = gitignores.pop(root_folder_io.path, None)
+        if any(f.path.name == '.gitignore' for f in file_ios):
+            gitignore = GitIgnore.from_folder(root_folder_io.path, gitignore)
+
         for file_io in file_ios:
             path = file_io.path
-            if path.suffix in ('.py', '.pyi'):
-                if path not in except_paths:
+            if path.suffix in ('.py', '.pyi') and path not in except_paths:
+                if gitignore is None or not gitignore.is_ignored(str(path), False):
                     yield None, file_io
 
-            if path.name == '.gitignore':
-                ignored_paths, ignored_names = \
-                    gitignored_lines(root_folder_io, file_io)
-                except_paths |= ignored_paths
-
         folder_ios[:] = [
             folder_io
             for folder_io in folder_ios
             if folder_io.path not in except_paths
             and folder_io.get_base_name() not in _IGNORE_FOLDERS
+            and (gitignore is None or not gitignore.is_ignored(folder_io.path, True))
         ]
         for folder_io in folder_ios:
+            gitignores[folder_io.path] = gitignore
             yield folder_io, None
 
 
@@ -238,7 +344,7 @@ def _find_python_files_in_sys_path(inference_state, module_contexts):
         if file_io is None:
             continue
 
-        folder_io = file_io.get_parent_folder()
+        folder_io = FolderIO(os.path.dirname(file_io.path), inference_state.project.overlay)
         while True:
             path = folder_io.path
             if not any(path.startswith(p) for p in sys_path) or path in except_paths:
@@ -274,21 +380,143 @@ def get_module_contexts_containing_name(inference_state, module_contexts, name,
                                   limit_reduction=limit_reduction)
 
 
+def get_module_contexts_containing_names(inference_state, module_contexts, names,
+                                         limit_reduction=1):
+    """
+    Like :func:`get_module_contexts_containing_name`, but searches multiple
+    names in one pass over the files. Yields the module contexts together
+    with the names that they (probably) contain.
+    """
+    names = set(names)
+    for module_context in module_contexts:
+        if module_context.is_compiled():
+            continue
+        yield module_context, names
+
+    # Very short names are not searched in other modules for now to avoid lots
+    # of file lookups.
+    names = [name for name in names if len(name) > 2]
+    if not names:
+        return
+
+    file_io_iterator = _find_python_files_in_sys_path(inference_state, module_contexts)
+    yield from search_names_in_file_ios(inference_state, file_io_iterator, names,
+                                        limit_reduction=limit_reduction)
+
+
+def get_module_contexts_calling_name(inference_state, module_contexts, name,
+                                     limit_reduction=1):
+    """
+    Like :func:`get_module_contexts_containing_name`, but only returns modules
+    that (probably) call ``name``. Uses the call site index instead of
+    searching through the contents of all files.
+
+    Yields the module contexts together with the positions of the calls in
+    them (see :func:`jedi.inference.call_sites.get_call_site_names`). The
+    positions of the given module contexts are None, they are not indexed.
+    """
+    for module_context, positions in get_module_contexts_calling_names(
+            inference_state, module_contexts, [name], limit_reduction=limit_reduction):
+        yield module_context, positions[name]
+
+
+def get_module_contexts_calling_names(inference_state, module_contexts, names,
+                                      limit_reduction=1):
+    """
+    Like :func:`get_module_contexts_calling_name`, but for multiple names in
+    one pass over the files. Yields the module contexts together with a dict
+    of the names they (probably) call to the positions of the calls. The
+    limit of parsed files applies to every name on its own, but no more than
+    ``_TOTAL_PARSED_FILE_LIMIT`` files are parsed for all names together.
+    """
+    for module_context in module_contexts:
+        if module_context.is_compiled():
+            continue
+        yield module_context, dict.fromkeys(names)
+
+    parse_limit = _PARSED_FILE_LIMIT / limit_reduction
+    total_parse_limit = _TOTAL_PARSED_FILE_LIMIT / limit_reduction
+    open_limit = _OPENED_FILE_LIMIT / limit_reduction
+    file_io_count = 0
+    parsed_file_count = 0
+    parsed_file_counts = {name: 0 for name in names if len(name) > 2}
+    if not parsed_file_counts:
+        return
+
+    file_io_iterator = _find_python_files_in_sys_path(inference_state, module_contexts)
+    try:
+        for file_io in file_io_iterator:
+            file_io_count += 1
+            index = get_call_site_index(file_io)
+            if index is not None:
+                positions = {n: index[n] for n in parsed_file_counts if n in index}
+                if positions:
+                    m = load_module_from_path(inference_state, file_io)
+                    if not m.is_compiled():
+                        yield m.as_context(), positions
+                        for name in positions:
+                            parsed_file_counts[name] += 1
+                            if parsed_file_counts[name] >= parse_limit:
+                                dbg('Hit limit of parsed files for %s: %s', name, parse_limit)
+                                del parsed_file_counts[name]
+                        if not parsed_file_counts:
+                            break
+                        parsed_file_count += 1
+                        if parsed_file_count >= total_parse_limit:
+                            dbg('Hit total limit of parsed files: %s', total_parse_limit)
+                            break
+
+            if file_io_count >= open_limit:
+                dbg('Hit limit of opened files: %s', open_limit)
+                break
+    finally:
+        save_call_site_indexes()
+
+
 def search_in_file_ios(inference_state, file_io_iterator, name, limit_reduction=1):
+    for module_context, found_names in search_names_in_file_ios(
+            inference_state, file_io_iterator, [name], limit_reduction=limit_reduction):
+        yield module_context
+
+
+def search_names_in_file_ios(inference_state, file_io_iterator, names, limit_reduction=1):
+    """
+    Yields the module contexts of the files that contain at least one of
+    ``names`` together with the names they contain, see
+    :class:`NameScanner`. The limit of parsed files applies to every name on
+    its own, names that hit it are not searched anymore. No more than
+    ``_TOTAL_PARSED_FILE_LIMIT`` files are parsed for all names together.
+    """
     parse_limit = _PARSED_FILE_LIMIT / limit_reduction
+    total_parse_limit = _TOTAL_PARSED_FILE_LIMIT / limit_reduction
     open_limit = _OPENED_FILE_LIMIT / limit_reduction
     file_io_count = 0
     parsed_file_count = 0
-    regex = re.compile(r'\b' + re.escape(name) + r'\b')
+    parsed_file_counts = dict.fromkeys(names, 0)
+    scanner = NameScanner(names)
     for file_io in file_io_iterator:
         file_io_count += 1
-        m = _check_fs(inference_state, file_io, regex)
-        if m is not None:
-            parsed_file_count += 1
-            yield m
-            if parsed_file_count >= parse_limit:
-                dbg('Hit limit of parsed files: %s', parse_limit)
-                break
+        result = scanner.scan(file_io)
+        if result is not None:
+            code, found_names = result
+            new_file_io = KnownContentFileIO(file_io.path, code)
+            m = load_module_from_path(inference_state, new_file_io)
+            if not m.is_compiled():
+                yield m.as_context(), found_names
+                for name in found_names:
+                    parsed_file_counts[name] += 1
+                exhausted = [n for n in found_names if parsed_file_counts[n] >= parse_limit]
+                if exhausted:
+                    dbg('Hit limit of parsed files for %s: %s', exhausted, parse_limit)
+                    for name in exhausted:
+                        del parsed_file_counts[name]
+                    if not parsed_file_counts:
+                        break
+                    scanner = NameScanner(parsed_file_counts)
+                parsed_file_count += 1
+                if parsed_file_count >= total_parse_limit:
+                    dbg('Hit total limit of parsed files: %s', total_parse_limit)
+                    break
 
         if file_io_count >= open_limit:
             dbg('Hit limit of opened files: %s', open_limit)
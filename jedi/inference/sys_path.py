@@ -2,17 +2,27 @@ import os
 import re
 from pathlib import Path
 from importlib.machinery import all_suffixes
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.base_value import ContextualizedNode
 from jedi.inference.helpers import is_string, get_str_or_none
 from jedi.parser_utils import get_cached_code_lines
 from jedi.file_io import FileIO
+from jedi.cache import get_path_stats, is_recently_modified
 from jedi import settings
 from jedi import debug
 
 _BUILDOUT_PATH_INSERTION_LIMIT = 10
 
+_buildout_paths_cache: Dict[
+    str, Tuple[List[str], List[Optional[Tuple[int, int]]], FrozenSet[Path]]
+] = {}
+"""
+Maps script paths to the paths that were checked to find buildout scripts,
+their stats and the sys paths added by the buildout scripts.
+"""
+
 
 def _abs_path(module_context, str_path: str):
     path = Path(str_path)
@@ -136,14 +146,35 @@ def check_sys_path_modifications(module_context):
 
 
 def discover_buildout_paths(inference_state, script_path):
-    buildout_script_paths = set()
+    """
+    The result is cached as long as the parent directories of the script, the
+    buildout ``bin`` directory and the buildout scripts don't change.
+    """
+    key = str(script_path)
+    try:
+        checked_paths, stats, buildout_script_paths = _buildout_paths_cache[key]
+    except KeyError:
+        pass
+    else:
+        if get_path_stats(checked_paths) == stats:
+            return set(buildout_script_paths)
 
+    checked_paths = [str(p) for p in script_path.parents]
+    project_root = _get_parent_dir_with_file(script_path, 'buildout.cfg')
+    if project_root is not None:
+        checked_paths.append(str(project_root.joinpath('bin')))
+
+    buildout_script_paths = set()
     for buildout_script_path in _get_buildout_script_paths(script_path):
+        checked_paths.append(str(buildout_script_path))
         for path in _get_paths_from_buildout_script(inference_state, buildout_script_path):
             buildout_script_paths.add(path)
             if len(buildout_script_paths) >= _BUILDOUT_PATH_INSERTION_LIMIT:
                 break
 
+    stats = get_path_stats(checked_paths)
+    if not is_recently_modified(stats):
+        _buildout_paths_cache[key] = checked_paths, stats, frozenset(buildout_script_paths)
     return buildout_script_paths
 
 
@@ -14,11 +14,20 @@ follow **every** ``append`` and check whether it's the right array. However this
 works pretty good, because in *slow* cases, the recursion detector and other
 settings will stop this process.
 
+The possible modification calls of a module are collected only once per
+parsed module (see ``_get_mutation_index``) and the inferred receivers of these
+calls are shared between all arrays that are checked.
+
 It is important to note that:
 
 1. Array modfications work only in the current module.
 2. Jedi only checks Array additions; ``list.pop``, etc are ignored.
 """
+import weakref
+from typing import Dict, MutableMapping, Tuple
+
+from parso.python.tree import Name, PythonNode, UsedNamesMapping
+
 from jedi import debug
 from jedi import settings
 from jedi.inference import recursion
@@ -30,6 +39,79 @@ from jedi.inference.cache import inference_state_method_cache
 
 _sentinel = object()
 
+_MUTATION_METHODS = {
+    'list': ('append', 'extend', 'insert'),
+    'set': ('add', 'update'),
+}
+
+_mutation_index_cache: MutableMapping[
+    UsedNamesMapping,
+    Dict[str, Tuple[Tuple[Name, PythonNode], ...]]
+]
+_mutation_index_cache = weakref.WeakKeyDictionary()
+
+
+def _get_mutation_index(module_node):
+    """
+    Returns a mapping of mutation method names (``append``, ``add``, ...) to
+    the call sites of these methods, i.e. tuples of the method name and the
+    execution trailer. The index lives as long as the used names of the module
+    and is therefore shared by all arrays and inference states.
+    """
+    used_names = module_node.get_used_names()
+    try:
+        return _mutation_index_cache[used_names]
+    except KeyError:
+        pass
+
+    index = {}
+    for method_names in _MUTATION_METHODS.values():
+        for add_name in method_names:
+            index[add_name] = tuple(_iter_mutation_calls(used_names.get(add_name, ())))
+    _mutation_index_cache[used_names] = index
+    return index
+
+
+def _iter_mutation_calls(names):
+    for name in names:
+        trailer = name.parent
+        if trailer.type != 'trailer':
+            continue
+        power = trailer.parent
+        trailer_pos = power.children.index(trailer)
+        try:
+            execution_trailer = power.children[trailer_pos + 1]
+        except IndexError:
+            continue
+        if execution_trailer.type != 'trailer' \
+                or execution_trailer.children[0] != '(' \
+                or execution_trailer.children[1] == ')':
+            continue
+        yield name, execution_trailer
+
+
+def _infer_mutation_receiver(context, name):
+    """
+    Infers the receiver of a mutation call (``arr`` in ``arr.append(1)``). The
+    receivers are shared between all arrays of an inference state, but only
+    if no recursion was stopped while inferring them. Otherwise they might
+    miss values for all other arrays as well.
+    """
+    inference_state = context.inference_state
+    cache = inference_state.memoize_cache.setdefault(_infer_mutation_receiver, {})
+    key = context, name
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    detector = inference_state.recursion_detector
+    refused_count = detector.refused_count
+    result = infer_call_of_leaf(context, name, cut_own_trailer=True)
+    if detector.refused_count == refused_count:
+        cache[key] = result
+    return result
+
 
 def check_array_additions(context, sequence):
     """ Just a mapper function for the internal _internal_check_array_additions """
@@ -37,7 +119,16 @@ def check_array_additions(context, sequence):
         # TODO also check for dict updates
         return NO_VALUES
 
-    return _internal_check_array_additions(context, sequence)
+    return _check_array_additions(context, sequence)
+
+
+def _check_array_additions(context, sequence):
+    # A search for the same array within its own search is stopped here and
+    # not by the memoization, so that it counts as a stopped recursion.
+    with recursion.execution_allowed(context.inference_state, (context, sequence)) as allowed:
+        if not allowed:
+            return NO_VALUES
+        return _internal_check_array_additions(context, sequence)
 
 
 @inference_state_method_cache(default=NO_VALUES)
@@ -74,48 +165,28 @@ def _internal_check_array_additions(context, sequence):
         settings.dynamic_params_for_other_modules, False
 
     is_list = sequence.name.string_name == 'list'
-    search_names = (['append', 'extend', 'insert'] if is_list else ['add', 'update'])
+    search_names = _MUTATION_METHODS['list' if is_list else 'set']
+    mutation_index = _get_mutation_index(module_context.tree_node)
 
     added_types = set()
+    value_node = context.tree_node
     for add_name in search_names:
-        try:
-            possible_names = module_context.tree_node.get_used_names()[add_name]
-        except KeyError:
-            continue
-        else:
-            for name in possible_names:
-                value_node = context.tree_node
-                if not (value_node.start_pos < name.start_pos < value_node.end_pos):
-                    continue
-                trailer = name.parent
-                power = trailer.parent
-                trailer_pos = power.children.index(trailer)
-                try:
-                    execution_trailer = power.children[trailer_pos + 1]
-                except IndexError:
-                    continue
-                else:
-                    if execution_trailer.type != 'trailer' \
-                            or execution_trailer.children[0] != '(' \
-                            or execution_trailer.children[1] == ')':
-                        continue
-
-                random_context = context.create_context(name)
-
-                with recursion.execution_allowed(context.inference_state, power) as allowed:
-                    if allowed:
-                        found = infer_call_of_leaf(
+        for name, execution_trailer in mutation_index[add_name]:
+            if not (value_node.start_pos < name.start_pos < value_node.end_pos):
+                continue
+
+            random_context = context.create_context(name)
+            power = execution_trailer.parent
+            with recursion.execution_allowed(context.inference_state, power) as allowed:
+                if allowed:
+                    found = _infer_mutation_receiver(random_context, name)
+                    if sequence in found:
+                        # The arrays match. Now add the results
+                        added_types |= find_additions(
                             random_context,
-                            name,
-                            cut_own_trailer=True
+                            execution_trailer.children[1],
+                            add_name
                         )
-                        if sequence in found:
-                            # The arrays match. Now add the results
-                            added_types |= find_additions(
-                                random_context,
-                                execution_trailer.children[1],
-                                add_name
-                            )
 
     # reset settings
     settings.dynamic_params_for_other_modules = temp_param_add
@@ -159,7 +230,7 @@ class _DynamicArrayAdditions(HelperValueMixin):
 
         from jedi.inference.arguments import TreeArguments
         if isinstance(arguments, TreeArguments):
-            additions = _internal_check_array_additions(arguments.context, self._instance)
+            additions = _check_array_additions(arguments.context, self._instance)
             yield from additions
 
     def iterate(self, contextualized_node=None, is_async=False):
@@ -55,6 +55,8 @@ from jedi.plugins import plugin_manager
 
 
 class ClassName(TreeNameDefinition):
+    __slots__ = ('_apply_decorators', '_class_value')
+
     def __init__(self, class_value, tree_name, name_context, apply_decorators):
         super().__init__(name_context, tree_name)
         self._apply_decorators = apply_decorators
@@ -1,3 +1,5 @@
+import bisect
+import keyword
 import re
 import textwrap
 from ast import literal_eval
@@ -325,3 +327,171 @@ def _function_is_x_method(method_name):
 function_is_staticmethod = _function_is_x_method('staticmethod')
 function_is_classmethod = _function_is_x_method('classmethod')
 function_is_property = _function_is_x_method('property')
+
+
+# Strings, comments, brackets and newlines, everything that is needed to find
+# the top-level statements of code without tokenizing it.
+_STATEMENT_SCANNER = re.compile(
+    r"'''[^\\']*(?:(?:\\.|'(?!''))[^\\']*)*'''"
+    r'|"""[^\\"]*(?:(?:\\.|"(?!""))[^\\"]*)*"""'
+    r"|'[^\\'\n]*(?:\\.[^\\'\n]*)*'"
+    r'|"[^\\"\n]*(?:\\.[^\\"\n]*)*"'
+    r'|#[^\n]*'
+    r'|\\\r?\n'
+    r'''|[()\[\]{}\n'"]''',
+    re.DOTALL
+)
+_CONTINUATION_KEYWORD = re.compile(r'(?:else|elif|except|finally)\b')
+_FUNCTION_KEYWORD = re.compile(r'(?:async[ \t]+)?def\b')
+_KEPT_KEYWORD = re.compile(
+    r'(?:class|if|elif|else|try|except|finally|for|while|with|async|import|from)\b'
+)
+_ASSIGNMENT_TARGET = re.compile(r'(\w+)[\w.]*[ \t]*(?:,[ \t]*[\w.]+[ \t]*)*(?::[^=\n]+)?=(?!=)')
+_INDENTATION = re.compile(r'[ \t]*')
+
+_last_outline = None
+
+
+class CodeOutline:
+    """
+    Very long code (e.g. of generated modules) is not parsed completely,
+    because parsing and inferring it would take too long. Only the top-level
+    statement of the cursor is kept, everything else is replaced with an
+    outline: Functions keep their signature and ``...`` as body. Classes and
+    compound statements like ``if`` and ``try`` keep their headers and an
+    outline of their bodies. Statements that span multiple lines are replaced
+    with ``...``, assignments keep their targets (e.g. ``foo = ...``). Line
+    numbers don't change.
+
+    The logical lines are found with a simple scan of strings and brackets,
+    which is a lot faster than tokenizing the code.
+    """
+    def __init__(self, code):
+        self._code = code
+        self._logical_lines = []  # List[Tuple[start, end]]
+
+        start = 0
+        depth = 0
+        for match in _STATEMENT_SCANNER.finditer(code):
+            char = match.group()[0]
+            if char in '([{':
+                depth += 1
+            elif char in ')]}':
+                depth = max(depth - 1, 0)
+            elif char == '\n' and depth == 0:
+                self._logical_lines.append((start, match.end()))
+                start = match.end()
+        if start < len(code) or not self._logical_lines:
+            self._logical_lines.append((start, len(code)))
+
+        # The top-level statements as the indexes of their first logical
+        # lines. Decorators belong to the next statement.
+        self._statement_indexes = []
+        self._statement_lines = []
+        line = 1
+        previous_start = 0
+        is_decorator = False
+        for i, (start, end) in enumerate(self._logical_lines):
+            line += code.count('\n', previous_start, start)
+            previous_start = start
+            if i == 0 or self._is_statement_start(start):
+                if not is_decorator:
+                    self._statement_indexes.append(i)
+                    self._statement_lines.append(line)
+                is_decorator = code.startswith('@', start)
+
+        self._outlines = list(self._create_outlines())
+        self._outlined_statements = set(
+            self._get_statement_index_of_logical_line(i)
+            for i, outline in enumerate(self._outlines)
+            if outline is not None
+        )
+
+    def _is_statement_start(self, position):
+        char = self._code[position:position + 1]
+        return bool(char) and char not in ' \t\r\n\f#)]}' \
+            and not _CONTINUATION_KEYWORD.match(self._code, position)
+
+    def _create_outlines(self):
+        """
+        Yields the outline of every logical line, None if it's kept.
+        """
+        code = self._code
+        # The indentation of the function whose body is removed.
+        body_indentation = None
+        is_first_body_line = False
+        for start, end in self._logical_lines:
+            indentation = _INDENTATION.match(code, start).group()
+            position = start + len(indentation)
+            newlines = '\n' * code.count('\n', start, end)
+            is_empty = position == end or code[position] in '\r\n\f#'
+            if body_indentation is not None:
+                if is_empty:
+                    yield newlines
+                    continue
+                if len(indentation) > body_indentation:
+                    yield (indentation + '...' if is_first_body_line else '') + newlines
+                    is_first_body_line = False
+                    continue
+                body_indentation = None
+
+            if _FUNCTION_KEYWORD.match(code, position):
+                body_indentation = len(indentation)
+                is_first_body_line = True
+                yield None
+            elif is_empty or len(newlines) <= 1 or code.startswith('@', position) \
+                    or _KEPT_KEYWORD.match(code, position):
+                yield None
+            else:
+                match = _ASSIGNMENT_TARGET.match(code, position)
+                if match is not None and not keyword.iskeyword(match.group(1)):
+                    yield indentation + match.group() + ' ...' + newlines
+                else:
+                    yield indentation + '...' + newlines
+
+    def _get_statement_index_of_logical_line(self, logical_line_index):
+        return bisect.bisect_right(self._statement_indexes, logical_line_index) - 1
+
+    def _get_statement_index(self, line):
+        if line is None:
+            return None
+        return bisect.bisect_right(self._statement_lines, line) - 1
+
+    def get_code(self, keep_line=None):
+        """
+        Returns the outline of the code. The top-level statement of
+        ``keep_line`` is complete.
+        """
+        keep_index = self._get_statement_index(keep_line)
+        keep_start = keep_end = None
+        if keep_index is not None:
+            keep_start = self._statement_indexes[keep_index]
+            indexes = self._statement_indexes + [len(self._logical_lines)]
+            keep_end = indexes[keep_index + 1]
+
+        code = self._code
+        return ''.join(
+            code[start:end] if outline is None or keep_start is not None
+            and keep_start <= i < keep_end else outline
+            for i, ((start, end), outline) in enumerate(zip(self._logical_lines, self._outlines))
+        )
+
+    def is_outlined(self, line, keep_line=None):
+        """
+        Returns if the top-level statement of ``line`` is not complete in
+        ``get_code(keep_line)``.
+        """
+        index = self._get_statement_index(line)
+        return index != self._get_statement_index(keep_line) \
+            and index in self._outlined_statements
+
+
+def get_code_outline(code):
+    """
+    Returns the :class:`CodeOutline` of code. The last one is cached, because
+    the same code is usually outlined a few times.
+    """
+    global _last_outline
+    if _last_outline is None or _last_outline._code != code:
+        _last_outline = CodeOutline(code)
+    return _last_outline
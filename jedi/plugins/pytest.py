@@ -119,6 +119,15 @@ def _is_pytest_func(func_name, decorator_nodes):
         or any('fixture' in n.get_code() for n in decorator_nodes)
 
 
+def _contains_conftest(folder_io):
+    # Directory listings are cached, which is cheaper than trying to open
+    # conftest.py in every parent folder.
+    try:
+        return 'conftest.py' in folder_io.list()
+    except OSError:
+        return False
+
+
 @inference_state_method_cache()
 def _iter_pytest_modules(module_context, skip_own_module=False):
     if not skip_own_module:
@@ -130,7 +139,8 @@ def _iter_pytest_modules(module_context, skip_own_module=False):
         sys_path = module_context.inference_state.get_sys_path()
         while any(folder.path.startswith(p) for p in sys_path):
             file_io = folder.get_file_io('conftest.py')
-            if Path(file_io.path) != module_context.py__file__():
+            if Path(file_io.path) != module_context.py__file__() \
+                    and _contains_conftest(folder):
                 try:
                     m = load_module_from_path(module_context.inference_state, file_io)
                     yield m.as_context()
@@ -23,12 +23,14 @@ Filesystem cache
 ~~~~~~~~~~~~~~~~
 
 .. autodata:: cache_directory
+.. autodata:: generate_compiled_stubs
 
 
 Parser
 ~~~~~~
 
 .. autodata:: fast_parser
+.. autodata:: parser_cache_size
 
 
 Dynamic stuff
@@ -89,6 +91,15 @@ On Linux, if the environment variable ``$XDG_CACHE_HOME`` is set,
 ``$XDG_CACHE_HOME/jedi`` is used instead of the default one.
 """
 
+generate_compiled_stubs = False
+"""
+Compiled modules (e.g. C extensions) without stubs in typeshed get stubs that
+are generated by introspecting them once. These stubs are stored in the
+:data:`cache_directory` and are used like typeshed stubs, which means that
+names of these modules point to the generated files instead of the compiled
+objects.
+"""
+
 # ----------------
 # Parser
 # ----------------
@@ -101,10 +112,24 @@ parse the parts again that have changed, while reusing the rest of the syntax
 tree.
 """
 
-_cropped_file_size = int(10e6)  # 1 Megabyte
+parser_cache_size = 16 * 1024 * 1024
+"""
+The syntax trees of parsed modules are kept in memory. If the source code of
+all cached modules gets larger than this number of bytes, the modules that
+were not used for the longest time are removed from the cache (they are
+still cached on disk). Modules that are used by a live :class:`.Script` or
+:class:`.InterpreterSession` are never removed.
+
+A syntax tree needs about 30 times the memory of its source code.
+"""
+
+_outline_file_size = int(10e6)  # 10 Megabytes
 """
 Jedi gets extremely slow if the file size exceed a few thousand lines.
-To avoid getting stuck completely Jedi crops the file at some point.
+To avoid getting stuck completely Jedi only parses the top-level statement at
+the cursor of longer files completely and an outline of the rest (function
+signatures, class and assignment targets). Like the cropping of files that
+it replaces, this only happens for files larger than this number of bytes.
 
 One megabyte of typical Python code equals about 20'000 lines of code.
 """
@@ -4,7 +4,15 @@ This is a convenience script to test the speed and memory usage of Jedi with
 large libraries.
 
 Each library is preloaded by jedi, recording the time and memory consumed by
-each operation.
+each operation. The memory is measured twice: The system memory used (which is
+noisy) and the memory that was allocated by Python objects and is still alive
+after the preload (measured with :mod:`tracemalloc`).
+
+To compare the memory usage of two versions of Jedi (e.g. to check the effect
+of ``__slots__`` on names and values), run this script in both checkouts with
+the same libraries::
+
+    ./scripts/memory_check.py numpy django matplotlib
 
 You can provide additional libraries via command line arguments.
 
@@ -13,6 +21,7 @@ Note: This requires the psutil library, available on PyPI.
 import time
 import sys
 import os
+import tracemalloc
 import psutil
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
 import jedi
@@ -23,30 +32,43 @@ def used_memory():
     return psutil.virtual_memory().used / 2 ** 20
 
 
+def allocated_memory():
+    """Return the MB of memory allocated by Python objects that are alive."""
+    current, peak = tracemalloc.get_traced_memory()
+    return current / 2 ** 20
+
+
 def profile_preload(mod):
     """Preload a module into Jedi, recording time and memory used."""
     base = used_memory()
+    allocated_base = allocated_memory()
     t0 = time.time()
     jedi.preload_module(mod)
     elapsed = time.time() - t0
     used = used_memory() - base
-    return elapsed, used
+    allocated = allocated_memory() - allocated_base
+    return elapsed, used, allocated
 
 
 def main(mods):
     """Preload the modules, and print the time and memory used."""
+    tracemalloc.start()
     t0 = time.time()
     baseline = used_memory()
-    print('Time (s) | Mem (MB) | Package')
-    print('------------------------------')
+    allocated_baseline = allocated_memory()
+    print('Time (s) | Mem (MB) | Alloc (MB) | Package')
+    print('-------------------------------------------')
     for mod in mods:
-        elapsed, used = profile_preload(mod)
-        if used > 0:
-            print('%8.2f | %8d | %s' % (elapsed, used, mod))
-    print('------------------------------')
+        elapsed, used, allocated = profile_preload(mod)
+        if used > 0 or allocated > 0:
+            print('%8.2f | %8d | %10.1f | %s' % (elapsed, used, allocated, mod))
+    print('-------------------------------------------')
     elapsed = time.time() - t0
     used = used_memory() - baseline
-    print('%8.2f | %8d | %s' % (elapsed, used, 'Total'))
+    allocated = allocated_memory() - allocated_baseline
+    _, peak = tracemalloc.get_traced_memory()
+    print('%8.2f | %8d | %10.1f | %s' % (elapsed, used, allocated, 'Total'))
+    print('Peak allocated memory: %.1f MB' % (peak / 2 ** 20))
 
 
 if __name__ == '__main__':
@@ -54,5 +76,6 @@ if __name__ == '__main__':
         mods = sys.argv[1:]
     else:
         mods = ['re', 'numpy', 'scipy', 'scipy.sparse', 'scipy.stats',
+                'django', 'matplotlib', 'matplotlib.pyplot',
                 'wx', 'decimal', 'PyQt4.QtGui', 'PySide.QtGui', 'Tkinter']
     main(mods)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Counts how many ``ValueSet`` objects are created while inferring all
+statements of a file with ``infer_node``. This is a micro benchmark for the
+fast paths of ``ValueSet`` (shared empty and single value sets, unions that
+return one of their operands).
+
+Usage:
+  value_set_allocations.py [<path>] [-n <number>]
+  value_set_allocations.py -h | --help
+
+Options:
+  -h --help     Show this screen.
+  -n <number>   Number of passes [default: 3].
+"""
+import os
+import sys
+import time
+
+from docopt import docopt
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
+import jedi  # noqa: E402
+from jedi.inference import base_value  # noqa: E402
+
+
+def count_allocations():
+    counter = [0]
+    value_set_cls = base_value.ValueSet
+    original_create = value_set_cls._create.__func__
+
+    def _create(cls, frozenset_):
+        counter[0] += 1
+        return original_create(cls, frozenset_)
+
+    value_set_cls._create = classmethod(_create)
+    return counter
+
+
+def infer_statements(path):
+    script = jedi.Script(path=path)
+    module_context = script._get_module_context()
+    count = 0
+    for node in _iter_expr_stmts(module_context.tree_node):
+        context = module_context.create_context(node)
+        context.infer_node(node.get_rhs())
+        count += 1
+    return count
+
+
+def _iter_expr_stmts(node):
+    for child in getattr(node, 'children', []):
+        if child.type == 'expr_stmt':
+            yield child
+        else:
+            yield from _iter_expr_stmts(child)
+
+
+def main(args):
+    path = args['<path>']
+    counter = count_allocations()
+    for i in range(int(args['-n'])):
+        counter[0] = 0
+        start = time.time()
+        statements = infer_statements(path)
+        print('Pass %s: %s statements, %s ValueSet objects created, %.2fs'
+              % (i + 1, statements, counter[0], time.time() - start))
+
+
+if __name__ == '__main__':
+    args = docopt(__doc__)
+    if args['<path>'] is None:
+        args['<path>'] = os.path.join(os.path.dirname(jedi.__file__), 'api', 'completion.py')
+    main(args)
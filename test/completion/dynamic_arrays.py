@@ -395,3 +395,45 @@ some_other_dct['a']
 some_other_dct['x']
 #? set
 some_other_dct['c']
+
+# -----------------
+# shared mutation receivers
+# -----------------
+
+shared_lst1 = []
+shared_lst2 = []
+shared_st = set()
+shared_dct = {}
+for shared in [shared_lst1, shared_lst2]:
+    shared.append(1)
+    shared.extend([''])
+shared_lst1[0] = 1.0
+shared_lst2.append(b'')
+shared_st.add(1)
+shared_st.update([''])
+shared_dct['a'] = 1
+
+#? float()
+shared_lst1[0]
+#? int() str() float()
+shared_lst1[1]
+#? int() str() bytes()
+shared_lst2[0]
+#? int() str()
+list(shared_st)[0]
+#? int()
+shared_dct['a']
+
+# The receivers of the recursive additions are inferred while the additions
+# are searched, which must not hide the other additions.
+recursive_lst = []
+recursive_holders = []
+for recursive_holder in recursive_holders:
+    recursive_holder.append(1)
+recursive_holders.append(recursive_lst)
+recursive_holders.extend([recursive_lst])
+
+#? list()
+recursive_holders[0]
+#? int()
+recursive_lst[0]
@@ -0,0 +1,71 @@
+import os
+
+CODE = '''\
+def helper(x):
+    return str(x)
+
+def foo(a):
+    b = helper(a)
+    return [helper(i) for i in b]
+
+class C:
+    attr = foo(1)
+    def meth(self, x=helper(2)):
+        def inner():
+            return foo(3)
+        return foo(self.attr)
+
+foo(2)
+'''
+
+
+def _to_tuples(items):
+    return [(item.name.name, item.positions) for item in items]
+
+
+def test_incoming_calls(Script):
+    script = Script(CODE)
+    assert _to_tuples(script.get_incoming_calls(4, 4)) == [
+        ('__main__', [(15, 0)]),
+        ('C', [(9, 11)]),
+        ('meth', [(13, 15)]),
+        ('inner', [(12, 19)]),
+    ]
+    assert _to_tuples(script.get_incoming_calls(1, 4)) == [
+        ('foo', [(5, 8), (6, 12)]),
+        # Default values are executed in the class.
+        ('C', [(10, 21)]),
+    ]
+    assert script.get_incoming_calls(2, 0) == []
+
+
+def test_outgoing_calls(Script):
+    script = Script(CODE)
+    assert _to_tuples(script.get_outgoing_calls(4, 4)) == [('helper', [(5, 8), (6, 12)])]
+    assert _to_tuples(script.get_outgoing_calls(8, 6)) == [
+        ('helper', [(10, 21)]),
+        ('foo', [(9, 11)]),
+    ]
+    # Calls in nested functions are not calls of the function itself.
+    assert _to_tuples(script.get_outgoing_calls(10, 8)) == [('foo', [(13, 15)])]
+    outgoing = script.get_outgoing_calls(1, 4)
+    assert _to_tuples(outgoing) == [('str', [(2, 11)])]
+    assert outgoing[0].name.module_name == 'builtins'
+
+
+def test_outgoing_calls_of_compiled_functions(Script):
+    script = Script('def f():\n    x = []\n    x.append(1)\n    x.append(2)\n')
+    assert _to_tuples(script.get_outgoing_calls(1, 4)) == [('append', [(3, 6), (4, 6)])]
+
+
+def test_incoming_calls_in_project(Script, tmpdir):
+    from jedi.api.project import Project
+
+    tmpdir.join('mod.py').write('def func():\n    pass\n')
+    tmpdir.join('caller.py').write('from mod import func\n\ndef call():\n    func()\n')
+    tmpdir.join('no_call.py').write('from mod import func\nx = func\n')
+    project = Project(tmpdir.strpath)
+    script = Script(path=os.path.join(tmpdir.strpath, 'mod.py'), project=project)
+    items = script.get_incoming_calls(1, 4)
+    assert _to_tuples(items) == [('call', [(4, 4)])]
+    assert items[0].name.module_name == 'caller'
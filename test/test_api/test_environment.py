@@ -1,9 +1,14 @@
 import os
 import sys
+import time
+import itertools
+import threading
 
 import pytest
 
 import jedi
+from jedi.inference import compiled
+from jedi.api import environment as environment_module
 from jedi.api.environment import get_default_environment, find_virtualenvs, \
     InvalidPythonEnvironment, find_system_environments, \
     get_system_environment, create_environment, InterpreterEnvironment, \
@@ -89,6 +94,52 @@ def test_killed_subprocess(inference_state, Script, environment):
     assert def_.name == 'str'
 
 
+def test_restarted_subprocess():
+    environment = create_environment(sys.executable, safe=False)
+    inference_state = jedi.Script('', environment=environment)._inference_state
+    math = compiled.load_module(inference_state, dotted_name='math', sys_path=[])
+    handle = math.access_handle
+    subprocess = inference_state.compiled_subprocess
+    subprocess._compiled_subprocess._get_process().kill()
+    with pytest.raises(jedi.InternalError):
+        subprocess.get_compiled_method_return(handle, 'py__name__')
+
+    # The same inference state can be used again.
+    assert subprocess.get_compiled_method_return(handle, 'py__name__') == 'math'
+    assert subprocess.get_access_handle(handle.id) is handle
+
+
+def test_restart_with_released_handles():
+    environment = create_environment(sys.executable, safe=False)
+    inference_state = jedi.Script('', environment=environment)._inference_state
+    subprocess = inference_state.compiled_subprocess
+    access_path = subprocess.load_module(dotted_name='json', sys_path=[])
+    origin_count = len(subprocess._handle_origins)
+    # Calls are only repeated for handles that are still in use.
+    del access_path
+    assert len(subprocess._handle_origins) == origin_count - 1
+
+    math = compiled.load_module(inference_state, dotted_name='math', sys_path=[])
+    subprocess._compiled_subprocess._get_process().kill()
+    with pytest.raises(jedi.InternalError):
+        subprocess.get_sys_path()
+    handle = math.access_handle
+    assert subprocess.get_compiled_method_return(handle, 'py__name__') == 'math'
+
+
+def test_restart_backoff(monkeypatch):
+    environment = create_environment(sys.executable, safe=False)
+    for i in range(4):
+        environment._get_subprocess()._get_process().kill()
+        with pytest.raises(jedi.InternalError):
+            environment._get_subprocess().get_sys_path()
+    with pytest.raises(jedi.InternalError, match='crashed repeatedly'):
+        environment._get_subprocess()
+
+    monkeypatch.setattr(time, 'time', lambda: environment._subprocess.crash_time + 1)
+    assert environment._get_subprocess().get_sys_path()
+
+
 def test_not_existing_virtualenv(monkeypatch):
     """Should not match the path that was given"""
     path = '/foo/bar/jedi_baz'
@@ -117,6 +168,82 @@ def test_create_environment_executable():
     assert environment.executable == sys.executable
 
 
+def test_environment_registry(monkeypatch):
+    environment = create_environment(sys.executable, safe=False)
+    sys_path = environment.get_sys_path()
+    sha256 = environment._sha256
+
+    def create_subprocess(*args, **kwargs):
+        raise AssertionError("The environment should be registered")
+
+    def calculate_sha256(path):
+        raise AssertionError("The hash should be stored")
+
+    monkeypatch.setattr(environment_module, 'CompiledSubprocess', create_subprocess)
+    monkeypatch.setattr(environment_module, '_calculate_sha256_for_file', calculate_sha256)
+    registered = create_environment(sys.executable, safe=False)
+    assert registered.executable == environment.executable
+    assert registered.version_info == environment.version_info
+    assert registered.get_sys_path() == sys_path
+    assert registered._sha256 == sha256
+
+
+def test_environment_registry_requires_executable(tmpdir):
+    link = os.path.join(str(tmpdir), 'python')
+    os.symlink(sys.executable, link)
+    environment = create_environment(link, safe=False)
+    assert environment._load_registry_entry()
+
+    # Entries are not used if the executable or the reported prefix changed.
+    info = environment._load_registry_entry()['info']
+    environment._update_registry_entry(sha256='other')
+    assert environment._load_registry_entry() == {}
+    environment._update_registry_entry(
+        sha256=environment_module._get_sha256_for_file(link),
+        info=(info[0], str(tmpdir.join('removed')), info[2]),
+    )
+    assert environment._load_registry_entry() == {}
+    environment._update_registry_entry(info=info)
+    assert environment._load_registry_entry()
+
+    os.remove(link)
+    assert environment._load_registry_entry() == {}
+
+    # A link that points to another binary has its own entry.
+    other = os.path.join(str(tmpdir), 'other')
+    with open(other, 'w') as f:
+        f.write('')
+    os.symlink(other, link)
+    assert environment._load_registry_entry() == {}
+
+
+def test_iter_in_parallel_is_lazy():
+    release = threading.Event()
+
+    def probe(argument):
+        if argument == 0:
+            release.wait(10)
+        return argument
+
+    consumed = []
+
+    def iter_arguments():
+        for argument in itertools.count():
+            consumed.append(argument)
+            yield argument
+
+    results = environment_module._iter_in_parallel(probe, iter_arguments())
+    # The first probe is slower than the others.
+    threading.Timer(0.1, release.set).start()
+    # The results are in the order of the arguments.
+    assert [next(results) for _ in range(3)] == [0, 1, 2]
+    results.close()
+    # Arguments are only consumed for free threads, not all of them upfront.
+    assert len(consumed) <= 2 * environment_module._MAX_PROBING_THREADS
+
+    assert list(environment_module._iter_in_parallel(probe, range(20))) == list(range(20))
+
+
 def test_get_default_environment_from_env_does_not_use_safe(tmpdir, monkeypatch):
     fake_python = os.path.join(str(tmpdir), 'fake_python')
     with open(fake_python, 'w', newline='') as f:
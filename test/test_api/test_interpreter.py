@@ -4,10 +4,13 @@ Tests of ``jedi.api.Interpreter``.
 import sys
 import warnings
 import typing
+from pathlib import Path
 
 import pytest
+from parso.tree import NodeOrLeaf
 
 import jedi
+from jedi.cache import remove_parser_cache_item
 from jedi.inference.compiled import mixed
 from importlib import import_module
 
@@ -678,3 +681,133 @@ def test_negate():
     assert x.name == 'int'
     value, = x._name.infer()
     assert value.get_safe_value() == -3
+
+
+def test_session():
+    class SessionObject:
+        def method(self):
+            pass
+
+    session = jedi.InterpreterSession()
+    namespace = {'foo': SessionObject(), 'x': 1}
+
+    def complete(code):
+        return [c.name for c in jedi.Interpreter(code, [namespace], session=session).complete()]
+
+    assert complete('foo.met') == ['method']
+    inference_state = session._state.inference_state
+    handles = inference_state.compiled_subprocess._handles
+    assert id(namespace['foo']) in handles
+
+    # Objects might be changed between calls.
+    namespace['foo'].method_two = 1
+    assert complete('foo.met') == ['method', 'method_two']
+    assert complete('x.rea') == ['real']
+
+    # Replaced objects are released.
+    old_id = id(namespace['foo'])
+    namespace['foo'] = 'string'
+    namespace['x'] = None
+    assert complete('foo.upp') == ['upper']
+    assert complete('x.rea') == []
+    assert old_id not in handles
+
+    # Classes might be changed between calls as well.
+    assert inference_state.class_tables
+    SessionObject.class_attr = 1
+    jedi.Interpreter('', [namespace], session=session)
+    assert not inference_state.class_tables
+
+    with pytest.raises(TypeError):
+        jedi.Interpreter('', [namespace], session=session,
+                         environment=jedi.InterpreterEnvironment())
+
+
+def test_syntax_node_cache(monkeypatch):
+    class CachedObject:
+        def cached_method(self):
+            pass
+
+    searched = []
+
+    def search(inference_state, python_object):
+        searched.append(python_object)
+        return search_in_file(inference_state, python_object)
+
+    search_in_file = mixed._search_syntax_node_in_file
+    monkeypatch.setattr(mixed, '_search_syntax_node_in_file', search)
+
+    namespace = {'obj': CachedObject()}
+    for i in range(2):
+        c, = jedi.Interpreter('obj.cached_meth', [namespace]).complete()
+        assert c.name == 'cached_method'
+        assert c.infer()[0].line == CachedObject.cached_method.__code__.co_firstlineno
+    assert searched.count(CachedObject) == 1
+    # The entries don't keep syntax trees alive.
+    entry = mixed._syntax_node_cache[CachedObject]
+    assert not any(isinstance(part, NodeOrLeaf) for part in entry)
+
+    # Renamed objects are searched again.
+    CachedObject.__name__ = 'Renamed'
+    jedi.Interpreter('obj.cached_meth', [namespace]).complete()
+    assert searched.count(CachedObject) == 2
+
+
+class _EvictedFirst:
+    first_attr = 1
+
+
+class _EvictedSecond:
+    second_attr = 1
+
+
+def test_session_with_evicted_module():
+    session = jedi.InterpreterSession()
+    inference_state = session._state.inference_state
+    namespace = {'first': _EvictedFirst, 'second': _EvictedSecond}
+
+    def complete(code):
+        return [c.name for c in jedi.Interpreter(code, [namespace], session=session).complete()]
+
+    assert complete('first.first_') == ['first_attr']
+    # parso's cache might lose the module while the session still uses it.
+    remove_parser_cache_item(inference_state.grammar._hashed, Path(__file__))
+    assert complete('second.second_') == ['second_attr']
+
+
+def test_session_releases_reached_objects():
+    class Holder:
+        pass
+
+    session = jedi.InterpreterSession()
+    holder = Holder()
+    holder.attr = Holder()
+    holder.attr.value = 1
+    namespace = {'holder': holder}
+    handles = session._state.inference_state.compiled_subprocess._handles
+
+    def complete(code):
+        return [c.name for c in jedi.Interpreter(code, [namespace], session=session).complete()]
+
+    assert complete('holder.attr.val') == ['value']
+    holder_handle = handles[id(holder)]
+    assert id(holder.attr) in handles
+
+    # Unchanged objects keep their handles and cached results.
+    namespace['_'] = object()
+    assert complete('holder.attr.val') == ['value']
+    assert handles[id(holder)] is holder_handle
+    assert holder_handle.__dict__.get('_memoize_method_dct')
+    assert session._state._calls_since_purge == 2
+
+    # Objects that are reached through changed objects are released.
+    old_attr_id = id(holder.attr)
+    holder.attr = Holder()
+    holder.attr.other = 1
+    assert complete('holder.attr.oth') == ['other']
+    assert old_attr_id not in handles
+
+    old_attr_id = id(holder.attr)
+    namespace['holder'] = None
+    assert complete('holder.attr.oth') == []
+    assert old_attr_id not in handles
@@ -6,6 +6,7 @@ import pytest
 from ..helpers import get_example_dir, set_cwd, root_dir, test_dir
 from jedi import Interpreter
 from jedi.api import Project, get_default_project
+from jedi.api import project as project_module
 
 
 def test_django_default_project(Script):
@@ -45,6 +46,32 @@ def test_added_sys_path(inference_state):
     assert p in project._get_sys_path(inference_state)
 
 
+def test_cached_default_project(tmpdir, monkeypatch):
+    sub_dir = tmpdir.join('foo').join('bar')
+    sub_dir.ensure(dir=True)
+    tmpdir.join('setup.py').write('')
+    for dir in (tmpdir, tmpdir.join('foo'), sub_dir):
+        os.utime(dir.strpath, (0, 0))
+    # The temporary parent directories were just created.
+    monkeypatch.setattr(project_module, 'is_recently_modified', lambda stats: False)
+
+    project = get_default_project(sub_dir.strpath)
+    assert project.path == Path(tmpdir.strpath)
+
+    def find_default_project(*args):
+        raise AssertionError("The project should be cached")
+
+    with monkeypatch.context() as m:
+        m.setattr(project_module, '_find_default_project', find_default_project)
+        cached = get_default_project(sub_dir.strpath)
+        assert cached is not project
+        assert cached.path == project.path
+
+    tmpdir.join('foo').join('setup.py').write('')
+    os.utime(tmpdir.join('foo').strpath, (1, 1))
+    assert get_default_project(sub_dir.strpath).path == Path(tmpdir.join('foo').strpath)
+
+
 def test_load_save_project(tmpdir):
     project = Project(tmpdir.strpath, added_sys_path=['/foo'])
     project.save()
@@ -160,3 +187,46 @@ def test_complete_search(Script, string, completions, all_scopes):
     project = Project(test_dir)
     defs = project.complete_search(string, all_scopes=all_scopes)
     assert [d.complete for d in defs] == completions
+
+
+def test_overlay(Script, tmpdir):
+    from jedi.cache import get_parser_cache_statistics
+
+    tmpdir.join('mod.py').write('on_disk = 1\n')
+    project = Project(str(tmpdir))
+    project.overlay.set(str(tmpdir.join('mod.py')), 'in_buffer = 1\n', version=1)
+    project.overlay.set(str(tmpdir.join('new.py')), 'def unsaved_function(): pass\n', 1)
+
+    def complete():
+        script = Script('import mod; mod.', path=str(tmpdir.join('main.py')), project=project)
+        return [c.name for c in script.complete() if not c.name.startswith('_')]
+
+    assert complete() == ['in_buffer']
+    # Unchanged buffers are not parsed again.
+    misses = get_parser_cache_statistics()['misses']
+    assert complete() == ['in_buffer']
+    assert get_parser_cache_statistics()['misses'] == misses
+
+    project.overlay.set(str(tmpdir.join('mod.py')), 'in_buffer2 = 1\n', version=2)
+    assert complete() == ['in_buffer2']
+    project.overlay.remove(str(tmpdir.join('mod.py')))
+    assert project.overlay.get_version(str(tmpdir.join('mod.py'))) is None
+    assert complete() == ['on_disk']
+
+    # Files that only exist in the overlay are found by searches.
+    names = [n.name for n in project.search('unsaved_function')]
+    assert names == ['unsaved_function']
+
+
+def test_overlay_script_with_path(Script, tmpdir):
+    path = str(tmpdir.join('mod.py'))
+    tmpdir.join('mod.py').write('on_disk = 1\n')
+    project = Project(str(tmpdir))
+    project.overlay.set(path, 'in_buffer = 1\n', version=1)
+    assert [n.name for n in Script(path=path, project=project).get_names()] == ['in_buffer']
+
+    # The file doesn't need to exist.
+    new_path = str(tmpdir.join('new.py'))
+    project.overlay.set(new_path, 'only_in_buffer = 1\n', version=1)
+    names = Script(path=new_path, project=project).get_names()
+    assert [n.name for n in names] == ['only_in_buffer']
@@ -61,3 +61,65 @@ foo()
 
     for place in places:
         assert places == [(n.line, n.column) for n in script.get_references(scope='file', *place)]
+
+
+def test_name_scanner(tmpdir):
+    from jedi.file_io import FileIO, KnownContentFileIO
+    from jedi.inference.references import NameScanner
+
+    tmpdir.join('a.py').write('import foo\nfoobar = foo.baz()\n')
+    tmpdir.join('empty.py').write('')
+    scanner = NameScanner(['foo', 'baz', 'missing'])
+    code, names = scanner.scan(FileIO(tmpdir.join('a.py').strpath))
+    assert code == 'import foo\nfoobar = foo.baz()\n'
+    assert names == {'foo', 'baz'}
+    assert scanner.scan(FileIO(tmpdir.join('empty.py').strpath)) is None
+    assert scanner.scan(FileIO(tmpdir.join('not_existing.py').strpath)) is None
+    assert scanner.scan(KnownContentFileIO('x.py', 'foobar = 1')) is None
+
+    unicode_scanner = NameScanner(['föö'])
+    assert unicode_scanner.scan(KnownContentFileIO('x.py', 'föö = 1'))[1] == {'föö'}
+
+
+def test_total_parsed_file_limit(inference_state, tmpdir, monkeypatch):
+    from jedi.file_io import FileIO
+    from jedi.inference import references
+
+    for i in range(5):
+        tmpdir.join('m%s.py' % i).write('foo = 1\nbar = 2\n')
+    file_ios = [FileIO(tmpdir.join('m%s.py' % i).strpath) for i in range(5)]
+    monkeypatch.setattr(references, '_TOTAL_PARSED_FILE_LIMIT', 3)
+    found = list(references.search_names_in_file_ios(
+        inference_state, iter(file_ios), ['foo', 'bar']))
+    assert len(found) == 3
+
+
+def test_reference_counts(Script, tmpdir):
+    from jedi.api.project import Project
+
+    tmpdir.join('other.py').write('from mod import func, Class\nfunc(Class().method())\n')
+    code = (
+        'import os\n'
+        'def func(a):\n'
+        '    b = a\n'
+        'class Class:\n'
+        '    attr = func(1)\n'
+        '    def method(self):\n'
+        '        return self.attr\n'
+        'func(Class.attr)\n'
+    )
+    path = tmpdir.join('mod.py')
+    path.write(code)
+    project = Project(tmpdir.strpath)
+    script = Script(code, path=path.strpath, project=project)
+    reference_counts = script.get_reference_counts()
+    assert [(r.definition.name, r.count) for r in reference_counts] == [
+        ('func', 5), ('Class', 4), ('attr', 3), ('method', 2)
+    ]
+    for reference_count in reference_counts:
+        definition = reference_count.definition
+        references = script.get_references(definition.line, definition.column)
+        assert reference_count.get_references() == references
+
+    file_counts = script.get_reference_counts(scope='file')
+    assert [r.count for r in file_counts] == [3, 2, 3, 1]
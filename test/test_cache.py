@@ -1,6 +1,10 @@
 """
 Test all things related to the ``jedi.cache`` module.
 """
+import gc
+import os
+import threading
+from pathlib import Path
 
 
 def test_cache_get_signatures(Script):
@@ -27,3 +31,85 @@ def test_cache_get_signatures(Script):
 def test_cache_line_split_issues(Script):
     """Should still work even if there's a newline."""
     assert Script('int(\n').get_signatures()[0].name == 'int'
+
+
+def test_persistent_cache():
+    from jedi.cache import load_persistent_cache, save_persistent_cache
+
+    assert load_persistent_cache('test', ('key', 1)) is None
+    assert load_persistent_cache('test', ('key', 1), default=3) == 3
+    save_persistent_cache('test', ('key', 1), {'a': [1, 2]})
+    assert load_persistent_cache('test', ('key', 1)) == {'a': [1, 2]}
+    assert load_persistent_cache('test', ('key', 2)) is None
+
+
+def test_write_persistent_file_from_threads(tmpdir):
+    from jedi.cache import write_persistent_file
+
+    path = str(tmpdir.join('file'))
+    contents = [str(i).encode() * 100000 for i in range(8)]
+    threads = [
+        threading.Thread(target=lambda data=data: results.append(write_persistent_file(path, data)))
+        for data in contents
+    ]
+    results = []
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [True] * len(contents)
+    with open(path, 'rb') as f:
+        assert f.read() in contents
+    # No temporary files are left behind.
+    assert os.listdir(str(tmpdir)) == ['file']
+
+
+def test_parser_cache_limit(tmpdir, inference_state, monkeypatch):
+    from jedi import cache
+    from jedi.inference import InferenceState
+
+    code = 'x = 1\n' * 100
+    paths = []
+    for name in 'abc':
+        path = tmpdir.join(name + '.py')
+        path.write(code)
+        paths.append(str(path))
+
+    def is_cached(path):
+        return cache.get_parser_cache_item(state.grammar._hashed, Path(path)) is not None
+
+    old_cache = cache.parser_cache.copy()
+    cache.parser_cache.clear()
+    try:
+        state = InferenceState(inference_state.project, inference_state.environment)
+        state.parse(path=paths[0], cache=True)
+        before = cache.get_parser_cache_statistics()
+        other_state = InferenceState(inference_state.project, inference_state.environment)
+        other_state.parse(path=paths[1], cache=True)
+        other_state.parse(path=paths[2], cache=True)
+        state.parse(path=paths[0], cache=True)
+        statistics = cache.get_parser_cache_statistics()
+        assert statistics['hits'] == before['hits'] + 1
+        assert statistics['misses'] == before['misses'] + 2
+        assert statistics['modules'] == 3
+        assert statistics['bytes'] == 3 * len(code)
+
+        # Modules that are used by an inference state are pinned.
+        cache.limit_parser_cache(0)
+        assert all(map(is_cached, paths))
+
+        # The least recently used module is removed first.
+        del other_state
+        gc.collect()
+        cache.limit_parser_cache(2 * len(code))
+        assert [is_cached(p) for p in paths] == [True, False, True]
+        assert cache.get_parser_cache_statistics()['evictions'] == statistics['evictions'] + 1
+
+        # Only the modules that were used last are pinned.
+        monkeypatch.setattr(cache, '_MAX_PINNED_MODULES', 1)
+        state.parse(path=paths[1], cache=True)
+        cache.limit_parser_cache(0)
+        assert [is_cached(p) for p in paths] == [False, True, False]
+    finally:
+        cache.parser_cache.clear()
+        cache.parser_cache.update(old_cache)
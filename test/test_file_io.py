@@ -1,5 +1,11 @@
+import os
 from os.path import join
+
+import pytest
+
+from jedi import file_io
 from jedi.file_io import FolderIO
+from jedi.inference.references import recurse_find_python_files
 from test.helpers import get_example_dir
 
 
@@ -25,3 +31,78 @@ def test_folder_io_walk2():
     root, folder_ios, file_ios = next(iterator)
     folder_ios.clear()
     assert next(iterator, None) is None
+
+
+@pytest.mark.parametrize(
+    'gitignore, path, is_directory, expected', [
+        ('*.py', 'a.py', False, True),
+        ('*.py', 'foo/a.py', False, True),
+        ('*.py\n!keep.py', 'foo/keep.py', False, False),
+        ('build/', 'build', True, True),
+        ('build/', 'build', False, False),
+        ('/build', 'foo/build', True, False),
+        ('foo/bar', 'foo/bar', True, True),
+        ('foo/bar', 'x/foo/bar', True, False),
+        ('**/generated', 'x/y/generated', True, True),
+        ('docs/**/*.py', 'docs/a/b/c.py', False, True),
+        ('docs/**', 'docs/a.py', False, True),
+        ('te?t_[ab].py', 'test_a.py', False, True),
+        ('te?t_[!ab].py', 'test_a.py', False, False),
+        ('# *.py\n\\#x.py', '#x.py', False, True),
+        ('# *.py', 'a.py', False, False),
+    ]
+)
+def test_gitignore(gitignore, path, is_directory, expected):
+    from jedi.inference.gitignore import GitIgnore, compile_gitignore
+    root = os.path.abspath('root')
+    git_ignore = GitIgnore(root, compile_gitignore(gitignore))
+    assert git_ignore.is_ignored(os.path.join(root, path), is_directory) == expected
+
+
+def test_recurse_find_python_files_gitignore(tmpdir):
+    tmpdir.join('.gitignore').write('*_ignored.py\nbuild/\n')
+    tmpdir.join('a.py').write('')
+    tmpdir.join('a_ignored.py').write('')
+    tmpdir.mkdir('build').join('b.py').write('')
+    sub = tmpdir.mkdir('sub')
+    sub.join('.gitignore').write('!*_ignored.py\nc.py\n')
+    sub.join('c.py').write('')
+    sub.join('c_ignored.py').write('')
+
+    file_ios = recurse_find_python_files(FolderIO(tmpdir.strpath))
+    paths = sorted(os.path.relpath(str(f.path), tmpdir.strpath) for f in file_ios)
+    assert paths == ['a.py', os.path.join('sub', 'c_ignored.py')]
+
+
+def test_list_directory_cache(tmpdir, monkeypatch):
+    tmpdir.join('a.py').write('')
+    tmpdir.mkdir('folder')
+    os.utime(tmpdir.strpath, (0, 0))
+    monkeypatch.setattr(file_io, '_directory_cache', {})
+    entries = file_io.list_directory(tmpdir.strpath)
+    assert sorted(entries) == [('a.py', False, False), ('folder', True, False)]
+
+    def scandir(path):
+        raise AssertionError("The listing should be cached")
+
+    with monkeypatch.context() as m:
+        m.setattr(os, 'scandir', scandir)
+        assert file_io.list_directory(tmpdir.strpath) == entries
+
+    tmpdir.join('b.py').write('')
+    assert len(file_io.list_directory(tmpdir.strpath)) == 3
+
+
+def test_list_directory_cache_is_bounded(tmpdir, monkeypatch):
+    monkeypatch.setattr(file_io, '_directory_cache', {})
+    monkeypatch.setattr(file_io, '_MAX_DIRECTORY_LISTINGS', 2)
+    paths = {}
+    for name in 'abc':
+        paths[name] = tmpdir.mkdir(name).strpath
+        os.utime(paths[name], (0, 0))
+    file_io.list_directory(paths['a'])
+    file_io.list_directory(paths['b'])
+    # Using a listing keeps it in the cache.
+    file_io.list_directory(paths['a'])
+    file_io.list_directory(paths['c'])
+    assert list(file_io._directory_cache) == [paths['a'], paths['c']]
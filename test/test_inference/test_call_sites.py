@@ -0,0 +1,70 @@
+from parso import parse
+
+from jedi.cache import load_persistent_cache
+from jedi.file_io import FileIO, KnownContentFileIO
+from jedi.inference import call_sites
+
+
+def test_call_site_index():
+    code = 'def foo(a):\n    bar(a).baz ( 1)\nclass X(object): pass\nx = "foo(1)"\n'
+    index = call_sites.get_call_site_index(KnownContentFileIO(None, code))
+    # Definitions are not calls, but calls in strings are found by the regex.
+    assert index == {'bar': [(2, 4)], 'baz': [(2, 11)], 'foo': [(4, 5)]}
+
+
+def test_call_site_names():
+    code = 'x = "foo(1)"\nfoo(2)\nx.foo(3)\n'
+    module_node = parse(code)
+    positions = call_sites.get_call_site_index(KnownContentFileIO(None, code))['foo']
+    # The call in the string is not a name and a position after the end of the
+    # module (e.g. of an outdated index) is ignored.
+    names = call_sites.get_call_site_names(module_node, 'foo', positions + [(9, 0)])
+    assert [n.start_pos for n in names] == [(2, 0), (3, 2)]
+
+
+def test_call_site_index_persisted(tmpdir, monkeypatch):
+    path = tmpdir.join('calls.py')
+    path.write('foo(1)\n')
+    tmpdir.join('other.py').write('bar(1)\n')
+    file_io = FileIO(str(path))
+    assert call_sites.get_call_site_index(file_io) == {'foo': [(1, 0)]}
+    assert call_sites.get_call_site_index(FileIO(tmpdir.join('other.py').strpath))
+    call_sites.save_call_site_indexes()
+    # The indexes of a directory are stored together.
+    cached = load_persistent_cache('call_sites', (tmpdir.strpath,))
+    assert sorted(cached) == ['calls.py', 'other.py']
+
+    # Reload from the file system instead of memory.
+    monkeypatch.setattr(call_sites, '_call_site_cache', {})
+    monkeypatch.setattr(call_sites, '_create_call_site_index', None)
+    assert call_sites.get_call_site_index(file_io) == {'foo': [(1, 0)]}
+
+    monkeypatch.undo()
+    path.write('bar(1)\nfoo(2)\n')
+    # Changing the size of a file changes the cache key.
+    assert call_sites.get_call_site_index(file_io) == {'bar': [(1, 0)], 'foo': [(2, 0)]}
+
+
+def test_call_site_cache_is_bounded(tmpdir, monkeypatch):
+    monkeypatch.setattr(call_sites, '_call_site_cache', {})
+    monkeypatch.setattr(call_sites, '_unsaved_directories', set())
+    monkeypatch.setattr(call_sites, '_MAX_CALL_SITE_DIRECTORIES', 2)
+    for name in 'abc':
+        directory = tmpdir.mkdir(name)
+        directory.join('calls.py').write('foo(1)\n')
+        call_sites.get_call_site_index(FileIO(directory.join('calls.py').strpath))
+    assert list(call_sites._call_site_cache) == [tmpdir.join(n).strpath for n in 'bc']
+    # The indexes of a dropped directory are persisted.
+    cached = load_persistent_cache('call_sites', (tmpdir.join('a').strpath,))
+    assert list(cached) == ['calls.py']
+    call_sites.save_call_site_indexes()
+
+
+def test_dynamic_params_in_other_module(Script, tmpdir):
+    tmpdir.join('callee.py').write('def callee(param):\n    return param\n')
+    tmpdir.join('caller.py').write('import callee\ncallee.callee(1.0)\n')
+    path = tmpdir.join('callee.py').strpath
+    code = 'def callee(param):\n    param'
+    project = __import__('jedi').Project(tmpdir.strpath)
+    defs = Script(code, path=path, project=project).infer(2, 5)
+    assert [d.name for d in defs] == ['float']
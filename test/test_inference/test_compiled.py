@@ -5,8 +5,12 @@ from datetime import datetime
 
 import pytest
 
+from jedi import InterpreterEnvironment, settings
 from jedi.inference import compiled
+from jedi.inference.compiled import introspection_cache
+from jedi.inference.compiled.subprocess import InferenceStateSubprocess
 from jedi.inference.compiled.access import DirectObjectAccess
+from jedi.inference.compiled.getattr_static import getattr_static
 from jedi.inference.gradual.conversion import _stub_to_python_value_set
 from jedi.inference.syntax_tree import _infer_comparison_part
 
@@ -167,3 +171,151 @@ def test_operation(Script, inference_state, create_compiled_object):
     )
     assert false.py__name__() == 'bool'
     assert true.py__name__() == 'bool'
+
+
+@pytest.fixture
+def called_access_methods(environment, monkeypatch):
+    if isinstance(environment, InterpreterEnvironment):
+        pytest.skip("Only calls to subprocesses are counted.")
+
+    methods = []
+
+    class CountingSubprocess(InferenceStateSubprocess):
+        def get_compiled_method_return(self, id_, name, *args, **kwargs):
+            methods.append(name)
+            return self.__getattr__('get_compiled_method_return')(id_, name, *args, **kwargs)
+
+    monkeypatch.setattr(
+        environment, 'get_inference_state_subprocess',
+        lambda inference_state: CountingSubprocess(
+            inference_state, environment._get_subprocess()
+        ),
+    )
+    return methods
+
+
+def test_persisted_introspection(Script, called_access_methods, monkeypatch):
+    monkeypatch.setattr(InferenceStateSubprocess, 'fetch_attributes_in_bulk', False)
+    monkeypatch.setattr(introspection_cache, '_tables', {})
+
+    def complete_math():
+        called_access_methods.clear()
+        completions = Script('import math\nmath.').complete()
+        result = [(c.name, c.type, c.docstring()) for c in completions]
+        persisted = [m for m in called_access_methods
+                     if m in introspection_cache.PERSISTED_METHODS]
+        return result, len(persisted)
+
+    first, first_count = complete_math()
+    introspection_cache.save_introspection_tables()
+    monkeypatch.setattr(introspection_cache, '_tables', {})
+
+    second, second_count = complete_math()
+    assert second == first
+    assert second_count < first_count / 5
+
+
+def test_persisted_attribute_table(Script, called_access_methods, disable_typeshed,
+                                   monkeypatch, tmpdir):
+    monkeypatch.setattr(settings, 'cache_directory', tmpdir.strpath)
+    monkeypatch.setattr(introspection_cache, '_tables', {})
+
+    def complete_math():
+        called_access_methods.clear()
+        return [(c.name, c.type) for c in Script('import math\nmath.').complete()]
+
+    first = complete_math()
+    assert 'get_attribute_table' in called_access_methods
+    introspection_cache.save_introspection_tables()
+    monkeypatch.setattr(introspection_cache, '_tables', {})
+
+    assert complete_math() == first
+    assert 'get_attribute_table' not in called_access_methods
+
+
+def test_attribute_table(Script, called_access_methods, disable_typeshed):
+    completions = Script('import math\nmath.').complete()
+    assert [c.type for c in completions if c.name == 'cos'] == ['function']
+    assert 'get_attribute_table' in called_access_methods
+    assert 'getattr_paths' not in called_access_methods
+    assert 'get_api_type' not in called_access_methods
+
+
+def test_attribute_table_threshold(inference_state):
+    math = compiled.load_module(inference_state, dotted_name='math', sys_path=[])
+    filter_, = math.get_filters()
+    assert filter_.get('cos')
+    assert filter_._looked_up_names is not None
+    for name in ('sin', 'tan', 'pi'):
+        filter_.get(name)
+    expected = inference_state.compiled_subprocess.fetch_attributes_in_bulk
+    assert (filter_._looked_up_names is None) == expected
+
+
+def test_attribute_table_handles(inference_state):
+    subprocess = inference_state.compiled_subprocess
+    if not subprocess.fetch_attributes_in_bulk:
+        pytest.skip("Attribute tables are only used for subprocesses.")
+
+    math = compiled.load_module(inference_state, dotted_name='math', sys_path=[])
+    filter_, = math.get_filters()
+    handle_count = len(subprocess._handles)
+    names = filter_.values()
+    assert len(names) > 20
+    # Handles are only created for attributes that are inferred.
+    assert len(subprocess._handles) == handle_count
+    cos, = [n for n in names if n.string_name == 'cos']
+    assert cos.api_type == 'function'
+    assert len(subprocess._handles) == handle_count
+    cos.infer()
+    assert len(subprocess._handles) > handle_count
+
+
+def test_getattr_static_class_tables():
+    class Meta(type):
+        meta_attr = 1
+
+    class Base(metaclass=Meta):
+        base_attr = 1
+        overwritten = 1
+
+        @property
+        def prop(self):
+            return 1
+
+    class Slots(Base):
+        __slots__ = ('slot',)
+        overwritten = 2
+
+    class Child(Base):
+        overwritten = 3
+
+    child = Child()
+    child.instance_attr = 1
+    child.__dict__['prop'] = 2
+    slots = Slots()
+    slots.slot = 1
+
+    class_tables = {}
+    for obj in (Base, Child, child, Slots, slots, 1, int, [], math):
+        for name in dir(obj) + ['meta_attr', 'prop', 'missing']:
+            expected = getattr_static(obj, name, default=None)
+            assert getattr_static(obj, name, default=None, class_tables=class_tables) == expected
+    assert class_tables[id(Child)][0] is Child
+
+
+def test_getattr_static_class_tables_dont_hash_classes():
+    class Meta(type):
+        def __hash__(cls):
+            raise AssertionError("Metaclasses must not be executed")
+
+        def __eq__(cls, other):
+            raise AssertionError("Metaclasses must not be executed")
+
+    class Unhashable(metaclass=Meta):
+        attr = 1
+
+    class_tables = {}
+    for obj in (Unhashable, Unhashable()):
+        assert getattr_static(obj, 'attr', class_tables=class_tables) == (1, False)
+    assert class_tables[id(Unhashable)][0] is Unhashable
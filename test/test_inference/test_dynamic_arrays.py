@@ -0,0 +1,27 @@
+from jedi.inference.value import dynamic_arrays
+
+
+def test_mutation_receiver_cache(Script, monkeypatch):
+    script = Script('lst = []\nlst.append(1)\n')
+    module_context = script._get_module_context()
+    name = module_context.tree_node.get_used_names()['lst'][1]
+    context = module_context.create_context(name)
+    detector = context.inference_state.recursion_detector
+    memoize_cache = context.inference_state.memoize_cache
+
+    infer_call_of_leaf = dynamic_arrays.infer_call_of_leaf
+
+    def stopped_infer_call_of_leaf(*args, **kwargs):
+        detector.refused_count += 1
+        return infer_call_of_leaf(*args, **kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(dynamic_arrays, 'infer_call_of_leaf', stopped_infer_call_of_leaf)
+        receiver, = dynamic_arrays._infer_mutation_receiver(context, name)
+    # A result is not shared if a recursion was stopped while inferring it.
+    assert not memoize_cache[dynamic_arrays._infer_mutation_receiver]
+
+    receivers = dynamic_arrays._infer_mutation_receiver(context, name)
+    assert list(receivers) == [receiver]
+    cache = memoize_cache[dynamic_arrays._infer_mutation_receiver]
+    assert cache == {(context, name): receivers}
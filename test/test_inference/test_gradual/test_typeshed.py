@@ -1,8 +1,13 @@
 import os
+import weakref
+import types
 
 import pytest
 from parso.utils import PythonVersionInfo
 
+from jedi import settings
+from jedi.inference import flow_analysis
+from jedi.inference.compiled.stubgen import generate_stub
 from jedi.inference.gradual import typeshed
 from jedi.inference.value import TreeInstance, BoundMethod, FunctionValue, \
     MethodValue, ClassValue
@@ -240,3 +245,87 @@ def test_django_exists_only_as_stub(Script):
     else:
         pytest.skip('django is already installed, it should only exist as a stub for this test')
     assert not Script('import django').infer()
+
+
+def test_generate_stub():
+    module = types.ModuleType('foo')
+    exec(
+        'import os\n'
+        'class Foo(int):\n'
+        '    x = 1\n'
+        '    def method(self, a, *, b=3): pass\n'
+        '    @staticmethod\n'
+        '    def static(a): pass\n'
+        'def func(a: int, /, b=1) -> str: pass\n'
+        'constant = 1.0\n',
+        module.__dict__
+    )
+    assert generate_stub(module) == (
+        'class Foo(int):\n'
+        '    x: int\n'
+        '    def method(self, a, *, b=...): ...\n'
+        '    @staticmethod\n'
+        '    def static(a): ...\n'
+        '\n'
+        'constant: float\n'
+        'def func(a: int, b=...) -> str: ...\n'
+        'import os as os\n'
+    )
+
+
+def test_generated_compiled_stub(Script, monkeypatch, disable_typeshed):
+    monkeypatch.setattr(settings, 'generate_compiled_stubs', True)
+    cos, = Script('import math\nmath.cos').infer()
+    assert cos.is_stub()
+    assert cos.module_path.suffix == '.pyi'
+    assert [s.to_string() for s in cos.get_signatures()] == ['cos(x)']
+
+
+def test_persisted_stub_file_map(monkeypatch):
+    version_info = PythonVersionInfo(3, 8)
+    monkeypatch.setattr(typeshed, '_version_cache', {})
+    map_ = typeshed._cache_stub_file_map(version_info)
+    assert 'os' in map_
+
+    def create_stub_map(path_infos):
+        raise AssertionError("Should be loaded from the cache")
+
+    monkeypatch.setattr(typeshed, '_version_cache', {})
+    monkeypatch.setattr(typeshed, '_merge_create_stub_map', create_stub_map)
+    assert typeshed._cache_stub_file_map(version_info) == map_
+
+
+def test_shared_stub_flow_checks(Script, monkeypatch):
+    def complete():
+        return [c.name for c in Script('import os\nos.').complete()]
+
+    first = complete()
+    assert flow_analysis._stub_reachability_cache
+
+    def not_in_stubs(func):
+        def wrapper(context, *args):
+            assert not context.get_root_context().is_stub()
+            return func(context, *args)
+        return wrapper
+
+    with monkeypatch.context() as m:
+        m.setattr(flow_analysis, '_infer_condition', not_in_stubs(flow_analysis._infer_condition))
+        m.setattr(flow_analysis, '_break_check', not_in_stubs(flow_analysis._break_check))
+        assert complete() == first
+
+
+def test_stub_flow_checks_with_stopped_recursions(Script, monkeypatch):
+    monkeypatch.setattr(flow_analysis, '_stub_reachability_cache', weakref.WeakKeyDictionary())
+
+    def stop_recursion(func):
+        def wrapper(context, *args):
+            context.inference_state.recursion_detector.refused_count += 1
+            return func(context, *args)
+        return wrapper
+
+    with monkeypatch.context() as m:
+        m.setattr(flow_analysis, '_infer_condition', stop_recursion(flow_analysis._infer_condition))
+        m.setattr(flow_analysis, '_break_check', stop_recursion(flow_analysis._break_check))
+        Script('import os\nos.').complete()
+    # Results might be incomplete if a recursion was stopped, they are not shared.
+    assert not any(flow_analysis._stub_reachability_cache.values())
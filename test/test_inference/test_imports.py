@@ -187,6 +187,73 @@ def test_cache_works_with_sys_path_param(Script, tmpdir):
     assert 'foo' not in [c.name for c in bar_completions]
 
 
+def test_module_info_cache(Script, tmpdir, monkeypatch):
+    def infer_module():
+        project = Project('.', sys_path=[tmpdir.strpath])
+        return Script('import module1, module2\nmodule1', project=project).infer()
+
+    os.utime(tmpdir.strpath, (0, 0))
+    assert infer_module() == []
+
+    def cache_module_info(key, result):
+        raise AssertionError("The failed lookup should be cached")
+
+    with monkeypatch.context() as m:
+        m.setattr(imports, '_cache_module_info', cache_module_info)
+        assert infer_module() == []
+
+    tmpdir.join('module1.py').write('foo = 1')
+    os.utime(tmpdir.strpath, (1, 1))
+    definition, = infer_module()
+    assert definition.name == 'module1'
+
+
+def test_module_info_cache_is_bounded(tmpdir, monkeypatch):
+    os.utime(tmpdir.strpath, (0, 0))
+    monkeypatch.setattr(imports, '_module_info_cache', {})
+    monkeypatch.setattr(imports, '_MAX_MODULE_INFOS', 2)
+
+    def key(name):
+        return None, (tmpdir.strpath,), None, name, name, True
+
+    for name in ('a', 'b'):
+        imports._cache_module_info(key(name), (None, None))
+    # Using a lookup keeps it in the cache.
+    assert imports._get_cached_module_info(key('a')) == (None, None)
+    imports._cache_module_info(key('c'), (None, None))
+    assert list(imports._module_info_cache) == [key('a'), key('c')]
+    assert imports._get_cached_module_info(key('b')) is None
+
+
+def test_prefetch_module_infos_of_compiled_module(inference_state):
+    math = compiled.load_module(inference_state, dotted_name='math', sys_path=[])
+    module_context = math.as_context()
+    assert module_context.tree_node is None
+    imports._prefetch_module_infos(module_context, ())
+
+
+def test_module_names_cache(inference_state, tmpdir, monkeypatch):
+    tmpdir.join('module1.py').write('')
+    os.utime(tmpdir.strpath, (0, 0))
+    monkeypatch.setattr(imports, '_module_names_cache', {})
+    assert imports.list_module_names(inference_state, [tmpdir.strpath]) == ['module1']
+
+    def get_module_names_per_directory(paths):
+        raise AssertionError("The listing should be cached")
+
+    with monkeypatch.context() as m:
+        m.setattr(imports, '_module_names_cache', {})
+        m.setattr(inference_state.compiled_subprocess, 'get_module_names_per_directory',
+                  get_module_names_per_directory)
+        # Loaded from the persisted listing
+        assert imports.list_module_names(inference_state, [tmpdir.strpath]) == ['module1']
+
+    tmpdir.join('module2.py').write('')
+    os.utime(tmpdir.strpath, (1, 1))
+    names = imports.list_module_names(inference_state, [tmpdir.strpath])
+    assert sorted(names) == ['module1', 'module2']
+
+
 def test_import_completion_docstring(Script):
     import abc
     s = Script('"""test"""\nimport ab')
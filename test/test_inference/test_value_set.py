@@ -0,0 +1,41 @@
+from jedi.inference import base_value
+from jedi.inference.base_value import ValueSet, NO_VALUES
+
+
+def test_empty_value_sets_are_shared():
+    assert ValueSet([]) is NO_VALUES
+    assert ValueSet(x for x in []) is NO_VALUES
+    assert ValueSet.from_sets([]) is NO_VALUES
+    assert ValueSet.from_sets([NO_VALUES, []]) is NO_VALUES
+    assert ValueSet([1]) & ValueSet([2]) is NO_VALUES
+    assert NO_VALUES.filter(lambda x: True) is NO_VALUES
+
+
+def test_unions_reuse_operands():
+    one = ValueSet([1])
+    assert one | NO_VALUES is one
+    assert NO_VALUES | one is one
+    assert one | ValueSet([1]) is one
+    assert ValueSet.from_sets([NO_VALUES, one, ValueSet([1])]) is one
+
+    both = one | ValueSet([2])
+    assert set(both) == {1, 2}
+    assert set(ValueSet.from_sets([one, [2], NO_VALUES, [3]])) == {1, 2, 3}
+    assert one & both is one
+
+
+def test_single_value_sets_are_shared():
+    class Value:
+        pass
+
+    value = Value()
+    one = ValueSet([value])
+    assert ValueSet([value]) is one
+    assert ValueSet(x for x in [value]) is one
+    assert ValueSet.from_sets([[value]]) is one
+    assert (one | ValueSet([Value()])).filter(lambda x: x is value) is one
+    assert ValueSet([Value()]) is not one
+
+    key = id(value)
+    del one
+    assert base_value._single_value_sets.get(key) is None
@@ -1,3 +1,5 @@
+from textwrap import dedent
+
 from jedi import parser_utils
 from parso import parse
 from parso.python import tree
@@ -67,3 +69,69 @@ def test_get_signature(code, signature):
     if node.type == 'simple_stmt':
         node = node.children[0]
     assert parser_utils.get_signature(node) == signature
+
+
+def test_code_outline():
+    statement = dedent('''\
+        if os.name:
+            @property
+            def foo(self,
+                    x):
+                # Comment
+                return x
+
+                return 1
+        ''')
+    code = dedent('''\
+        import os
+        try:
+            from json import (
+                loads,
+            )
+        except ImportError:
+            def loads(string):
+                return string
+        ''') + statement + dedent('''\
+        class Bar:
+            """Doc"""
+            baz = dict(
+                a=1,
+            )
+            call(
+            )
+        ''')
+    outlined_statement = dedent('''\
+        if os.name:
+            @property
+            def foo(self,
+                    x):
+
+                ...
+
+
+        ''')
+    outline = dedent('''\
+        import os
+        try:
+            from json import (
+                loads,
+            )
+        except ImportError:
+            def loads(string):
+                ...
+        ''') + outlined_statement + dedent('''\
+        class Bar:
+            """Doc"""
+            baz = ...
+
+
+            ...
+
+        ''')
+    code_outline = parser_utils.CodeOutline(code)
+    assert code_outline.get_code() == outline
+    # Only the top-level statement of a line is complete.
+    assert code_outline.get_code(keep_line=13) == outline.replace(outlined_statement, statement)
+    assert code_outline.is_outlined(13)
+    assert not code_outline.is_outlined(13, keep_line=9)
+    assert not code_outline.is_outlined(1)
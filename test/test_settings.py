@@ -23,18 +23,37 @@ def test_auto_import_modules_imports(auto_import_json, Script):
     assert isinstance(main._name, CompiledValueName)
 
 
-def test_cropped_file_size(monkeypatch, get_names, Script):
+def test_outline_file_size(monkeypatch, get_names, Script):
     code = 'class Foo(): pass\n'
     monkeypatch.setattr(
         settings,
-        '_cropped_file_size',
+        '_outline_file_size',
         len(code)
     )
 
-    foo, = get_names(code + code)
-    assert foo.line == 1
+    first, second = get_names(code + code)
+    assert (first.line, second.line) == (1, 2)
 
-    # It should just not crash if we are outside of the cropped range.
+    # Code after the limit is outlined, but its names are still known.
     script = Script(code + code + 'Foo')
-    assert not script.infer()
+    assert [d.name for d in script.infer()] == ['Foo']
     assert 'Foo' in [c.name for c in script.complete()]
+
+
+def test_file_outline(monkeypatch, Script):
+    func = 'def func%s(param):\n    x = param\n' + '    y = 1\n' * 50
+    code = ''.join(func % i for i in range(10)) + 'class Bar:\n    z = 3\n'
+    monkeypatch.setattr(settings, '_outline_file_size', len(code) // 3)
+
+    script = Script(code)
+    assert 'func9' in [n.name for n in script.get_names()]
+    assert [d.name for d in script.infer(line=len(code.splitlines()), column=4)] == ['int']
+    # The body of the function with the cursor is parsed again.
+    names = [c.name for c in script.complete(line=3, column=4)]
+    assert 'param' in names and 'x' in names
+    # The module that was created before parsing again is replaced right away.
+    script._set_scope(52 * 5 + 3)
+    assert script._scope_line == 52 * 5 + 3
+    module, = script._inference_state.module_cache.get(('__main__',))
+    assert module is script._get_module()
+    assert [d.name for d in script.goto(line=2, column=9)] == ['param']